@@ -1,42 +1,77 @@
 #!/usr/bin/env python3
-"""SGS - Tek söz ile analiz"""
-import pandas as pd
-import sqlite3
+"""SGS - Tek söz ile analiz
+
+pandas sadece Excel okunurken yüklenir (sqlite sorguları beklemez).
+read_excel verilirse Excel onunla okunur - sgs_daemon sıcak DataFrame'i verir.
+"""
+import sgs_db
 import sys
 
-def analyze():
+def _read_excel(excel_path):
+    import pandas as pd
+    return pd.read_excel(excel_path)
+
+def _top_viewed(df):
+    for col in df.columns:
+        if 'görüntülenme' in col.lower():
+            return df.loc[df[col].idxmax(), 'Ürün Adı']
+    return None
+
+def _most_expensive(conn):
+    return conn.execute("SELECT \"Ürün Adı\", Fiyat FROM tuzla_loglar ORDER BY Fiyat DESC, rowid LIMIT 1").fetchone()
+
+def analyze(excel_path='image-table-cs.xlsx', db_path='sales.db', read_excel=None):
     """Tek komut - Tüm analiz"""
     print("🧠 SGS ANALİZİ")
-    
+
     # Excel analizi
     try:
-        df = pd.read_excel('image-table-cs.xlsx')
+        df = (read_excel or _read_excel)(excel_path)
         print(f"📊 Excel: {len(df)} ürün")
-        
+
         # Hızlı içgörüler
-        for col in df.columns:
-            if 'görüntülenme' in col.lower():
-                top = df.loc[df[col].idxmax(), 'Ürün Adı']
-                print(f"🏆 En popüler: {top}")
-                break
+        top = _top_viewed(df)
+        if top is not None:
+            print(f"🏆 En popüler: {top}")
     except:
         pass
-    
-    # SQL analizi  
+
+    # SQL analizi
     try:
-        conn = sqlite3.connect('sales.db')
-        result = conn.execute("SELECT COUNT(*) FROM tuzla_loglar").fetchone()
-        print(f"💾 Veritabanı: {result[0]} kayıt")
-        
-        # En pahalı ürün
-        result = conn.execute("SELECT \"Ürün Adı\", Fiyat FROM tuzla_loglar ORDER BY Fiyat DESC LIMIT 1").fetchone()
-        print(f"💰 En pahalı: {result[0]} ({result[1]}₺)")
-        
-        conn.close()
+        with sgs_db.connect(db_path) as conn:
+            result = conn.execute("SELECT COUNT(*) FROM tuzla_loglar").fetchone()
+            print(f"💾 Veritabanı: {result[0]} kayıt")
+
+            # En pahalı ürün
+            result = _most_expensive(conn)
+            print(f"💰 En pahalı: {result[0]} ({result[1]}₺)")
     except:
         pass
-    
+
     print("✅ Analiz tamam!")
 
+def quick(excel_path='image-table-cs.xlsx', db_path='sales.db', read_excel=None):
+    """`sgs analyze` - kısa özet"""
+    print("🧠 SGS")
+
+    # Excel
+    try:
+        df = (read_excel or _read_excel)(excel_path)
+        print(f"📊 {len(df)} ürün")
+
+        top = _top_viewed(df)
+        if top is not None:
+            print(f"🏆 {top}")
+    except: pass
+
+    # SQL
+    try:
+        with sgs_db.connect(db_path) as conn:
+            result = _most_expensive(conn)
+            print(f"💰 {result[0]} ({result[1]}₺)")
+    except: pass
+
+    print("✅ Tamam")
+
 if __name__ == "__main__":
     analyze()
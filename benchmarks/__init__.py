@@ -0,0 +1,9 @@
+"""
+SGS Benchmarks - Ölçeklenme ölçümleri
+Gerçek sütun şemasıyla sentetik veri üretir (1k - 10M satır) ve her giriş
+noktasını ayrı süreçte çalıştırıp süre, tepe bellek ve satır/sn kaydeder.
+
+Kullanım:
+python -m benchmarks.generate 100000 /tmp/sgs_bench/100000
+python -m benchmarks.run --sizes 1000,10000,100000 --out bench_results.json
+"""
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sentetik restoran verisi üretici
+image-table-cs.xlsx ve sales.db ile aynı sütun şeması:
+Ürün Adı, Kategori, Fiyat, Güncel Fiyat, iki dönem görüntüleme sütunu,
+Foto Durumu, Büyük Foto Var Yok, Güncel Badge, Sıra, Güncel Sıra
+
+Veritabanı parça parça yazılır, 10M satır bellekte tutulmaz.
+Excel 1.048.575 veri satırıyla sınırlı olduğu için daha büyük boyutlarda
+workbook üretilmez.
+
+Kullanım:
+python -m benchmarks.generate 100000 /tmp/sgs_bench/100000 [--branches tuzla,kosuyolu,moda] [--no-excel]
+"""
+
+import os
+import sys
+import json
+import sqlite3
+import numpy as np
+import pandas as pd
+
+VIEW_COL = 'GÜNCEL DÖNEM GÖRÜNTÜLEME (02.09-08.09)'
+PREV_COL = 'BİR ÖNCEKİ DÖNEM GÖRÜNTÜLEME (26.08 - 01.09)'
+
+CATEGORIES = ['Pizza', 'Burger', 'Döner', 'Kebap', 'Salata', 'Makarna', 'Kahvaltı',
+              'Tatlı', 'Soğuk İçecek', 'Sıcak İçecek', 'Çorba', 'Ara Sıcak']
+CATEGORY_WEIGHTS = np.array([14, 12, 11, 9, 8, 8, 7, 9, 8, 5, 4, 5], dtype=float) / 100
+BASE_PRICES = [320, 260, 210, 380, 190, 240, 280, 150, 60, 45, 110, 130]
+BADGES = ['Yeni', 'Popüler', 'İndirim', 'Şefin Önerisi']
+
+DEFAULT_BRANCHES = ('tuzla', 'kosuyolu')
+EXCEL_MAX_ROWS = 1_048_575
+CHUNK_ROWS = 500_000
+
+
+def product_frame(n, seed=0, offset=0):
+    """Gerçek şemada n satırlık ürün tablosu"""
+    rng = np.random.default_rng(seed)
+
+    cat_idx = rng.choice(len(CATEGORIES), size=n, p=CATEGORY_WEIGHTS)
+    categories = np.array(CATEGORIES, dtype=object)[cat_idx]
+    base = np.array(BASE_PRICES, dtype=float)[cat_idx]
+
+    # Fiyatlar kategori bazında lognormal, 5₺'ye yuvarlı; uzun kuyruk >1000₺
+    price = np.round(base * rng.lognormal(0.0, 0.45, n) / 5) * 5 + 5
+    price_change = rng.choice([0, 0, 0, 0, 10, 20, -10, 50], size=n)
+
+    prev_views = np.floor(rng.lognormal(5.0, 1.2, n)).astype('int64')
+    trend = rng.normal(1.0, 0.35, n).clip(0.05)
+    views = np.floor(prev_views * trend).astype('int64')
+
+    rank = rng.integers(1, 60, n)
+    rank_moved = rng.random(n) < 0.3
+
+    badges = np.array(BADGES, dtype=object)[rng.integers(0, len(BADGES), n)]
+    badges[rng.random(n) < 0.8] = None
+
+    return pd.DataFrame({
+        'Ürün Adı': [f"{cat} {i}" for cat, i in zip(categories, range(offset, offset + n))],
+        'Kategori': categories,
+        'Fiyat': price,
+        'Güncel Fiyat': price + price_change,
+        PREV_COL: prev_views,
+        VIEW_COL: views,
+        'Foto Durumu': np.where(rng.random(n) < 0.82, 'Evet', 'Hayır'),
+        'Büyük Foto Var Yok': np.where(rng.random(n) < 0.6, 'Evet', 'Hayır'),
+        'Güncel Badge': badges,
+        'Sıra': rank,
+        'Güncel Sıra': np.where(rank_moved, rank + rng.integers(-5, 6, n), rank).clip(1)
+    })
+
+
+def _iter_chunks(rows, seed):
+    """(başlangıç, DataFrame) parçaları"""
+    for start in range(0, rows, CHUNK_ROWS):
+        n = min(CHUNK_ROWS, rows - start)
+        yield start, product_frame(n, seed=seed * 1_000_003 + start, offset=start)
+
+
+def write_database(db_path, rows, branches=DEFAULT_BRANCHES, seed=0):
+    """sales.db: şube başına <şube>_loglar ve hesaplamalar_tuzla"""
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        summary = None
+        for b, branch in enumerate(branches):
+            for start, chunk in _iter_chunks(rows, seed + b + 1):
+                chunk.to_sql(f"{branch}_loglar", conn, if_exists='append', index=False, chunksize=50_000)
+                if b == 0:
+                    part = chunk.groupby('Kategori').agg(
+                        urun=('Ürün Adı', 'count'), fiyat=('Fiyat', 'sum'), goruntulenme=(VIEW_COL, 'sum'))
+                    summary = part if summary is None else summary.add(part, fill_value=0)
+
+        hesaplamalar = pd.DataFrame({
+            'Kategori': summary.index,
+            'Ürün Sayısı': summary['urun'].astype('int64').values,
+            'Ortalama Fiyat': (summary['fiyat'] / summary['urun']).round(2).values,
+            'Toplam Görüntülenme': summary['goruntulenme'].astype('int64').values
+        })
+        hesaplamalar.to_sql('hesaplamalar_tuzla', conn, index=False)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def write_workbook(xlsx_path, rows, seed=0):
+    """image-table-cs.xlsx: tek sheet, ana şubenin ürünleri"""
+    if rows > EXCEL_MAX_ROWS:
+        return False
+    product_frame(rows, seed=seed * 1_000_003 + 1).to_excel(xlsx_path, sheet_name='Menü', index=False)
+    return True
+
+
+def generate(rows, out_dir, branches=DEFAULT_BRANCHES, seed=0, excel=True):
+    """Veri setini üret - aynı parametrelerle üretilmişse tekrar yazma"""
+    os.makedirs(out_dir, exist_ok=True)
+    meta_path = os.path.join(out_dir, 'meta.json')
+    params = {'rows': rows, 'branches': list(branches), 'seed': seed, 'excel': bool(excel)}
+
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta['params'] == params:
+            return meta
+    except (OSError, ValueError, KeyError):
+        pass
+
+    write_database(os.path.join(out_dir, 'sales.db'), rows, branches, seed)
+
+    xlsx_path = os.path.join(out_dir, 'image-table-cs.xlsx')
+    has_excel = bool(excel) and write_workbook(xlsx_path, rows, seed)
+    if not has_excel and os.path.exists(xlsx_path):
+        os.remove(xlsx_path)
+
+    meta = {
+        'params': params,
+        'db_path': os.path.join(out_dir, 'sales.db'),
+        'excel_path': xlsx_path if has_excel else None
+    }
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    return meta
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Kullanım:")
+        print("  python -m benchmarks.generate SATIR KLASÖR [--branches tuzla,kosuyolu] [--seed N] [--no-excel]")
+        sys.exit(1)
+
+    rows = int(sys.argv[1].replace('_', ''))
+    branches = DEFAULT_BRANCHES
+    seed = 0
+    if '--branches' in sys.argv:
+        branches = tuple(sys.argv[sys.argv.index('--branches') + 1].split(','))
+    if '--seed' in sys.argv:
+        seed = int(sys.argv[sys.argv.index('--seed') + 1])
+
+    meta = generate(rows, sys.argv[2], branches, seed, excel='--no-excel' not in sys.argv)
+    print(f"✅ {rows} satır × {len(branches)} şube → {meta['db_path']}")
+    if meta['excel_path']:
+        print(f"✅ Excel → {meta['excel_path']}")
+    else:
+        print("⚠️ Excel üretilmedi")
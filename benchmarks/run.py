@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS benchmark koşucusu
+Her (boyut, giriş noktası) çifti ayrı bir Python sürecinde çalışır; böylece
+tepe bellek ve içe aktarma maliyeti ölçümler arasında karışmaz.
+
+Kaydedilenler: toplam süre, tepe RSS (süreç + alt süreçler), satır/sn ve
+giriş noktasının aşamaları (ör. AdvancedSGS._trend_analysis) için süre ve
+o ana kadarki tepe RSS.
+
+Kullanım:
+python -m benchmarks.run [--sizes 1000,10000,100000] [--entries sgs_power,advanced]
+                         [--repeat N] [--cache cold|warm] [--data-dir KLASÖR] [--out sonuc.json]
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import tempfile
+import contextlib
+import subprocess
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), 'sgs_bench')
+
+BI_QUESTIONS = [
+    "En karlı kategoriler neler?",
+    "En çok görüntülenen ürünler?",
+    "Fotoğrafı olmayan ürünler kaç tane?",
+    "Fiyatı 200'den yüksek ürünler hangileri?",
+    "Genel durum nedir?"
+]
+SQL_QUERY = 'SELECT "Kategori", COUNT(*) AS adet, AVG("Fiyat") AS ort_fiyat FROM data GROUP BY 1 ORDER BY adet DESC'
+
+
+def peak_rss_mb(who='self'):
+    """Tepe RSS (MB)
+
+    Linux'ta ru_maxrss fork sırasında üst süreçten devralınır; bu yüzden
+    süreç kendi değeri için /proc'taki VmHWM'i kullanır.
+    """
+    if who == 'self':
+        try:
+            with open('/proc/self/status', encoding='ascii') as f:
+                for line in f:
+                    if line.startswith('VmHWM:'):
+                        return round(int(line.split()[1]) / 1024, 1)
+        except OSError:
+            pass
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who == 'self' else resource.RUSAGE_CHILDREN)
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(usage.ru_maxrss / scale, 1)
+
+
+class StageTimer:
+    """Fonksiyon/metotları sarmalayıp aşama sürelerini kaydet"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.stages = []
+
+    def wrap(self, owner, attr, label=None):
+        fn = getattr(owner, attr)
+        label = label or attr
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                self.stages.append({
+                    'stage': label,
+                    'start_s': round(start - self.origin, 4),
+                    'wall_s': round(end - start, 4),
+                    'peak_rss_mb': peak_rss_mb()
+                })
+
+        setattr(owner, attr, timed)
+
+
+# Giriş noktaları: (veri türü, hazırlık fonksiyonu) - hazırlık aşamaları sarmalar
+# ve ölçülecek çağrıyı döndürür
+
+def _entry_sgs_power(meta, timer, pushdown=False):
+    import sgs_power
+    timer.wrap(sgs_power, '_sql_insights' if pushdown else '_pandas_insights', 'insights')
+    timer.wrap(sgs_power, '_branch_comparison', 'branch_comparison')
+    return lambda: sgs_power.analyze(pushdown=pushdown, db_path=meta['db_path'])
+
+
+def _entry_advanced(meta, timer):
+    import sgs_advanced
+    cls = sgs_advanced.AdvancedSGS
+    for stage in ('_load_data_sources', '_intelligent_analysis', '_trend_analysis', '_market_analysis',
+                  '_calculate_performance_score', '_generate_smart_recommendations', '_generate_advanced_report'):
+        timer.wrap(cls, stage, stage.lstrip('_'))
+    return lambda: cls().full_analysis(excel_path=meta['excel_path'] or 'yok.xlsx', db_path=meta['db_path'])
+
+
+def _entry_smart(meta, timer):
+    import sgs_smart
+    cls = sgs_smart.SmartSGS
+    for stage in ('_load_data', '_detect_data_type', '_map_columns', '_execute_smart_analysis', '_generate_smart_report'):
+        timer.wrap(cls, stage, stage.lstrip('_'))
+    return lambda: cls().analyze(meta['excel_path'], 'sgs_smart_bench')
+
+
+def _entry_simplebi(meta, timer):
+    import simplebi
+    timer.wrap(simplebi.SimpleBI, 'load')
+    timer.wrap(simplebi.SimpleBI, 'ask')
+
+    def run():
+        data = simplebi.SimpleBI(meta['excel_path'])
+        for question in BI_QUESTIONS:
+            data.ask(question)
+    return run
+
+
+def _entry_sql(meta, timer):
+    import sgs_sql
+    import sgs_loader
+    # sgs_sql sgs_loader'ı fonksiyon içinde yükler: modülün kendisi sarılır
+    timer.wrap(sgs_loader, 'read_excel')
+    return lambda: sgs_sql.sql_query(meta['excel_path'], SQL_QUERY)
+
+
+ENTRIES = {
+    'sgs_power': ('db', _entry_sgs_power),
+    'sgs_power_pushdown': ('db', lambda meta, timer: _entry_sgs_power(meta, timer, pushdown=True)),
+    'advanced': ('db', _entry_advanced),
+    'smart': ('excel', _entry_smart),
+    'simplebi': ('excel', _entry_simplebi),
+    'sgs_sql': ('excel', _entry_sql)
+}
+
+
+def _worker(entry, meta_path, result_path):
+    """Alt süreç: tek giriş noktasını çalıştır, sonucu JSON'a yaz"""
+    sys.path.insert(0, REPO_ROOT)
+    with open(meta_path, encoding='utf-8') as f:
+        meta = json.load(f)
+
+    timer = StageTimer()
+    result = {'status': 'ok'}
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        # İçe aktarma ölçüme dahil: CLI'da da her çalıştırmada ödeniyor
+        start = time.perf_counter()
+        try:
+            call = ENTRIES[entry][1](meta, timer)
+            timer.stages.append({'stage': 'import', 'start_s': 0.0,
+                                 'wall_s': round(time.perf_counter() - start, 4), 'peak_rss_mb': peak_rss_mb()})
+            call()
+        except Exception as e:
+            result = {'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+        wall = time.perf_counter() - start
+
+    result.update({
+        'wall_s': round(wall, 4),
+        'peak_rss_mb': peak_rss_mb(),
+        'peak_rss_children_mb': peak_rss_mb('children'),
+        'stages': timer.stages
+    })
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False)
+
+
+def run_entry(entry, meta, cache_dir, cold=True):
+    """Giriş noktasını yeni bir süreçte çalıştır"""
+    if cold:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    work_dir = os.path.dirname(meta['db_path'])
+    env = dict(os.environ, SGS_CACHE_DIR=cache_dir,
+               PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get('PYTHONPATH')])))
+    result_path = os.path.join(work_dir, f".bench_{entry}.json")
+
+    proc = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.run', '--worker', entry,
+         os.path.join(work_dir, 'meta.json'), result_path],
+        cwd=work_dir, env=env, capture_output=True, text=True
+    )
+    try:
+        with open(result_path, encoding='utf-8') as f:
+            result = json.load(f)
+        os.remove(result_path)
+    except (OSError, ValueError):
+        result = {'status': 'error', 'error': (proc.stderr or '').strip()[-2000:]}
+    return result
+
+
+def run(sizes=DEFAULT_SIZES, entries=None, repeat=1, cache='cold', data_dir=DEFAULT_DATA_DIR, branches=None):
+    """Tüm boyutlar × giriş noktaları için ölçüm yap"""
+    # Üretici pandas'ı yükler; alt süreçlerin içe aktarma ölçümü etkilenmesin diye burada
+    from benchmarks import generate as gen
+
+    branches = branches or gen.DEFAULT_BRANCHES
+    entries = list(entries or ENTRIES)
+    results = []
+
+    for rows in sizes:
+        out_dir = os.path.join(data_dir, str(rows))
+        print(f"📦 {rows} satır veri hazırlanıyor...")
+        start = time.perf_counter()
+        meta = gen.generate(rows, out_dir, branches)
+        print(f"   ✅ {time.perf_counter() - start:.1f} sn")
+        cache_dir = os.path.join(out_dir, 'cache')
+
+        for entry in entries:
+            kind = ENTRIES[entry][0]
+            if kind == 'excel' and not meta['excel_path']:
+                results.append({'entry': entry, 'rows': rows, 'status': 'skipped',
+                                'reason': f"Excel en fazla {gen.EXCEL_MAX_ROWS} satır"})
+                print(f"   ⏭️ {entry}: Excel sınırı, atlandı")
+                continue
+
+            if cache == 'warm':
+                # Ölçülmeyen ilk çalıştırma Parquet önbelleğini doldurur
+                run_entry(entry, meta, cache_dir, cold=True)
+
+            for attempt in range(repeat):
+                result = run_entry(entry, meta, cache_dir, cold=(cache == 'cold'))
+                result.update({'entry': entry, 'rows': rows, 'run': attempt + 1, 'cache': cache})
+                if result['status'] == 'ok' and result['wall_s'] > 0:
+                    result['rows_per_s'] = round(rows / result['wall_s'], 1)
+                results.append(result)
+
+                if result['status'] == 'ok':
+                    print(f"   ⏱️ {entry:<20} {result['wall_s']:>9.3f} sn  {result['peak_rss_mb'] or 0:>8.1f} MB  "
+                          f"{result.get('rows_per_s', 0):>12.0f} satır/sn")
+                else:
+                    print(f"   ❌ {entry}: {result.get('error', '')[-200:]}")
+
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'branches': list(branches),
+        'results': results
+    }
+
+
+def _parse_args(args):
+    """sys.argv ayrıştır"""
+    options = {'sizes': DEFAULT_SIZES, 'entries': None, 'repeat': 1, 'cache': 'cold',
+               'data_dir': DEFAULT_DATA_DIR, 'branches': None, 'out': 'bench_results.json'}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        value = args[i + 1] if i + 1 < len(args) else None
+        if arg == '--sizes' and value:
+            options['sizes'] = [int(s.replace('_', '')) for s in value.split(',')]
+        elif arg == '--entries' and value:
+            options['entries'] = value.split(',')
+        elif arg == '--repeat' and value:
+            options['repeat'] = int(value)
+        elif arg == '--cache' and value:
+            options['cache'] = value
+        elif arg == '--data-dir' and value:
+            options['data_dir'] = value
+        elif arg == '--branches' and value:
+            options['branches'] = tuple(value.split(','))
+        elif arg == '--out' and value:
+            options['out'] = value
+        else:
+            print(f"⚠️ Bilinmeyen argüman: {arg}")
+            i += 1
+            continue
+        i += 2
+    return options
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--worker':
+        _worker(*sys.argv[2:5])
+        sys.exit(0)
+
+    options = _parse_args(sys.argv[1:])
+    unknown = [e for e in options['entries'] or [] if e not in ENTRIES]
+    if unknown:
+        print(f"❌ Bilinmeyen giriş noktası: {', '.join(unknown)} (seçenekler: {', '.join(ENTRIES)})")
+        sys.exit(1)
+
+    out = options.pop('out')
+    report = run(**options)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 Sonuçlar: {out}")
@@ -7,23 +7,35 @@ Kullanım:
 import sgs
 sgs.read_csv("data.csv")     # Tek satır - tüm analiz!
 sgs.read_excel("data.xlsx")  # Excel için
+sgs.read_csv("pos.csv", chunksize=200_000)  # Bellekten büyük dosyalar
 """
 
-import pandas as pd
 import numpy as np
 from datetime import datetime
+import sgs_loader
+import sgs_stream
+import sgs_columns
+import sgs_topk
 
 class SGS:
     def __init__(self):
         self.data = None
+        self.stats = None
         self.insights = []
     
-    def read_csv(self, file_path):
-        """CSV oku ve otomatik analiz et"""
+    def read_csv(self, file_path, chunksize=None):
+        """CSV oku ve otomatik analiz et
+
+        chunksize verilirse dosya parça parça okunur, bellekte sadece
+        toplamlar tutulur (self.data yerine self.stats)
+        """
         print("🧠 SGS - Akıllı Analiz")
         
+        if chunksize:
+            return self._read_csv_chunked(file_path, chunksize)
+        
         # Veriyi yükle
-        self.data = pd.read_csv(file_path)
+        self.data = sgs_loader.read_csv(file_path)
         print(f"📊 {len(self.data)} satır, {len(self.data.columns)} sütun")
         
         # Otomatik analiz
@@ -34,12 +46,36 @@ class SGS:
         
         return self.data
     
+    def _read_csv_chunked(self, file_path, chunksize):
+        """Parça parça okuma: _auto_analyze'ın ihtiyaç duyduğu toplamlar"""
+        columns = list(sgs_stream.read_sample(file_path, nrows=1).columns)
+        roles = sgs_columns.detect(columns)
+        name_col = roles.first('name')
+        cat_col = roles.first('category')
+        
+        metric_cols = [col for col in columns if col in roles.flagged('views') or col in roles.of('price')]
+        photo_cols = roles.flagged('photo', 'state')
+        
+        self.data = None
+        self.stats = sgs_stream.ChunkedStats(
+            numeric_cols=metric_cols,
+            count_cols=([cat_col] if cat_col else []) + photo_cols,
+            id_col=name_col
+        )
+        sgs_stream.scan_csv(file_path, self.stats, chunksize=chunksize)
+        print(f"📊 {self.stats.rows} satır, {len(columns)} sütun ({self.stats.chunks} parça)")
+        
+        self._auto_analyze_stream(roles, name_col, cat_col, photo_cols)
+        self._show_results()
+        
+        return self.stats
+    
     def read_excel(self, file_path):
         """Excel oku ve otomatik analiz et"""
         print("🧠 SGS - Akıllı Analiz")
         
         # Veriyi yükle
-        self.data = pd.read_excel(file_path)
+        self.data = sgs_loader.read_excel(file_path)
         print(f"📊 {len(self.data)} satır, {len(self.data.columns)} sütun")
         
         # Otomatik analiz
@@ -56,13 +92,14 @@ class SGS:
             return
         
         # Sütun türlerini tanı
+        roles = sgs_columns.detect(self.data)
+        view_cols = roles.flagged('views', previous=False)
+        price_cols = roles.of('price')
         for col in self.data.columns:
-            col_lower = col.lower()
-            
-            # En popüler ürün/öğe
-            if any(word in col_lower for word in ['görüntülenme', 'view', 'click']):
-                if not self.data[col].isna().all():
-                    max_idx = self.data[col].idxmax()
+            # En popüler ürün/öğe (geçmiş dönem görüntülenmeleri hariç)
+            if col in view_cols:
+                max_idx = sgs_topk.argmax(self.data[col])
+                if max_idx is not None:
                     name_col = self._find_name_column()
                     if name_col:
                         product = self.data.loc[max_idx, name_col]
@@ -70,9 +107,9 @@ class SGS:
                         self.insights.append(f"🏆 En popüler: {product} ({value:,.0f})")
             
             # En pahalı
-            if any(word in col_lower for word in ['fiyat', 'price', 'tutar']):
-                if not self.data[col].isna().all():
-                    max_idx = self.data[col].idxmax()
+            if col in price_cols:
+                max_idx = sgs_topk.argmax(self.data[col])
+                if max_idx is not None:
                     name_col = self._find_name_column()
                     if name_col:
                         product = self.data.loc[max_idx, name_col]
@@ -87,25 +124,47 @@ class SGS:
             self.insights.append(f"📦 En büyük kategori: {top_category} ({count} ürün)")
         
         # Eksik veriler
-        for col in self.data.columns:
-            if 'foto' in col.lower() and 'durum' in col.lower():
-                missing = (self.data[col] == 'Hayır').sum()
-                if missing > 0:
-                    self.insights.append(f"📷 {missing} ürünün fotoğrafı eksik")
+        for col in roles.flagged('photo', 'state'):
+            missing = (self.data[col] == 'Hayır').sum()
+            if missing > 0:
+                self.insights.append(f"📷 {missing} ürünün fotoğrafı eksik")
     
-    def _find_name_column(self):
+    def _auto_analyze_stream(self, roles, name_col, cat_col, photo_cols):
+        """_auto_analyze karşılığı - toplamlardan"""
+        view_cols = roles.flagged('views', previous=False)
+        price_cols = roles.of('price')
+        for col in roles.columns:
+            # En popüler ürün/öğe (geçmiş dönem görüntülenmeleri hariç)
+            if col in view_cols:
+                if col in self.stats.max and name_col:
+                    value, product = self.stats.max[col]
+                    self.insights.append(f"🏆 En popüler: {product} ({value:,.0f})")
+            
+            # En pahalı
+            if col in price_cols:
+                if col in self.stats.max and name_col:
+                    value, product = self.stats.max[col]
+                    self.insights.append(f"💰 En pahalı: {product} ({value:,.0f}₺)")
+        
+        # Kategori analizi
+        if cat_col:
+            counts = self.stats.value_counts(cat_col)
+            if len(counts) > 0:
+                self.insights.append(f"📦 En büyük kategori: {counts.index[0]} ({counts.iloc[0]} ürün)")
+        
+        # Eksik veriler
+        for col in photo_cols:
+            missing = self.stats.counts[col].get('Hayır', 0)
+            if missing > 0:
+                self.insights.append(f"📷 {missing} ürünün fotoğrafı eksik")
+    
+    def _find_name_column(self, columns=None):
         """İsim sütununu bul"""
-        for col in self.data.columns:
-            if any(word in col.lower() for word in ['ürün', 'product', 'name', 'ad', 'isim']):
-                return col
-        return None
+        return sgs_columns.detect(self.data if columns is None else columns).first('name')
     
-    def _find_category_column(self):
+    def _find_category_column(self, columns=None):
         """Kategori sütununu bul"""
-        for col in self.data.columns:
-            if any(word in col.lower() for word in ['kategori', 'category', 'grup']):
-                return col
-        return None
+        return sgs_columns.detect(self.data if columns is None else columns).first('category')
     
     def _show_results(self):
         """Sonuçları göster"""
@@ -147,9 +206,9 @@ class SGS:
 # Global fonksiyon - daha da basit kullanım
 _sgs_instance = SGS()
 
-def read_csv(file_path):
+def read_csv(file_path, chunksize=None):
     """Ultra basit CSV okuma"""
-    return _sgs_instance.read_csv(file_path)
+    return _sgs_instance.read_csv(file_path, chunksize)
 
 def read_excel(file_path):
     """Ultra basit Excel okuma"""
@@ -11,195 +11,435 @@ Gelişmiş Yapay Zeka Destekli Restoran Analizi
 - Rekabet analizi
 - Personalize öneriler
 - Interactive dashboard
+- Artımlı analiz (sadece yeni log satırları)
 
 Kullanım:
 import sgs_advanced as sgs
 sgs.full_analysis()
+sgs.analyze(incremental=True)   # önceki çalıştırmanın toplamlarından devam
+
+Veri kaynakları tembel yüklenir: bir aşama ilk kez istediğinde (ve sadece
+istediği sütunlarla) okunur; hiçbir aşamanın kullanmadığı kaynak okunmaz.
+profile = sgs.AdvancedSGS().full_analysis(profile=True)
+profile.to_chrome_trace('trace.json')
 """
 
-import pandas as pd
 import numpy as np
-import sqlite3
 from datetime import datetime, timedelta
 import re
+import contextlib
 import warnings
+import sgs_loader
+import sgs_mirror
+import sgs_branches
+import sgs_db
+import sgs_incremental
+import sgs_profile
+import sgs_report
 warnings.filterwarnings('ignore')
 
+ADVANCED_REPORT_HEAD = sgs_report.template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>SGS Advanced Analiz Raporu</title>
+    <meta charset="UTF-8">
+    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif; margin: 0; background: #f8f9fa; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; min-height: 100vh; }
+        .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 40px; text-align: center; }
+        .score-circle { display: inline-block; width: 120px; height: 120px; border-radius: 50%; border: 8px solid rgba(255,255,255,0.3); margin: 20px; position: relative; }
+        .score-text { position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); font-size: 24px; font-weight: bold; }
+        .content { padding: 30px; }
+        .section { margin: 30px 0; }
+        .section h2 { color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px; }
+        .insight-card, .recommendation-card, .trend-card { background: #f8f9fa; margin: 15px 0; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .rec-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px; }
+        .priority-badge { padding: 4px 12px; border-radius: 20px; color: white; font-size: 12px; font-weight: bold; }
+        .metrics-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 20px 0; }
+        .metric-card { background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white; padding: 20px; border-radius: 12px; text-align: center; }
+        .data-table { width: 100%; border-collapse: collapse; margin: 15px 0; }
+        .data-table th, .data-table td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        .data-table th { background: #3498db; color: white; }
+        .footer { background: #2c3e50; color: white; padding: 30px; text-align: center; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🚀 SGS Advanced - Yapay Zeka Analizi</h1>
+            <p>Smart Growth Solutions</p>
+            <div class="score-circle">
+                <div class="score-text">$score</div>
+            </div>
+            <p>Genel Performans Skoru</p>
+        </div>
+        
+        <div class="content">
+            <div class="metrics-grid">
+                <div class="metric-card">
+                    <h3>📊 Toplam İçgörü</h3>
+                    <h2>$insights</h2>
+                </div>
+                <div class="metric-card">
+                    <h3>💡 Aksiyon Önerisi</h3>
+                    <h2>$recommendations</h2>
+                </div>
+                <div class="metric-card">
+                    <h3>📈 Trend Analizi</h3>
+                    <h2>$trends</h2>
+                </div>
+                <div class="metric-card">
+                    <h3>⚠️ Kritik Uyarı</h3>
+                    <h2>$alerts</h2>
+                </div>
+            </div>
+            
+            <div class="section">
+                <h2>🧠 Yapay Zeka İçgörüleri</h2>
+""")
+
+SECTION_BREAK = sgs_report.template("""
+            </div>
+            
+            <div class="section">
+                <h2>$title</h2>
+""")
+
+INSIGHT_CARD_OPEN = sgs_report.template("""
+                <div class="insight-card" style="border-left: 4px solid $color;">
+                    <h4>$title</h4>
+                    <div class="insight-data">""")
+
+ALERT_CARD_OPEN = sgs_report.template("""
+                <div class="insight-card" style="border-left: 4px solid #dc3545;">
+                    <h4>$title</h4>
+                    <div class="insight-data">""")
+
+TREND_CARD_OPEN = sgs_report.template("""
+                <div class="trend-card">
+                    <h4>$title</h4>
+                    <div class="trend-data">""")
+
+CARD_CLOSE = sgs_report.template("""</div>
+                </div>
+""")
+
+TREND_ROW = sgs_report.template("<tr><td>$name</td><td style='color: $color;'>$change%</td></tr>")
+
+RECOMMENDATION_CARD = sgs_report.template("""
+                <div class="recommendation-card" style="border-left: 4px solid $color;">
+                    <div class="rec-header">
+                        <h4>$title</h4>
+                        <span class="priority-badge" style="background: $color;">$priority</span>
+                    </div>
+                    <p><strong>Açıklama:</strong> $description</p>
+                    <p><strong>Beklenen Etki:</strong> $impact</p>
+                    <p><strong>Efor Seviyesi:</strong> $effort</p>
+                </div>
+""")
+
+ADVANCED_REPORT_FOOTER = sgs_report.template("""
+            </div>
+        </div>
+        
+        <div class="footer">
+            <p>📅 Rapor Tarihi: $report_date</p>
+            <p><strong>SGS Advanced - Powered by AI</strong></p>
+            <p>🧠 Yapay zeka destekli restoran optimizasyonu</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+def _read_excel(excel_path, columns=None):
+    # Sütun seçimi okumadan sonra: önbellek anahtarı tüm tablo için tek kalır
+    df = sgs_loader.read_excel(excel_path)
+    return df if columns is None else df[[col for col in df.columns if col in columns]]
+
+
+class LazySource:
+    """İlk kullanımda yüklenen veri kaynağı
+
+    loader(columns) DataFrame döndürür; columns=None tüm sütunlar demektir.
+    Sonuç sütun kümesi başına saklanır; tam yükleme ya da kapsayan bir alt küme
+    sonraki isteklere yeter.
+    Yüklenemeyen kaynak bir kez uyarı yazar ve None döner.
+    """
+
+    def __init__(self, label, loader):
+        self.label = label
+        self.loader = loader
+        self.failed = False
+        self._frames = {}
+
+    @property
+    def loaded(self):
+        return bool(self._frames)
+
+    def get(self, columns=None):
+        key = None if columns is None else tuple(columns)
+        if key in self._frames:
+            return self._frames[key]
+        if key is not None:
+            # Tam yükleme ya da istenen sütunları kapsayan önceki alt küme yeterli
+            for loaded, df in self._frames.items():
+                if loaded is None or set(key) <= set(loaded):
+                    return df[[col for col in df.columns if col in key]]
+        if self.failed:
+            return None
+
+        with sgs_profile.span(f"load {self.label}", 'io') as s:
+            try:
+                df = self.loader(columns)
+            except Exception:
+                self.failed = True
+                print(f"   ⚠️ {self.label} yüklenemedi")
+                return None
+            s.rows = len(df)
+        print(f"   ✅ {self.label}: {len(df)} kayıt" + (f" ({len(df.columns)} sütun)" if key is not None else ""))
+        self._frames[key] = df
+        return df
+
+
 class AdvancedSGS:
     def __init__(self):
-        self.excel_data = None
-        self.sql_data = None
+        self.sources = {}
+        self.db_path = None
+        self.incremental = False
+        self.state_path = None
+        self.new_rows = None
+        self.table_stats = {}
+        self.profile = None
         self.insights = []
         self.recommendations = []
         self.trends = []
         self.alerts = []
         self.performance_score = 0
         
-    def full_analysis(self, excel_path="image-table-cs.xlsx", db_path="sales.db"):
-        """Tam kapsamlı SGS analizi"""
+    def full_analysis(self, excel_path="image-table-cs.xlsx", db_path="sales.db", incremental=False, state_path=None,
+                      profile=False):
+        """Tam kapsamlı SGS analizi
+
+        incremental=True: log tablosunun sadece son çalıştırmadan sonra eklenen
+        satırları okunur, toplamlar state_path'teki JSON durumuyla birleştirilir.
+        profile=True: aşama, SQL sorgusu ve Excel okuması başına süre, CPU,
+        bellek ve satır sayısı ölçülür; sgs_profile.Profile döndürülür.
+        """
         print("🚀 SGS ADVANCED - YAPAY ZEKA ANALİZİ")
         print("=" * 60)
         print("📊 Veri kaynakları taranıyor...")
         
-        # 1. Veri yükleme ve ön işleme
-        self._load_data_sources(excel_path, db_path)
-        
-        # 2. Akıllı veri analizi
-        self._intelligent_analysis()
-        
-        # 3. Trend analizi ve tahminleme
-        self._trend_analysis()
-        
-        # 4. Rekabet ve pazar analizi
-        self._market_analysis()
-        
-        # 5. Performans skoru hesaplama
-        self._calculate_performance_score()
-        
-        # 6. Personalize öneriler
-        self._generate_smart_recommendations()
-        
-        # 7. Gelişmiş rapor
-        self._generate_advanced_report()
+        self.profile = sgs_profile.Profile('AdvancedSGS.full_analysis') if profile else None
+        with self.profile or contextlib.nullcontext():
+            # 1. Veri yükleme ve ön işleme
+            with sgs_profile.span('load_data_sources'):
+                self._load_data_sources(excel_path, db_path, incremental, state_path)
+            
+            # 2. Akıllı veri analizi
+            with sgs_profile.span('intelligent_analysis'):
+                self._intelligent_analysis()
+            
+            # 3. Trend analizi ve tahminleme
+            with sgs_profile.span('trend_analysis'):
+                self._trend_analysis()
+            
+            # 4. Rekabet ve pazar analizi
+            with sgs_profile.span('market_analysis'):
+                self._market_analysis()
+            
+            # 5. Performans skoru hesaplama
+            with sgs_profile.span('calculate_performance_score'):
+                self._calculate_performance_score()
+            
+            # 6. Personalize öneriler
+            with sgs_profile.span('generate_smart_recommendations'):
+                self._generate_smart_recommendations()
+            
+            # 7. Gelişmiş rapor
+            with sgs_profile.span('generate_advanced_report'):
+                self._generate_advanced_report()
         
         print(f"\n🎯 SGS ADVANCED ANALİZ TAMAMLANDI!")
         print(f"📈 Performans Skoru: {self.performance_score}/100")
         print(f"💡 {len(self.insights)} içgörü, {len(self.recommendations)} öneri bulundu")
         
-    def _load_data_sources(self, excel_path, db_path):
-        """Çoklu veri kaynağı yükleme"""
-        print("📂 Veri kaynakları yükleniyor...")
+        if self.profile:
+            self.profile.print_summary()
+        return self.profile
+    
         
-        # Excel verisi
-        try:
-            self.excel_data = pd.read_excel(excel_path)
-            print(f"   ✅ Excel: {len(self.excel_data)} ürün")
-        except:
-            print("   ⚠️ Excel dosyası yüklenemedi")
-            
-        # SQLite verisi
-        try:
-            conn = sqlite3.connect(db_path)
-            self.sql_data = {
-                'tuzla': pd.read_sql("SELECT * FROM tuzla_loglar", conn),
-                'kosuyolu': pd.read_sql("SELECT * FROM kosuyolu_loglar", conn),
-                'hesaplamalar': pd.read_sql("SELECT * FROM hesaplamalar_tuzla", conn)
-            }
-            conn.close()
-            total_records = sum(len(df) for df in self.sql_data.values())
-            print(f"   ✅ Veritabanı: {total_records} kayıt")
-        except:
-            print("   ⚠️ Veritabanı yüklenemedi")
+    def _load_data_sources(self, excel_path, db_path, incremental=False, state_path=None):
+        """Çoklu veri kaynağı tanımlama - okuma aşamalar isteyince yapılır"""
+        print("📂 Veri kaynakları tanımlanıyor...")
+        
+        # SQLite verisi - diğer şubeler _market_analysis'te paralel özetlenir
+        self.db_path = db_path
+        self.incremental = incremental
+        self.state_path = state_path or f"{db_path}.sgs_state.json"
+        self.sources = {
+            'excel': LazySource('Excel', lambda columns: _read_excel(excel_path, columns)),
+            'tuzla': LazySource('Veritabanı tuzla_loglar',
+                                lambda columns: sgs_mirror.read_table(db_path, 'tuzla_loglar', columns=columns)),
+            'hesaplamalar': LazySource('Veritabanı hesaplamalar_tuzla',
+                                       lambda columns: sgs_mirror.read_table(db_path, 'hesaplamalar_tuzla', columns=columns)),
+        }
+    
+    def _table_stats(self, name):
+        """Şube tablosunun toplamları (ilk çağrıda okunur) - yüklenemezse None"""
+        if name in self.table_stats:
+            return self.table_stats[name]
+        if name not in self.sources or self.sources[name].failed:
+            return None
+        
+        stats = None
+        if self.incremental:
+            # new_rows sadece yeni satırları tutar, analiz toplamlardan yapılır
+            try:
+                with sgs_db.connect(self.db_path) as conn:
+                    stats, self.new_rows = sgs_incremental.refresh(conn, f"{name}_loglar", self.state_path)
+                print(f"   ✅ Veritabanı: {len(self.new_rows)} yeni kayıt (toplam {stats.rows})")
+            except Exception:
+                self.sources[name].failed = True
+                print("   ⚠️ Veritabanı yüklenemedi")
+        else:
+            df = self.sources[name].get(sgs_incremental.COLUMNS)
+            if df is not None:
+                with sgs_profile.span(f"aggregate {name}_loglar", 'compute', rows=len(df)):
+                    stats = sgs_incremental.TableAggregates().update(df)
+        
+        if stats is not None:
+            self.table_stats[name] = stats
+        return stats
+    
+    @property
+    def excel_data(self):
+        """Excel tablosu (erişildiğinde okunur)"""
+        source = self.sources.get('excel')
+        return source.get() if source else None
+    
+    @property
+    def sql_data(self):
+        """{'tuzla', 'hesaplamalar'} tabloları (erişildiğinde okunur)"""
+        if not self.sources:
+            return None
+        tuzla = self.new_rows if self.incremental and self._table_stats('tuzla') is not None else self.sources['tuzla'].get()
+        return {'tuzla': tuzla, 'hesaplamalar': self.sources['hesaplamalar'].get()}
     
     def _intelligent_analysis(self):
         """Yapay zeka destekli akıllı analiz"""
         print("\n🧠 YAPAY ZEKA ANALİZİ...")
         
-        if self.sql_data:
-            # Tuzla şubesi analizi
-            tuzla_df = self.sql_data['tuzla']
+        stats = self._table_stats('tuzla')
+        if stats is not None:
+            # Tuzla şubesi analizi - tam tarama ve artımlı modda aynı toplamlar
             
             # 1. Performans analizi
-            view_col = 'GÜNCEL DÖNEM GÖRÜNTÜLEME (02.09-08.09)'
-            if view_col in tuzla_df.columns:
-                top_performers = tuzla_df.nlargest(5, view_col)
+            view_col = sgs_incremental.VIEW_COL
+            if stats.has(view_col):
                 self.insights.append({
                     'type': 'performance',
                     'title': 'En Performanslı Ürünler',
-                    'data': top_performers[['Ürün Adı', view_col]].to_dict('records'),
+                    'data': stats.top_performers(),
                     'priority': 'high'
                 })
             
             # 2. Fiyat optimizasyonu
-            if 'Fiyat' in tuzla_df.columns and view_col in tuzla_df.columns:
+            if stats.has('Fiyat', view_col):
                 # Fiyat-performans analizi
-                tuzla_df['fiyat_performans'] = tuzla_df[view_col] / (tuzla_df['Fiyat'] + 1)
-                best_value = tuzla_df.nlargest(5, 'fiyat_performans')
                 self.insights.append({
                     'type': 'pricing',
                     'title': 'En İyi Fiyat-Performans',
-                    'data': best_value[['Ürün Adı', 'Fiyat', 'fiyat_performans']].to_dict('records'),
+                    'data': stats.best_value(),
                     'priority': 'medium'
                 })
             
             # 3. Kategori analizi
-            if 'Kategori' in tuzla_df.columns:
-                category_performance = tuzla_df.groupby('Kategori').agg({
-                    view_col: 'mean',
-                    'Fiyat': 'mean',
-                    'Ürün Adı': 'count'
-                }).round(2)
-                category_performance.columns = ['Ort_Görüntülenme', 'Ort_Fiyat', 'Ürün_Sayısı']
-                
+            if stats.has('Kategori'):
                 self.insights.append({
                     'type': 'category',
                     'title': 'Kategori Performans Analizi',
-                    'data': category_performance.to_dict('index'),
+                    'data': stats.category_performance(),
                     'priority': 'high'
                 })
             
             # 4. Foto eksiklikleri
-            if 'Foto Durumu' in tuzla_df.columns:
-                missing_photos = tuzla_df[tuzla_df['Foto Durumu'] == 'Hayır']
-                if len(missing_photos) > 0:
-                    self.alerts.append({
-                        'type': 'photo_missing',
-                        'title': f'{len(missing_photos)} Ürünün Fotoğrafı Eksik',
-                        'urgency': 'high',
-                        'products': missing_photos['Ürün Adı'].tolist()[:10]
-                    })
+            if stats.has('Foto Durumu') and stats.photo_missing > 0:
+                self.alerts.append({
+                    'type': 'photo_missing',
+                    'title': f'{stats.photo_missing} Ürünün Fotoğrafı Eksik',
+                    'urgency': 'high',
+                    'products': list(stats.photo_missing_names)
+                })
     
     def _trend_analysis(self):
         """Trend analizi ve tahminleme"""
         print("📈 TREND ANALİZİ...")
         
-        if self.sql_data and 'tuzla' in self.sql_data:
-            df = self.sql_data['tuzla']
-            
+        stats = self._table_stats('tuzla')
+        if stats is not None:
             # Görüntülenme trendleri
-            if 'BİR ÖNCEKİ DÖNEM GÖRÜNTÜLEME (26.08 - 01.09)' in df.columns and 'GÜNCEL DÖNEM GÖRÜNTÜLEME (02.09-08.09)' in df.columns:
-                prev_col = 'BİR ÖNCEKİ DÖNEM GÖRÜNTÜLEME (26.08 - 01.09)'
-                curr_col = 'GÜNCEL DÖNEM GÖRÜNTÜLEME (02.09-08.09)'
-                
-                # Trend hesaplama
-                df['trend_değişim'] = ((df[curr_col] - df[prev_col]) / (df[prev_col] + 1)) * 100
-                
+            if stats.has(sgs_incremental.PREV_COL, sgs_incremental.VIEW_COL):
                 # Yükselen trendler
-                rising_trends = df[df['trend_değişim'] > 20].nlargest(5, 'trend_değişim')
-                if len(rising_trends) > 0:
+                if stats.rising:
                     self.trends.append({
                         'type': 'rising',
                         'title': 'Yükselen Trendler',
-                        'data': rising_trends[['Ürün Adı', 'trend_değişim']].to_dict('records')
+                        'data': stats.trend_records('rising')
                     })
                 
                 # Düşen trendler
-                falling_trends = df[df['trend_değişim'] < -20].nsmallest(5, 'trend_değişim')
-                if len(falling_trends) > 0:
+                if stats.falling:
                     self.trends.append({
                         'type': 'falling',
                         'title': 'Düşen Trendler',
-                        'data': falling_trends[['Ürün Adı', 'trend_değişim']].to_dict('records')
+                        'data': stats.trend_records('falling')
                     })
     
     def _market_analysis(self):
         """Pazar ve rekabet analizi"""
         print("🎯 PAZAR ANALİZİ...")
         
-        if self.sql_data:
-            # Şubeler arası karşılaştırma
-            if 'tuzla' in self.sql_data and 'kosuyolu' in self.sql_data:
-                tuzla_avg = self.sql_data['tuzla']['Fiyat'].mean()
-                kosuyolu_avg = self.sql_data['kosuyolu']['Fiyat'].mean()
+        stats = self._table_stats('tuzla')
+        if stats is not None:
+            # Şubeler arası karşılaştırma - tüm *_loglar tabloları, şube başına ayrı süreç
+            try:
+                result = sgs_branches.analyze_branches(
+                    self.db_path, main='tuzla',
+                    main_summary=sgs_branches.stats_summary(stats, 'tuzla_loglar'))
+            except Exception:
+                print("   ⚠️ Şube karşılaştırması yapılamadı")
+                return
+            
+            sgs_profile.annotate(rows=sum(summary['rows'] for summary in result['branches'].values()))
+            comparison = result['comparison']
+            if len(comparison['avg_price']) > 1:
+                price_data = {f"{name}_ortalama": round(price, 2) for name, price in comparison['avg_price'].items()}
+                price_data['fark_yuzde'] = round(comparison['main_vs_others_pct'], 2)
                 
                 self.insights.append({
                     'type': 'branch_comparison',
                     'title': 'Şubeler Arası Fiyat Karşılaştırması',
-                    'data': {
-                        'tuzla_ortalama': round(tuzla_avg, 2),
-                        'kosuyolu_ortalama': round(kosuyolu_avg, 2),
-                        'fark_yuzde': round(((tuzla_avg - kosuyolu_avg) / kosuyolu_avg) * 100, 2)
-                    },
+                    'data': price_data,
+                    'priority': 'medium'
+                })
+                
+                # Şube başına görüntülenme ve fiyat farkı tablosu
+                self.insights.append({
+                    'type': 'branch_comparison',
+                    'title': 'Şube Performans Karşılaştırması',
+                    'data': [
+                        {
+                            'Şube': comparison['labels'][name],
+                            'Ürün': comparison['rows'][name],
+                            'Ort_Fiyat': round(comparison['avg_price'].get(name, 0), 2),
+                            'Fiyat_Farkı_%': round(comparison['price_delta_pct'].get(name, 0), 1),
+                            'Görüntülenme': int(comparison['views'].get(name, 0)),
+                            'Görüntülenme_Değişim_%': round(comparison['views_change_pct'].get(name, 0), 1)
+                        }
+                        for name in comparison['branches']
+                    ],
                     'priority': 'medium'
                 })
     
@@ -214,7 +454,7 @@ class AdvancedSGS:
             photo_alerts = [a for a in self.alerts if a['type'] == 'photo_missing']
             if photo_alerts:
                 missing_count = len(photo_alerts[0].get('products', []))
-                total_products = len(self.sql_data.get('tuzla', [])) if self.sql_data else 100
+                total_products = self._table_stats('tuzla').rows if self._table_stats('tuzla') is not None else 100
                 photo_score = max(0, 30 - (missing_count / total_products * 30))
                 score += photo_score
         else:
@@ -268,6 +508,23 @@ class AdvancedSGS:
                 'effort': 'Yüksek'
             })
     
+    def _alert_products(self, alert):
+        """Uyarının tam ürün listesi
+
+        Toplamlardaki foto listesi ALERT_PRODUCTS ile sınırlı; eksikse tam liste
+        tablodan (sadece iki sütun) okunur.
+        """
+        products = alert.get('products', [])
+        stats = self._table_stats('tuzla')
+        if alert['type'] != 'photo_missing' or stats is None or stats.photo_missing <= len(products):
+            return [{'Ürün Adı': name} for name in products]
+        
+        name_col = sgs_incremental.NAME_COL
+        df = self.sources['tuzla'].get((name_col, 'Foto Durumu'))
+        if df is None or name_col not in df.columns:
+            return [{'Ürün Adı': name} for name in products]
+        return df.loc[df['Foto Durumu'] == 'Hayır', [name_col]].reset_index(drop=True)
+    
     def _generate_advanced_report(self):
         """Gelişmiş HTML raporu"""
         
@@ -286,177 +543,80 @@ class AdvancedSGS:
             'low': '#6c757d'
         }
         
-        # İçgörüler HTML
-        insights_html = ""
-        for insight in self.insights:
-            color = category_colors.get(insight['type'], '#6c757d')
-            insights_html += f"""
-            <div class="insight-card" style="border-left: 4px solid {color};">
-                <h4>{insight['title']}</h4>
-                <div class="insight-data">{self._format_insight_data(insight['data'])}</div>
-            </div>
-            """
-        
-        # Öneriler HTML
-        recommendations_html = ""
-        for rec in self.recommendations:
-            color = priority_colors.get(rec['priority'], '#6c757d')
-            recommendations_html += f"""
-            <div class="recommendation-card" style="border-left: 4px solid {color};">
-                <div class="rec-header">
-                    <h4>{rec['title']}</h4>
-                    <span class="priority-badge" style="background: {color};">{rec['priority'].upper()}</span>
-                </div>
-                <p><strong>Açıklama:</strong> {rec['description']}</p>
-                <p><strong>Beklenen Etki:</strong> {rec['impact']}</p>
-                <p><strong>Efor Seviyesi:</strong> {rec['effort']}</p>
-            </div>
-            """
-        
-        # Trendler HTML
-        trends_html = ""
-        for trend in self.trends:
-            icon = "📈" if trend['type'] == 'rising' else "📉"
-            trends_html += f"""
-            <div class="trend-card">
-                <h4>{icon} {trend['title']}</h4>
-                <div class="trend-data">{self._format_trend_data(trend['data'])}</div>
-            </div>
-            """
-        
-        # Ana HTML
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>SGS Advanced Analiz Raporu</title>
-            <meta charset="UTF-8">
-            <style>
-                body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif; margin: 0; background: #f8f9fa; }}
-                .container {{ max-width: 1200px; margin: 0 auto; background: white; min-height: 100vh; }}
-                .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 40px; text-align: center; }}
-                .score-circle {{ display: inline-block; width: 120px; height: 120px; border-radius: 50%; border: 8px solid rgba(255,255,255,0.3); margin: 20px; position: relative; }}
-                .score-text {{ position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); font-size: 24px; font-weight: bold; }}
-                .content {{ padding: 30px; }}
-                .section {{ margin: 30px 0; }}
-                .section h2 {{ color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px; }}
-                .insight-card, .recommendation-card, .trend-card {{ background: #f8f9fa; margin: 15px 0; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-                .rec-header {{ display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px; }}
-                .priority-badge {{ padding: 4px 12px; border-radius: 20px; color: white; font-size: 12px; font-weight: bold; }}
-                .metrics-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 20px 0; }}
-                .metric-card {{ background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white; padding: 20px; border-radius: 12px; text-align: center; }}
-                .data-table {{ width: 100%; border-collapse: collapse; margin: 15px 0; }}
-                .data-table th, .data-table td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-                .data-table th {{ background: #3498db; color: white; }}
-                .footer {{ background: #2c3e50; color: white; padding: 30px; text-align: center; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🚀 SGS Advanced - Yapay Zeka Analizi</h1>
-                    <p>Smart Growth Solutions</p>
-                    <div class="score-circle">
-                        <div class="score-text">{self.performance_score}</div>
-                    </div>
-                    <p>Genel Performans Skoru</p>
-                </div>
-                
-                <div class="content">
-                    <div class="metrics-grid">
-                        <div class="metric-card">
-                            <h3>📊 Toplam İçgörü</h3>
-                            <h2>{len(self.insights)}</h2>
-                        </div>
-                        <div class="metric-card">
-                            <h3>💡 Aksiyon Önerisi</h3>
-                            <h2>{len(self.recommendations)}</h2>
-                        </div>
-                        <div class="metric-card">
-                            <h3>📈 Trend Analizi</h3>
-                            <h2>{len(self.trends)}</h2>
-                        </div>
-                        <div class="metric-card">
-                            <h3>⚠️ Kritik Uyarı</h3>
-                            <h2>{len(self.alerts)}</h2>
-                        </div>
-                    </div>
-                    
-                    <div class="section">
-                        <h2>🧠 Yapay Zeka İçgörüleri</h2>
-                        {insights_html}
-                    </div>
-                    
-                    <div class="section">
-                        <h2>📈 Trend Analizi</h2>
-                        {trends_html}
-                    </div>
-                    
-                    <div class="section">
-                        <h2>🎯 Akıllı Öneriler</h2>
-                        {recommendations_html}
-                    </div>
-                </div>
-                
-                <div class="footer">
-                    <p>📅 Rapor Tarihi: {datetime.now().strftime('%d %B %Y, %H:%M')}</p>
-                    <p><strong>SGS Advanced - Powered by AI</strong></p>
-                    <p>🧠 Yapay zeka destekli restoran optimizasyonu</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        with open('sgs_advanced_report.html', 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        with sgs_report.ReportWriter('sgs_advanced_report.html') as out:
+            out.render(ADVANCED_REPORT_HEAD, score=self.performance_score, insights=len(self.insights),
+                       recommendations=len(self.recommendations), trends=len(self.trends), alerts=len(self.alerts))
+            
+            # İçgörüler
+            for insight in self.insights:
+                color = category_colors.get(insight['type'], '#6c757d')
+                out.render(INSIGHT_CARD_OPEN, color=color, title=insight['title'])
+                self._write_insight_data(out, insight['data'])
+                out.render(CARD_CLOSE)
+            
+            # Trendler
+            out.render(SECTION_BREAK, title='📈 Trend Analizi')
+            for trend in self.trends:
+                icon = "📈" if trend['type'] == 'rising' else "📉"
+                out.render(TREND_CARD_OPEN, title=f"{icon} {trend['title']}")
+                self._write_trend_data(out, trend['data'])
+                out.render(CARD_CLOSE)
+            
+            # Uyarılar - tam ürün listeleri (büyük listeler sanal tablo olarak)
+            if self.alerts:
+                out.render(SECTION_BREAK, title='⚠️ Kritik Uyarılar')
+                for alert in self.alerts:
+                    out.render(ALERT_CARD_OPEN, title=alert['title'])
+                    out.data_table(self._alert_products(alert))
+                    out.render(CARD_CLOSE)
+            
+            # Öneriler
+            out.render(SECTION_BREAK, title='🎯 Akıllı Öneriler')
+            for rec in self.recommendations:
+                color = priority_colors.get(rec['priority'], '#6c757d')
+                out.render(RECOMMENDATION_CARD, color=color, title=rec['title'], priority=rec['priority'].upper(),
+                           description=rec['description'], impact=rec['impact'], effort=rec['effort'])
+            
+            out.render(ADVANCED_REPORT_FOOTER, report_date=datetime.now().strftime('%d %B %Y, %H:%M'))
     
-    def _format_insight_data(self, data):
-        """İçgörü verilerini formatla"""
+    def _write_insight_data(self, out, data):
+        """İçgörü verilerini yaz"""
         if isinstance(data, list):
-            html = "<table class='data-table'>"
-            if data:
-                # Header
-                html += "<tr>"
-                for key in data[0].keys():
-                    html += f"<th>{key}</th>"
-                html += "</tr>"
-                
-                # Rows
-                for item in data[:5]:  # İlk 5 öğe
-                    html += "<tr>"
-                    for value in item.values():
-                        html += f"<td>{value}</td>"
-                    html += "</tr>"
-            html += "</table>"
-            return html
+            out.data_table(data)
         elif isinstance(data, dict):
-            html = "<table class='data-table'>"
-            for key, value in data.items():
-                html += f"<tr><td><strong>{key}</strong></td><td>{value}</td></tr>"
-            html += "</table>"
-            return html
-        return str(data)
+            out.key_value_table(data)
+        else:
+            out.write(sgs_report.escape(data))
     
-    def _format_trend_data(self, data):
-        """Trend verilerini formatla"""
-        if isinstance(data, list) and data:
-            html = "<table class='data-table'>"
-            html += "<tr><th>Ürün</th><th>Değişim %</th></tr>"
-            for item in data[:5]:
+    def _write_trend_data(self, out, data):
+        """Trend verilerini yaz"""
+        if isinstance(data, list) and len(data) > sgs_report.INLINE_TABLE_ROWS:
+            out.data_table([{'Ürün': item.get('Ürün Adı', 'N/A'), 'Değişim %': round(item.get('trend_değişim', 0), 1)}
+                            for item in data])
+        elif isinstance(data, list) and data:
+            out.write("<table class='data-table'><tr><th>Ürün</th><th>Değişim %</th></tr>")
+            for item in data:
                 change = item.get('trend_değişim', 0)
                 color = '#28a745' if change > 0 else '#dc3545'
-                html += f"<tr><td>{item.get('Ürün Adı', 'N/A')}</td><td style='color: {color};'>{change:.1f}%</td></tr>"
-            html += "</table>"
-            return html
-        return "Veri bulunamadı"
+                out.render(TREND_ROW, name=item.get('Ürün Adı', 'N/A'), color=color, change=f"{change:.1f}")
+            out.write("</table>")
+        else:
+            out.write("Veri bulunamadı")
 
 # Ana fonksiyon
-def analyze():
+def analyze(incremental=False, profile=False):
     """SGS Advanced tam analiz"""
     sgs = AdvancedSGS()
-    sgs.full_analysis()
+    return sgs.full_analysis(incremental=incremental, profile=profile)
 
 # Test
 if __name__ == "__main__":
-    analyze()
+    import sys
+    # python sgs_advanced.py [--incremental] [--profile [trace.json]]
+    profile = analyze(incremental='--incremental' in sys.argv, profile='--profile' in sys.argv)
+    if profile:
+        i = sys.argv.index('--profile')
+        trace_path = sys.argv[i + 1] if i + 1 < len(sys.argv) and not sys.argv[i + 1].startswith('--') else 'sgs_advanced_trace.json'
+        profile.to_chrome_trace(trace_path)
+        profile.to_json(trace_path.replace('.json', '') + '_profile.json')
+        print(f"💾 Chrome trace: {trace_path}")
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS Branches - Çok şubeli analiz
+sales.db içindeki tüm *_loglar tablolarını bulur, her şubeyi ayrı bir
+süreçte yükleyip özetler ve şubeler arası karşılaştırma üretir
+
+Kullanım:
+import sgs_branches
+result = sgs_branches.analyze_branches('sales.db', jobs=8)
+for insight in sgs_branches.comparison_insights(result['comparison']):
+    print(insight)
+
+python sgs_branches.py [sales.db] [--jobs N] [--pushdown]
+"""
+
+import os
+import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+import sgs_db
+import sgs_mirror
+
+BRANCH_SUFFIX = sgs_db.BRANCH_SUFFIX
+# fork, çağıran süreçte başka thread'ler (sgs_rules havuzu) kilit tutarken kilitlenebilir
+START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+VIEW_COL = 'GÜNCEL DÖNEM GÖRÜNTÜLEME (02.09-08.09)'
+PREV_COL = 'BİR ÖNCEKİ DÖNEM GÖRÜNTÜLEME (26.08 - 01.09)'
+
+# Tablo adında Türkçe karakter olmayan şubelerin görünen adları
+BRANCH_LABELS = {
+    'kosuyolu': 'Koşuyolu'
+}
+
+# Ses uyumu kuralına uymayan ekler (iyelik ekli bileşik adlar)
+BRANCH_ABLATIVES = {
+    'kosuyolu': "Koşuyolu'ndan"
+}
+
+
+def branch_label(name):
+    """Tablo önekinden görünen şube adı"""
+    if name in BRANCH_LABELS:
+        return BRANCH_LABELS[name]
+    # Türkçe büyük harf: i → İ
+    first = 'İ' if name[:1] == 'i' else name[:1].upper()
+    return first + name[1:]
+
+
+def _case_suffix(label, back, front):
+    """Türkçe ses uyumu: son ünlüye göre ek, sert ünsüzden sonra d → t"""
+    vowels = [ch for ch in label.lower() if ch in 'aıoueiöü']
+    suffix = back if not vowels or vowels[-1] in 'aıou' else front
+    if label[-1:].lower() in 'çfhkpsşt':
+        suffix = 't' + suffix[1:]
+    return f"{label}'{suffix}"
+
+
+def ablative(name):
+    """'Tuzla' → "Tuzla'dan" """
+    return BRANCH_ABLATIVES.get(name) or _case_suffix(branch_label(name), 'dan', 'den')
+
+
+def locative(name):
+    """'Tuzla' → "Tuzla'da" """
+    return _case_suffix(branch_label(name), 'da', 'de')
+
+
+def discover_branches(conn):
+    """Veritabanındaki şube tablolarını bul - {şube: tablo}"""
+    return {table[:-len(BRANCH_SUFFIX)]: table for table in sgs_db.branch_tables(conn)}
+
+
+def _q(name):
+    """SQL tanımlayıcısını tırnakla"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _summarize_frame(df):
+    """Yüklenmiş şube tablosundan özet"""
+    summary = {'rows': len(df)}
+
+    if 'Fiyat' in df.columns:
+        summary['avg_price'] = float(df['Fiyat'].mean())
+        summary['min_price'] = float(df['Fiyat'].min())
+        summary['max_price'] = float(df['Fiyat'].max())
+    if VIEW_COL in df.columns:
+        summary['views'] = float(df[VIEW_COL].sum())
+        if len(df) > 0 and 'Ürün Adı' in df.columns and not df[VIEW_COL].isna().all():
+            top = df.loc[df[VIEW_COL].idxmax()]
+            summary['top_product'] = (top['Ürün Adı'], float(top[VIEW_COL]))
+    if PREV_COL in df.columns:
+        summary['views_prev'] = float(df[PREV_COL].sum())
+    if 'Foto Durumu' in df.columns:
+        summary['photo_missing'] = int((df['Foto Durumu'] == 'Hayır').sum())
+    if 'Kategori' in df.columns:
+        summary['categories'] = {str(k): int(v) for k, v in df['Kategori'].value_counts().items()}
+
+    return summary
+
+
+def _summarize_sql(conn, table):
+    """Şube özetini SQLite toplamlarıyla üret (tablo pandas'a çekilmez)"""
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({_q(table)})")}
+    fields = ['COUNT(*)']
+    keys = ['rows']
+
+    if 'Fiyat' in columns:
+        fields += [f"AVG({_q('Fiyat')})", f"MIN({_q('Fiyat')})", f"MAX({_q('Fiyat')})"]
+        keys += ['avg_price', 'min_price', 'max_price']
+    if VIEW_COL in columns:
+        fields.append(f"TOTAL({_q(VIEW_COL)})")
+        keys.append('views')
+    if PREV_COL in columns:
+        fields.append(f"TOTAL({_q(PREV_COL)})")
+        keys.append('views_prev')
+    if 'Foto Durumu' in columns:
+        fields.append(f"SUM(CASE WHEN {_q('Foto Durumu')} = 'Hayır' THEN 1 ELSE 0 END)")
+        keys.append('photo_missing')
+
+    values = conn.execute(f"SELECT {', '.join(fields)} FROM {_q(table)}").fetchone()
+    summary = {key: value for key, value in zip(keys, values) if value is not None}
+
+    if VIEW_COL in columns and 'Ürün Adı' in columns:
+        top = conn.execute(
+            f"SELECT {_q('Ürün Adı')}, {_q(VIEW_COL)} FROM {_q(table)} "
+            f"WHERE {_q(VIEW_COL)} IS NOT NULL ORDER BY {_q(VIEW_COL)} DESC, rowid LIMIT 1"
+        ).fetchone()
+        if top:
+            summary['top_product'] = (top[0], float(top[1]))
+    if 'Kategori' in columns:
+        summary['categories'] = {str(cat): n for cat, n in conn.execute(
+            f"SELECT {_q('Kategori')}, COUNT(*) AS n FROM {_q(table)} "
+            f"WHERE {_q('Kategori')} IS NOT NULL GROUP BY 1 ORDER BY n DESC, MIN(rowid)"
+        )}
+
+    return summary
+
+
+def _with_identity(summary, table):
+    """Özete şube adı/etiket/tablo bilgisini ekle"""
+    name = table[:-len(BRANCH_SUFFIX)] if table.endswith(BRANCH_SUFFIX) else table
+    summary.update({'name': name, 'label': branch_label(name), 'table': table})
+    return summary
+
+
+def frame_summary(df, table):
+    """Zaten yüklenmiş bir şube tablosunun özeti (tekrar okumadan)"""
+    return _with_identity(_summarize_frame(df), table)
+
+
+def stats_summary(stats, table):
+    """Artımlı toplamlardan (sgs_incremental.TableAggregates) şube özeti"""
+    return _with_identity(stats.branch_summary(), table)
+
+
+def branch_summary(db_path, table, pushdown=False):
+    """Tek şubenin özetini çıkar - süreç havuzunda çalışır"""
+    with sgs_db.connect(db_path) as conn:
+        if pushdown:
+            summary = _summarize_sql(conn, table)
+        else:
+            summary = _summarize_frame(sgs_mirror.read_table(db_path, table, conn))
+
+    return _with_identity(summary, table)
+
+
+def _summary_task(args):
+    """ProcessPoolExecutor için tek argümanlı sarmalayıcı"""
+    return branch_summary(*args)
+
+
+def summarize_branches(db_path='sales.db', tables=None, jobs=None, pushdown=False):
+    """Tüm şubeleri paralel özetle - {şube: özet}, keşif sırasıyla"""
+    if tables is None:
+        with sgs_db.connect(db_path) as conn:
+            tables = discover_branches(conn)
+
+    tasks = [(db_path, table, pushdown) for table in tables.values()]
+    jobs = jobs or os.cpu_count() or 1
+
+    if jobs == 1 or len(tasks) <= 1:
+        summaries = [_summary_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)),
+                                 mp_context=multiprocessing.get_context(START_METHOD)) as pool:
+            summaries = list(pool.map(_summary_task, tasks))
+
+    return {summary['name']: summary for summary in summaries}
+
+
+def _pct(value, base):
+    """Yüzde fark"""
+    return ((value - base) / base) * 100 if base else 0.0
+
+
+def compare_branches(summaries, main=None):
+    """Şubeler arası karşılaştırma: fiyat farkları, kategori dağılımı, görüntülenme"""
+    names = list(summaries)
+    main = main if main in summaries else (names[0] if names else None)
+
+    prices = {name: s['avg_price'] for name, s in summaries.items() if 'avg_price' in s}
+    network_avg = sum(prices.values()) / len(prices) if prices else 0.0
+    others = [prices[name] for name in prices if name != main]
+    others_avg = sum(others) / len(others) if others else 0.0
+
+    views = {name: s.get('views', 0.0) for name, s in summaries.items()}
+    views_change = {
+        name: _pct(s.get('views', 0.0), s['views_prev'])
+        for name, s in summaries.items() if s.get('views_prev')
+    }
+
+    # Kategori dağılımı: şube başına yüzde pay (satır: kategori, sütun: şube)
+    mix = pd.DataFrame({name: s.get('categories', {}) for name, s in summaries.items()}).fillna(0)
+    if not mix.empty:
+        mix = (mix / mix.sum() * 100).round(1)
+
+    return {
+        'main': main,
+        'branches': names,
+        'labels': {name: s['label'] for name, s in summaries.items()},
+        'rows': {name: s['rows'] for name, s in summaries.items()},
+        'avg_price': prices,
+        'network_avg_price': network_avg,
+        'others_avg_price': others_avg,
+        'main_vs_others_pct': _pct(prices.get(main, 0.0), others_avg),
+        'price_delta_pct': {name: _pct(price, network_avg) for name, price in prices.items()},
+        'views': views,
+        'views_change_pct': views_change,
+        'category_mix': mix
+    }
+
+
+def analyze_branches(db_path='sales.db', jobs=None, pushdown=False, main='tuzla', main_summary=None):
+    """Keşif + paralel özet + karşılaştırma
+
+    main_summary: ana şube zaten yüklenip özetlendiyse (frame_summary/stats_summary)
+    o tablo tekrar okunmaz
+    """
+    with sgs_db.connect(db_path) as conn:
+        tables = discover_branches(conn)
+
+    if main_summary is not None:
+        others = {name: table for name, table in tables.items() if name != main_summary['name']}
+        summaries = summarize_branches(db_path, tables=others, jobs=jobs, pushdown=pushdown)
+        summaries[main_summary['name']] = main_summary
+        # Keşif sırasını koru
+        summaries = {name: summaries[name] for name in tables if name in summaries}
+    else:
+        summaries = summarize_branches(db_path, tables=tables, jobs=jobs, pushdown=pushdown)
+
+    return {
+        'branches': summaries,
+        'comparison': compare_branches(summaries, main=main)
+    }
+
+
+def comparison_insights(comparison, detail_limit=3):
+    """Karşılaştırmadan okunabilir bulgular
+
+    Az şube varsa ana şube her biriyle tek tek karşılaştırılır,
+    çok şubede özet satırları üretilir.
+    """
+    insights = []
+    main = comparison['main']
+    labels = comparison['labels']
+    prices = comparison['avg_price']
+    others = [name for name in comparison['branches'] if name != main and name in prices]
+
+    if main not in prices or not others:
+        return insights
+
+    main_label = labels[main]
+    main_price = prices[main]
+
+    if len(others) <= detail_limit:
+        for name in others:
+            other_price = prices[name]
+            price_diff = _pct(main_price, other_price)
+            other_label = labels[name]
+
+            if price_diff > 5:
+                insights.append(f"📊 {main_label}, {ablative(name)} %{price_diff:.0f} daha pahalı (ort. {main_price:.0f}₺ vs {other_price:.0f}₺)")
+            elif price_diff < -5:
+                insights.append(f"📊 {main_label}, {ablative(name)} %{abs(price_diff):.0f} daha ucuz (ort. {main_price:.0f}₺ vs {other_price:.0f}₺)")
+            elif len(others) == 1:
+                insights.append(f"⚖️ Her iki şube benzer fiyatlarda ({main_label}: {main_price:.0f}₺, {other_label}: {other_price:.0f}₺)")
+            else:
+                insights.append(f"⚖️ {main_label} ve {other_label} benzer fiyatlarda ({main_price:.0f}₺ vs {other_price:.0f}₺)")
+
+        counts = ', '.join(f"{labels[name]} {comparison['rows'][name]}" for name in [main] + others)
+        insights.append(f"🏪 Ürün sayısı: {counts}")
+    else:
+        diff = comparison['main_vs_others_pct']
+        insights.append(f"🏪 {len(others) + 1} şube karşılaştırıldı (ağ ortalaması {comparison['network_avg_price']:.0f}₺)")
+        insights.append(f"📊 {main_label}, diğer şubelerin ortalamasından %{abs(diff):.0f} {'daha pahalı' if diff > 0 else 'daha ucuz'} (ort. {main_price:.0f}₺ vs {comparison['others_avg_price']:.0f}₺)")
+
+        deltas = comparison['price_delta_pct']
+        priciest = max(deltas, key=deltas.get)
+        cheapest = min(deltas, key=deltas.get)
+        insights.append(f"💎 En pahalı şube: {labels[priciest]} (%{deltas[priciest]:+.0f}), en ucuz: {labels[cheapest]} (%{deltas[cheapest]:+.0f})")
+
+    views = comparison['views']
+    if any(views.values()):
+        leader = max(views, key=views.get)
+        insights.append(f"👀 En çok görüntülenen şube: {labels[leader]} ({views[leader]:.0f} görüntülenme)")
+
+    changes = comparison['views_change_pct']
+    if len(changes) > 1 and max(changes.values()) > 0:
+        rising = max(changes, key=changes.get)
+        insights.append(f"📈 Görüntülenmesi en çok artan şube: {labels[rising]} (%{changes[rising]:.0f})")
+
+    # Kategori dağılımında ana şubeden en çok ayrışan kategori
+    mix = comparison['category_mix']
+    if not mix.empty and main in mix.columns and len(mix.columns) > 1:
+        gap = (mix[main] - mix.drop(columns=[main]).mean(axis=1)).abs()
+        category = gap.idxmax()
+        if gap[category] >= 5:
+            others_share = mix.drop(columns=[main]).loc[category].mean()
+            insights.append(f"📦 Kategori farkı: {category} {locative(main)} %{mix.loc[category, main]:.0f}, diğer şubelerde ort. %{others_share:.0f}")
+
+    return insights
+
+
+if __name__ == "__main__":
+    db_path = 'sales.db'
+    jobs = None
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        if args[i] == '--jobs' and i + 1 < len(args):
+            jobs = int(args[i + 1])
+            i += 1
+        elif not args[i].startswith('--'):
+            db_path = args[i]
+        i += 1
+
+    print("🏪 SGS ŞUBE ANALİZİ")
+    print("=" * 50)
+    result = analyze_branches(db_path, jobs=jobs, pushdown='--pushdown' in sys.argv)
+    for name, summary in result['branches'].items():
+        print(f"📊 {summary['label']}: {summary['rows']} ürün, ort. {summary.get('avg_price', 0):.0f}₺")
+
+    print()
+    for i, insight in enumerate(comparison_insights(result['comparison']), 1):
+        print(f"{i:2d}. {insight}")
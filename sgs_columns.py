@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS Columns - Ortak sütun rolü tespiti
+Sütun adları Türkçe kurallarıyla katlanır (İ/I/ı → i) ve önceden derlenmiş
+desenlerle tek geçişte sınıflandırılır. Sonuç şema parmak izine (sütun adları
++ tipler) göre önbelleğe alınır; aynı biçimdeki dışa aktarımlar tekrar
+yüklendiğinde tespit hiç çalışmaz.
+
+Roller (öncelik sırasıyla, ilk eşleşen kazanır):
+price, metric, category, name, date, status, meta
+Eşleşmeyen sütunların türü: numeric / text
+
+Roller dışında her sütun bayraklar taşır: views, previous, photo, state, badge.
+'BİR ÖNCEKİ DÖNEM GÖRÜNTÜLEME' gibi geçmiş dönem sütunları 'previous'
+bayrağı alır; of()/first() güncel dönem sütunlarını önce döndürür.
+
+Kullanım:
+import sgs_columns
+roles = sgs_columns.detect(df)
+price_col = roles.first('price')
+view_cols = roles.flagged('views', previous=False)
+"""
+
+import re
+from functools import lru_cache
+
+import pandas as pd
+
+# (rol, desenler) - sıra önceliktir
+ROLE_PATTERNS = [
+    ('price', ['fiyat', 'price', 'tutar', 'amount', 'cost']),
+    ('metric', ['görüntül', 'view', 'click', 'tıklama', 'sales', 'adet', 'quantity']),
+    ('category', ['kategori', 'category', 'grup', 'type', 'class']),
+    # 'ad' sadece kelime başında: 'Ürün Adı' evet, 'Güncel Badge' hayır
+    ('name', ['ürün', 'product', 'name', r'(?:\b|_)ad', 'isim', 'title']),
+    ('date', ['tarih', 'date', 'time', 'created']),
+    ('status', ['durum', 'status', 'state', 'foto', 'photo', 'görsel']),
+    ('meta', ['badge', 'tag', 'label', 'note', 'description'])
+]
+
+FLAG_PATTERNS = {
+    'views': ['görüntül', 'view', 'click', 'tıklama'],
+    'previous': ['önceki', 'previous', 'prev', 'geçen'],
+    'photo': ['foto', 'photo', 'görsel'],
+    'state': ['durum', 'status'],
+    'badge': ['badge']
+}
+
+CACHE_SIZE = 256
+
+
+def fold(text):
+    """Türkçe duyarlı küçük harf: İ, I, ı ve i aynı harf sayılır
+
+    str.lower() 'İ' harfini 'i̇' (i + birleşik nokta) yapar; bu yüzden
+    'BİR ÖNCEKİ' içinde 'önceki' bulunamaz. İngilizce büyük harfli adlar
+    ('PRICE') da eşleşsin diye I noktalıya değil ortak 'i'ye katlanır.
+    """
+    return str(text).replace('İ', 'i').replace('I', 'i').replace('ı', 'i').casefold()
+
+
+def _compile(patterns):
+    return re.compile('|'.join(fold(p) for p in patterns))
+
+
+_ROLES = [(role, _compile(patterns)) for role, patterns in ROLE_PATTERNS]
+_FLAGS = [(flag, _compile(patterns)) for flag, patterns in FLAG_PATTERNS.items()]
+
+
+def _is_numeric(dtype):
+    if dtype is None:
+        return False
+    try:
+        dtype = pd.api.types.pandas_dtype(dtype)
+    except TypeError:
+        return False
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+class ColumnRoles:
+    """Tek şemanın sütun rolleri - önbellekte paylaşılır, değiştirmeyin"""
+
+    def __init__(self, schema):
+        self.columns = [col for col, _ in schema]
+        self.roles = {}
+        self.flags = {}
+        for col, dtype in schema:
+            name = fold(col)
+            role = next((r for r, pattern in _ROLES if pattern.search(name)), None)
+            kind = 'numeric' if _is_numeric(dtype) else 'text'
+            self.roles[col] = role or kind
+            self.flags[col] = frozenset(flag for flag, pattern in _FLAGS if pattern.search(name))
+
+    def role(self, col, default=None):
+        """Sütunun rolü; anahtar kelimeyle eşleşmediyse default (verilmezse numeric/text)"""
+        role = self.roles.get(col)
+        if default is not None and role in ('numeric', 'text'):
+            return default
+        return role
+
+    def _ordered(self, cols, previous):
+        current = [col for col in cols if 'previous' not in self.flags[col]]
+        if not previous:
+            return current
+        return current + [col for col in cols if 'previous' in self.flags[col]]
+
+    def of(self, role, previous=True):
+        """Roldeki sütunlar - güncel dönem önce, geçmiş dönem sonra (previous=False: hariç)"""
+        return self._ordered([col for col in self.columns if self.roles[col] == role], previous)
+
+    def first(self, role, previous=True):
+        """Roldeki ilk (tercihen güncel dönem) sütun"""
+        cols = self.of(role, previous)
+        return cols[0] if cols else None
+
+    def flagged(self, *flags, previous=True):
+        """Verilen tüm bayrakları taşıyan sütunlar (sıralama of() ile aynı)"""
+        wanted = set(flags)
+        return self._ordered([col for col in self.columns if wanted <= self.flags[col]], previous)
+
+
+def fingerprint(data):
+    """Şema parmak izi: ((sütun, tip), ...) - DataFrame ya da sütun adı listesi"""
+    if isinstance(data, pd.DataFrame):
+        return tuple((col, str(dtype)) for col, dtype in data.dtypes.items())
+    return tuple((col, None) for col in data)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _detect_schema(schema):
+    return ColumnRoles(schema)
+
+
+def detect(data):
+    """Sütun rollerini tespit et (aynı şema için önbellekten)"""
+    return _detect_schema(fingerprint(data))
+
+
+def cache_info():
+    """Önbellek isabet/ıskalama sayıları"""
+    return _detect_schema.cache_info()
+
+
+def clear_cache():
+    _detect_schema.cache_clear()
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS Daemon - `sgs` komutları için arka planda sıcak bekleyen süreç
+pandas/duckdb bir kez yüklenir, son kullanılan veri setleri (Excel DataFrame'leri,
+DuckDB oturumları) bellekte tutulur. `sgs analyze` ve `sgs sql` istekleri yerel
+Unix soketinden gelir; çıktı metni istemciye döner ve orada yazılır.
+
+Protokol: bağlantı başına tek satır JSON istek / tek satır JSON yanıt
+{"command": "analyze" | "sql" | "ping" | "stop", "args": [...], "cwd": "..."}
+{"status": 0, "output": "..."}
+
+Dosyalar istemcinin çalışma dizinine göre çözülür; dosya değişince (boyut/mtime)
+sıcak kopya yeniden okunur. Komutlar sırayla çalışır (çıktı yakalama süreç
+genelidir). Bu modül üst seviyede sadece standart kütüphaneyi yükler: istemci
+tarafı (call) hızlı açılır.
+
+Kullanım:
+python sgs_daemon.py start | stop | status
+python sgs_daemon.py serve            (ön planda)
+sgs daemon start                      (aynısı)
+SGS_DAEMON=0 sgs analyze              (daemon'u kullanma)
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+
+SOCKET_PATH = os.environ.get('SGS_DAEMON_SOCKET') or os.path.join(
+    os.environ.get('XDG_RUNTIME_DIR') or '/tmp', f"sgs-{os.getuid()}.sock")
+ENABLED = os.environ.get('SGS_DAEMON', '1') != '0'
+MAX_DATASETS = 8
+START_TIMEOUT = 30.0
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+# --- İstemci (sadece standart kütüphane) ---
+
+def call(command, args=(), socket_path=SOCKET_PATH, timeout=None):
+    """İsteği daemon'a gönder - yanıt sözlüğü; daemon çalışmıyorsa None"""
+    if not os.path.exists(socket_path):
+        return None
+    request = {'command': command, 'args': list(args), 'cwd': os.getcwd()}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(request, ensure_ascii=False).encode('utf-8') + b'\n')
+            data = b''
+            while not data.endswith(b'\n'):
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+    except OSError:
+        # Eski soket dosyası (daemon kapanmış) ya da zaman aşımı
+        return None
+    return json.loads(data) if data else None
+
+
+def run(command, args=()):
+    """Komutu daemon'da çalıştır, çıktıyı yaz - daemon yoksa/kapalıysa None (yerelde çalıştırılmalı)"""
+    if not ENABLED:
+        return None
+    response = call(command, args)
+    if response is None:
+        return None
+    sys.stdout.write(response.get('output', ''))
+    sys.stdout.flush()
+    return response.get('status', 0)
+
+
+def start(socket_path=SOCKET_PATH, timeout=START_TIMEOUT):
+    """Daemon'u arka planda başlat, hazır olana kadar bekle - çalışıyorsa dokunmaz"""
+    if call('ping', socket_path=socket_path) is not None:
+        return True
+    import subprocess
+    log_path = socket_path + '.log'
+    with open(log_path, 'ab') as log:
+        subprocess.Popen([sys.executable, os.path.abspath(__file__), 'serve', '--socket', socket_path],
+                         stdin=subprocess.DEVNULL, stdout=log, stderr=log, start_new_session=True)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if call('ping', socket_path=socket_path) is not None:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+# --- Sunucu ---
+
+def _resolve(cwd, path):
+    return path if os.path.isabs(path) else os.path.join(cwd, path)
+
+
+class WarmCache:
+    """(tür, yol) → değer; dosya sürümü değişince yeniden kurulur, en son kullanılan max_items tutulur"""
+
+    def __init__(self, max_items=MAX_DATASETS):
+        self.max_items = max_items
+        self._items = {}
+
+    def get(self, kind, path, build):
+        import sgs_db
+        version = sgs_db.file_version(path)
+        key = (kind, path)
+        entry = self._items.pop(key, None)
+        if entry is not None and entry[0] == version:
+            self._items[key] = entry
+            return entry[1]
+        if entry is not None:
+            self._dispose(entry[1])
+
+        value = build(path)
+        self._items[key] = (version, value)
+        while len(self._items) > self.max_items:
+            # dict ekleme sırası: ilk anahtar en uzun süredir kullanılmayan
+            oldest = next(iter(self._items))
+            self._dispose(self._items.pop(oldest)[1])
+        return value
+
+    def _dispose(self, value):
+        if hasattr(value, 'close'):
+            value.close()
+
+    def keys(self):
+        return [f"{kind}:{path}" for kind, path in self._items]
+
+    def clear(self):
+        for _, value in self._items.values():
+            self._dispose(value)
+        self._items.clear()
+
+
+class Daemon:
+    """Unix soket sunucusu - komutlar tek işçi thread'de sırayla çalışır"""
+
+    def __init__(self, socket_path=SOCKET_PATH, max_datasets=MAX_DATASETS):
+        from concurrent.futures import ThreadPoolExecutor
+        import contextlib
+        # Sıcak tutulacak ağır modüller açılışta bir kez yüklenir; duckdb isteğe bağlı
+        # (yoksa sadece `sgs sql` hata verir, `sgs analyze` çalışır)
+        with contextlib.suppress(ImportError):
+            import pandas  # noqa: F401
+            import analyze  # noqa: F401
+            import sgs_sql  # noqa: F401
+        with contextlib.suppress(ImportError):
+            import duckdb  # noqa: F401
+
+        self.socket_path = socket_path
+        self.cache = WarmCache(max_datasets)
+        self.pool = ThreadPoolExecutor(max_workers=1)
+        self.started = time.time()
+        self.requests = 0
+        self.server = None
+
+    COMMANDS = {
+        'analyze': '_analyze',
+        'sql': '_sql'
+    }
+
+    # --- Komutlar ---
+
+    def _analyze(self, args, cwd):
+        """sgs analyze [excel] [db]"""
+        import analyze
+        import pandas as pd
+        excel_path = _resolve(cwd, args[0] if args else 'image-table-cs.xlsx')
+        db_path = _resolve(cwd, args[1] if len(args) > 1 else 'sales.db')
+        analyze.quick(excel_path, db_path, read_excel=lambda path: self.cache.get('excel', path, pd.read_excel))
+
+    def _sql(self, args, cwd):
+        """sgs sql dosya.xlsx "SQL" | sgs sql dosya.xlsx --schema"""
+        import sgs_sql
+        if not args or '--repl' in args:
+            raise ValueError("Kullanım: sgs sql dosya.xlsx \"SQL_SORGUSU\"")
+        args = [_resolve(cwd, args[0])] + list(args[1:])
+        session = None
+        if len(args) > 1 and args[1] != '--schema':
+            session = self.cache.get('sql', args[0], lambda path: sgs_sql.SQLSession())
+        sgs_sql.main(args, session)
+
+    def execute(self, request):
+        """İşçi thread'de: komutu çalıştır, çıktıyı yakala"""
+        import io
+        import traceback
+        from contextlib import redirect_stdout
+
+        handler = getattr(self, self.COMMANDS.get(request.get('command'), ''), None)
+        if handler is None:
+            return {'status': 2, 'output': f"❌ Bilinmeyen komut: {request.get('command')}\n"}
+        out = io.StringIO()
+        status = 0
+        with redirect_stdout(out):
+            try:
+                handler([str(arg) for arg in request.get('args', [])], request.get('cwd') or os.getcwd())
+            except Exception as e:
+                status = 1
+                print(f"❌ Hata: {e}")
+                traceback.print_exc(file=sys.stderr)
+        return {'status': status, 'output': out.getvalue()}
+
+    # --- Soket ---
+
+    async def _handle(self, reader, writer):
+        import asyncio
+        try:
+            line = await reader.readline()
+            if not line:
+                return
+            try:
+                request = json.loads(line)
+            except ValueError:
+                response = {'status': 2, 'output': "❌ Geçersiz istek\n"}
+            else:
+                self.requests += 1
+                command = request.get('command')
+                if command == 'ping':
+                    response = {'status': 0, 'pid': os.getpid(), 'uptime': round(time.time() - self.started, 1),
+                                'requests': self.requests, 'warm': self.cache.keys(), 'output': ''}
+                elif command == 'stop':
+                    response = {'status': 0, 'output': "👋 SGS daemon durduruldu\n"}
+                    self.server.close()
+                else:
+                    loop = asyncio.get_running_loop()
+                    response = await loop.run_in_executor(self.pool, self.execute, request)
+            writer.write(json.dumps(response, ensure_ascii=False, default=str).encode('utf-8') + b'\n')
+            await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve_forever(self):
+        import asyncio
+        if os.path.exists(self.socket_path):
+            if call('ping', socket_path=self.socket_path) is not None:
+                raise RuntimeError(f"Daemon zaten çalışıyor: {self.socket_path}")
+            os.unlink(self.socket_path)
+
+        # Soket sadece bu kullanıcıya açık
+        old_umask = os.umask(0o077)
+        try:
+            self.server = await asyncio.start_unix_server(self._handle, self.socket_path, limit=MAX_REQUEST_BYTES)
+        finally:
+            os.umask(old_umask)
+        print(f"🔌 SGS daemon: {self.socket_path} (pid {os.getpid()})", flush=True)
+        try:
+            async with self.server:
+                try:
+                    await self.server.serve_forever()
+                except asyncio.CancelledError:
+                    pass
+        finally:
+            self.close()
+
+    def close(self):
+        self.pool.shutdown(wait=True)
+        self.cache.clear()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+def serve(socket_path=SOCKET_PATH, max_datasets=MAX_DATASETS):
+    """Daemon'u ön planda çalıştır (Ctrl+C ya da `stop` ile durur)"""
+    import asyncio
+    daemon = Daemon(socket_path, max_datasets)
+    try:
+        asyncio.run(daemon.serve_forever())
+    except KeyboardInterrupt:
+        print("\n👋 SGS daemon durduruldu")
+
+
+def main(args):
+    """sgs daemon [start|stop|status|serve] [--socket yol]"""
+    socket_path = SOCKET_PATH
+    if '--socket' in args:
+        i = args.index('--socket')
+        if i + 1 < len(args):
+            socket_path = args[i + 1]
+            args = args[:i] + args[i + 2:]
+    action = args[0] if args else 'status'
+
+    if action == 'serve':
+        serve(socket_path)
+    elif action == 'start':
+        begin = time.perf_counter()
+        if not start(socket_path):
+            print(f"❌ Daemon başlatılamadı (günlük: {socket_path}.log)")
+            return 1
+        info = call('ping', socket_path=socket_path)
+        print(f"🔌 SGS daemon hazır: pid {info['pid']} ({(time.perf_counter() - begin) * 1000:.0f} ms)")
+    elif action == 'stop':
+        response = call('stop', socket_path=socket_path)
+        print(response['output'].rstrip() if response else "ℹ️ Daemon çalışmıyor")
+    elif action == 'status':
+        info = call('ping', socket_path=socket_path)
+        if info is None:
+            print("ℹ️ Daemon çalışmıyor")
+            return 1
+        print(f"🔌 pid {info['pid']}, {info['uptime']} sn, {info['requests']} istek - {socket_path}")
+        for key in info['warm']:
+            print(f"   🔥 {key}")
+    else:
+        print("Kullanım: python sgs_daemon.py [start|stop|status|serve] [--socket yol]")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
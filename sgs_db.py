@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS DB - Ortak SQLite erişim katmanı
+Analizler veritabanını salt okunur (URI mode=ro) bağlantı havuzundan okur:
+bağlantılar süreç başına bir kez açılır ve ayarlanır (mmap_size, cache_size,
+query_only), iş parçacıkları arasında ödünç verilir. Veritabanı WAL modundaysa
+okumalar veri yazılırken de bloklanmadan sürer.
+
+prepare() bir kez çalıştırılır: WAL modunu açar ve *_loglar tablolarına önerilen
+indeksleri (Kategori, Fiyat, Ürün Adı, güncel görüntülenme) ekler.
+
+Her sorgu için çağrı sayısı, süre (execute + fetch) ve satır sayısı tutulur.
+
+Kullanım:
+import sgs_db
+with sgs_db.connect('sales.db') as conn:
+    df = sgs_loader.read_sql("SELECT * FROM tuzla_loglar", conn)
+sgs_db.pool('sales.db').print_stats()
+
+python sgs_db.py sales.db --prepare   (WAL + indeksler)
+python sgs_db.py sales.db             (indeks durumu)
+"""
+
+import os
+import time
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from urllib.parse import quote
+
+POOL_SIZE = 4
+BUSY_TIMEOUT_MS = 5000
+PRAGMAS = {
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64 * 1024,       # KiB cinsinden: 64 MB sayfa önbelleği
+    'temp_store': 'MEMORY',
+}
+BRANCH_SUFFIX = '_loglar'
+VIEW_COL = 'GÜNCEL DÖNEM GÖRÜNTÜLEME (02.09-08.09)'
+INDEX_COLUMNS = ('Kategori', 'Fiyat', 'Ürün Adı', VIEW_COL)
+
+
+def _q(name):
+    """SQL tanımlayıcısını tırnakla"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _sql_key(sql):
+    return ' '.join(str(sql).split())[:120]
+
+
+class QueryStats:
+    """Sorgu başına sayaçlar: çağrı, süre, satır"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.queries = {}
+
+    def add(self, key, seconds, rows=0, call=False):
+        with self._lock:
+            entry = self.queries.setdefault(key, {'calls': 0, 'seconds': 0.0, 'rows': 0})
+            entry['calls'] += call
+            entry['seconds'] += seconds
+            entry['rows'] += rows
+
+    def snapshot(self):
+        """Süreye göre sıralı kopya - [{sql, calls, seconds, rows}]"""
+        with self._lock:
+            rows = [{'sql': key, **entry} for key, entry in self.queries.items()]
+        return sorted(rows, key=lambda row: -row['seconds'])
+
+    def reset(self):
+        with self._lock:
+            self.queries.clear()
+
+
+class _TimedCursor(sqlite3.Cursor):
+    """execute ve fetch sürelerini bağlantının sayaçlarına yazan imleç"""
+
+    _key = None
+
+    def _add(self, start, rows=0, call=False):
+        stats = getattr(self.connection, 'stats', None)
+        if stats is not None and self._key is not None:
+            stats.add(self._key, time.perf_counter() - start, rows, call)
+
+    def execute(self, sql, parameters=()):
+        start = time.perf_counter()
+        self._key = _sql_key(sql)
+        super().execute(sql, parameters)
+        self._add(start, call=True)
+        return self
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._add(start, rows=row is not None)
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._add(start, rows=len(rows))
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._add(start, rows=len(rows))
+        return rows
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._add(start)
+            raise
+        self._add(start, rows=1)
+        return row
+
+
+class PooledConnection(sqlite3.Connection):
+    """Sorguları sayan bağlantı (conn.execute dahil)"""
+
+    stats = None
+
+    def cursor(self, factory=_TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        # sqlite3.Connection.execute cursor() fabrikasını kullanmaz
+        return self.cursor().execute(sql, parameters)
+
+
+def file_version(db_path):
+    """Veritabanı ve WAL dosyasının (boyut, mtime) imzası - WAL'a yazılan veri ana dosyayı değiştirmez"""
+    version = []
+    for suffix in ('', '-wal'):
+        try:
+            stat = os.stat(db_path + suffix)
+            version.append((stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            version.append(None)
+    return tuple(version)
+
+
+def _uri(db_path, readonly):
+    path = quote(os.path.abspath(db_path))
+    return f"file:{path}?mode={'ro' if readonly else 'rw'}"
+
+
+def open_connection(db_path, readonly=True, stats=None):
+    """Ayarlanmış tek bağlantı - dosya yoksa sqlite3.OperationalError (boş veritabanı yaratılmaz)"""
+    conn = sqlite3.connect(_uri(db_path, readonly), uri=True, factory=PooledConnection,
+                           check_same_thread=False, timeout=BUSY_TIMEOUT_MS / 1000)
+    for name, value in PRAGMAS.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+    if readonly:
+        conn.execute("PRAGMA query_only = ON")
+    conn.stats = stats
+    return conn
+
+
+class ConnectionPool:
+    """Bir veritabanı için salt okunur bağlantı havuzu
+
+    En fazla size bağlantı açılır; hepsi kullanımdaysa biri geri verilene kadar beklenir.
+    """
+
+    def __init__(self, db_path, size=POOL_SIZE, readonly=True):
+        self.db_path = db_path
+        self.size = size
+        self.readonly = readonly
+        self.stats = QueryStats()
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                conn = open_connection(self.db_path, self.readonly, self.stats)
+                self._opened += 1
+                return conn
+        return self._idle.get()
+
+    def _release(self, conn):
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """with pool.connection() as conn: ..."""
+        conn = self._acquire()
+        try:
+            yield conn
+        except BaseException:
+            # Hatalı durumdaki bağlantı havuza dönmez
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+            raise
+        else:
+            self._release(conn)
+
+    def close(self):
+        """Boştaki bağlantıları kapat"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+
+    def print_stats(self, limit=10):
+        """En uzun süren sorgular"""
+        rows = self.stats.snapshot()
+        if not rows:
+            return
+        print(f"\n🗄️ SQL SÜRELERİ ({os.path.basename(self.db_path)}):")
+        for row in rows[:limit]:
+            print(f"   {row['seconds'] * 1000:8.1f} ms  {row['calls']:4d}×  {row['rows']:>9,} satır  {row['sql']}")
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def pool(db_path, readonly=True):
+    """Süreç başına paylaşılan havuz (fork sonrası alt süreç kendi havuzunu açar)"""
+    key = (os.getpid(), os.path.abspath(db_path), readonly)
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(db_path, readonly=readonly)
+        return _pools[key]
+
+
+@contextmanager
+def connect(db_path, readonly=True):
+    """Havuzdan bağlantı ödünç al - sqlite3.connect yerine"""
+    with pool(db_path, readonly).connection() as conn:
+        yield conn
+
+
+def close_all():
+    """Bu süreçteki tüm havuzları kapat"""
+    with _pools_lock:
+        pools = [p for key, p in _pools.items() if key[0] == os.getpid()]
+    for p in pools:
+        p.close()
+
+
+def branch_tables(conn):
+    """*_loglar tabloları (oluşturulma sırasıyla)"""
+    # LIKE '%_loglar' kullanılmaz: '_' tek karakter joker karakteridir ('kataloglar' eşleşir)
+    rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY rowid")
+    return [name for (name,) in rows if name.endswith(BRANCH_SUFFIX) and len(name) > len(BRANCH_SUFFIX)]
+
+
+def _index_name(table, column):
+    slug = ''.join(ch if ch.isalnum() else '_' for ch in column.lower())[:24].strip('_')
+    return f"idx_{table}_{slug}"
+
+
+def recommended_indexes(conn):
+    """[(indeks, tablo, sütun)] - tabloda bulunan önerilen sütunlar"""
+    indexes = []
+    for table in branch_tables(conn):
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({_q(table)})")}
+        indexes += [(_index_name(table, col), table, col) for col in INDEX_COLUMNS if col in columns]
+    return indexes
+
+
+def prepare(db_path, wal=True, indexes=True):
+    """WAL modunu aç ve önerilen indeksleri oluştur - oluşturulan indeks adları"""
+    created = []
+    conn = sqlite3.connect(_uri(db_path, readonly=False), uri=True, timeout=BUSY_TIMEOUT_MS / 1000)
+    try:
+        if wal:
+            conn.execute("PRAGMA journal_mode = WAL")
+        if indexes:
+            existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            for name, table, column in recommended_indexes(conn):
+                if name not in existing:
+                    conn.execute(f"CREATE INDEX {_q(name)} ON {_q(table)} ({_q(column)})")
+                    created.append(name)
+            if created:
+                conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+    return created
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Kullanım: python sgs_db.py sales.db [--prepare]")
+        sys.exit(1)
+
+    db = sys.argv[1]
+    if '--prepare' in sys.argv:
+        start = time.perf_counter()
+        created = prepare(db)
+        print(f"🗄️ WAL açık, {len(created)} indeks oluşturuldu ({(time.perf_counter() - start) * 1000:.0f} ms)")
+        for name in created:
+            print(f"   • {name}")
+    else:
+        with connect(db) as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            print(f"🗄️ {db}: journal_mode={mode}")
+            for name, table, column in recommended_indexes(conn):
+                print(f"   {'✅' if name in existing else '❌'} {table}.{column}")
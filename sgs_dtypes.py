@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS Dtypes - Yükleme anında bellek dostu sütun tipleri
+
+- Az farklı değerli metin (Kategori, Foto Durumu, Güncel Badge...) → category
+- Evet/Hayır sütunları → category (varsayılan) veya bool (flags='bool')
+- Tam sayılar → int32 (değerler ±2^30 içindeyse)
+- Ondalıklar → float32 (sadece floats=True ve kayıpsızsa)
+
+Kategoriler ilk görülme sırasında tutulur; value_counts() eşitlikleri ve
+unique() sırası metin sütunundakiyle aynı kalır.
+
+Evet/Hayır için varsayılan category: bellekte bool ile aynı (1 bayt) ve
+mevcut `df['Foto Durumu'] == 'Hayır'` karşılaştırmaları çalışmaya devam eder.
+Tam sayılar int32'nin altına inmez ve ±2^30 sınırı toplama/çıkarma için pay
+bırakır (toplamlar pandas'ta zaten int64 biriktirilir); iki sütunun çarpımı
+için widen() kullanılır. float32 ortalama ve toplamları float32'de
+biriktirdiği için rapor çıktısı değişebilir; bu yüzden isteğe bağlıdır.
+
+Kullanım:
+import sgs_dtypes
+df, report = sgs_dtypes.optimize_with_report(df)
+sgs_dtypes.print_report(report)
+
+python sgs_dtypes.py dosya.xlsx   (bellek raporu)
+"""
+
+import sys
+import numpy as np
+import pandas as pd
+
+CATEGORY_MAX_RATIO = 0.5
+CATEGORY_MIN_ROWS = 32
+INT_LIMIT = 2 ** 30
+YES_NO = {'Evet', 'Hayır'}
+
+
+def _is_text(series):
+    return pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)
+
+
+def _as_category(series, values):
+    """İlk görülme sırasıyla kategorik sütun"""
+    return pd.Series(pd.Categorical(series, categories=values), index=series.index, name=series.name)
+
+
+def _optimize_text(series, flags):
+    """Metin sütunu: category / bool / olduğu gibi"""
+    valid = series.dropna()
+    if len(valid) == 0:
+        return series
+
+    # Karışık tipli (metin + sayı) sütunlar dokunulmadan kalır
+    if pd.api.types.is_object_dtype(series.dtype) and not all(isinstance(v, str) for v in valid.head(1000)):
+        return series
+
+    values = valid.unique()
+    if set(values) <= YES_NO:
+        if flags == 'bool' and len(valid) == len(series):
+            return series == 'Evet'
+        return _as_category(series, values)
+
+    if len(series) >= CATEGORY_MIN_ROWS and len(values) <= len(series) * CATEGORY_MAX_RATIO:
+        return _as_category(series, values)
+    return series
+
+
+def _optimize_numeric(series, floats):
+    """Sayısal sütunu kayıpsız küçült"""
+    kind = series.dtype.kind
+    if kind in 'iu' and series.dtype.itemsize > 4:
+        if len(series) == 0 or (series.min() > -INT_LIMIT and series.max() < INT_LIMIT):
+            return series.astype('int32')
+    elif kind == 'f' and floats and series.dtype.itemsize > 4:
+        narrow = series.astype('float32')
+        if np.array_equal(narrow.to_numpy(dtype='float64'), series.to_numpy(), equal_nan=True):
+            return narrow
+    return series
+
+
+def widen(series):
+    """Çarpım öncesi int32 sütunu int64'e genişlet (taşmayı önler)"""
+    if series.dtype.kind in 'iu' and series.dtype.itemsize < 8:
+        return series.astype('int64')
+    return series
+
+
+def optimize_dtypes(df, flags='category', floats=False):
+    """Sütun tiplerini küçült - yeni DataFrame döndürür"""
+    if df is None or len(df.columns) == 0:
+        return df
+
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series, pd.DataFrame):
+            # Tekrarlanan sütun adları: dokunma
+            return df
+        if _is_text(series):
+            columns[col] = _optimize_text(series, flags)
+        elif pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+            columns[col] = _optimize_numeric(series, floats)
+        else:
+            columns[col] = series
+
+    result = pd.DataFrame(columns, index=df.index)
+    result.columns = df.columns
+    result.attrs = dict(df.attrs)
+    return result
+
+
+def memory_report(before, after):
+    """Sütun başına tip ve bellek değişimi"""
+    old = before.memory_usage(index=False, deep=True)
+    new = after.memory_usage(index=False, deep=True)
+    columns = {
+        col: {
+            'before_dtype': str(before[col].dtype),
+            'after_dtype': str(after[col].dtype),
+            'before_bytes': int(old[col]),
+            'after_bytes': int(new[col])
+        }
+        for col in before.columns
+    }
+    total_before, total_after = int(old.sum()), int(new.sum())
+    return {
+        'rows': len(before),
+        'before_bytes': total_before,
+        'after_bytes': total_after,
+        'ratio': total_before / total_after if total_after else 1.0,
+        'columns': columns
+    }
+
+
+def optimize_with_report(df, flags='category', floats=False):
+    """(optimize edilmiş DataFrame, bellek raporu)"""
+    optimized = optimize_dtypes(df, flags=flags, floats=floats)
+    return optimized, memory_report(df, optimized)
+
+
+def print_report(report):
+    """Bellek raporunu yazdır"""
+    mb = 1024 * 1024
+    print(f"🧮 {report['rows']} satır: {report['before_bytes'] / mb:.2f} MB → "
+          f"{report['after_bytes'] / mb:.2f} MB ({report['ratio']:.1f}x)")
+    for col, info in report['columns'].items():
+        if info['before_dtype'] != info['after_dtype']:
+            print(f"   {col:<45} {info['before_dtype']:>8} → {info['after_dtype']:<8} "
+                  f"{info['before_bytes'] / mb:8.2f} → {info['after_bytes'] / mb:.2f} MB")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Kullanım:")
+        print("  python sgs_dtypes.py dosya.xlsx|dosya.csv [--bool] [--float32]")
+        sys.exit(1)
+
+    file_path = sys.argv[1]
+    raw = pd.read_csv(file_path) if file_path.endswith('.csv') else pd.read_excel(file_path)
+    _, report = optimize_with_report(raw, flags='bool' if '--bool' in sys.argv else 'category',
+                                     floats='--float32' in sys.argv)
+    print_report(report)
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS Incremental - Log tabloları için artımlı analiz
+Her tablo için son işlenen rowid (ve o satırın hash'i) ile birleştirilebilir
+toplamlar bir JSON durum dosyasında saklanır. Sonraki çalıştırmada sadece
+yeni eklenen satırlar okunur ve toplamlara eklenir.
+
+Watermark satırı değişmiş ya da silinmişse (tablo yeniden yazılmış), watermark'a
+kadarki satır sayısı değişmişse (önceki satırlardan biri silinmiş) veya şema
+değişmişse durum sıfırlanır ve tablo baştan taranır. Satır sayısını
+değiştirmeyen eski satır güncellemeleri yakalanmaz.
+
+Kullanım:
+import sqlite3, sgs_incremental
+conn = sqlite3.connect('sales.db')
+stats, new_rows = sgs_incremental.refresh(conn, 'tuzla_loglar', 'sales.db.sgs_state.json')
+stats.top_performers()
+"""
+
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+import sgs_profile
+import sgs_loader
+
+VIEW_COL = 'GÜNCEL DÖNEM GÖRÜNTÜLEME (02.09-08.09)'
+PREV_COL = 'BİR ÖNCEKİ DÖNEM GÖRÜNTÜLEME (26.08 - 01.09)'
+NAME_COL = 'Ürün Adı'
+# TableAggregates.update'in kullandığı sütunlar - tablo sadece bunlarla okunabilir
+COLUMNS = (NAME_COL, 'Fiyat', VIEW_COL, PREV_COL, 'Kategori', 'Foto Durumu')
+
+TOP_K = 5
+ALERT_PRODUCTS = 10
+STATE_VERSION = 1
+
+
+def _num(value):
+    """numpy sayısını JSON'a yazılabilir Python sayısına çevir"""
+    if value is None or pd.isna(value):
+        return None
+    value = value.item() if hasattr(value, 'item') else value
+    return int(value) if isinstance(value, (bool, np.bool_)) else value
+
+
+def _merge_top(current, candidates, key, k=TOP_K, ascending=False):
+    """İlk-k listesini birleştir; eşitlikte eski satır önde (nlargest keep='first')"""
+    merged = current + candidates
+    merged.sort(key=lambda row: row[key] if ascending else -row[key])
+    return merged[:k]
+
+
+class TableAggregates:
+    """Bir log tablosu için birleştirilebilir toplamlar"""
+
+    def __init__(self):
+        self.rows = 0
+        self.columns = []
+        self.price_sum = 0.0
+        self.price_count = 0
+        self.price_min = None
+        self.price_max = None
+        self.views = 0.0
+        self.views_prev = 0.0
+        self.categories = {}
+        self.photo_missing = 0
+        self.photo_missing_names = []
+        self.top_views = []
+        self.top_value = []
+        self.rising = []
+        self.falling = []
+        self.trend_counts = {'rising': 0, 'falling': 0, 'stable': 0}
+
+    def update(self, df):
+        """Yeni satırları toplamlara ekle"""
+        if len(df) == 0:
+            return self
+
+        self.columns += [col for col in df.columns if col != '_rowid' and col not in self.columns]
+        self.rows += len(df)
+        names = df[NAME_COL] if NAME_COL in df.columns else pd.Series(df.index.astype(str), index=df.index)
+
+        if 'Fiyat' in df.columns:
+            prices = df['Fiyat']
+            if prices.count():
+                self.price_sum += float(prices.sum())
+                self.price_count += int(prices.count())
+                low, high = float(prices.min()), float(prices.max())
+                self.price_min = low if self.price_min is None else min(self.price_min, low)
+                self.price_max = high if self.price_max is None else max(self.price_max, high)
+
+        if VIEW_COL in df.columns:
+            views = df[VIEW_COL]
+            self.views += float(views.sum())
+            top = views.dropna().nlargest(TOP_K)
+            self.top_views = _merge_top(self.top_views,
+                                        [[names.at[i], _num(v)] for i, v in top.items()], 1)
+
+            if 'Fiyat' in df.columns:
+                value = (views / (df['Fiyat'] + 1)).dropna().nlargest(TOP_K)
+                self.top_value = _merge_top(self.top_value,
+                                            [[names.at[i], _num(df.at[i, 'Fiyat']), _num(v)] for i, v in value.items()], 2)
+
+        if PREV_COL in df.columns:
+            self.views_prev += float(df[PREV_COL].sum())
+
+        if VIEW_COL in df.columns and PREV_COL in df.columns:
+            trend = (((df[VIEW_COL] - df[PREV_COL]) / (df[PREV_COL] + 1)) * 100).dropna()
+            rising = trend[trend > 20]
+            falling = trend[trend < -20]
+            self.rising = _merge_top(self.rising,
+                                     [[names.at[i], _num(v)] for i, v in rising.nlargest(TOP_K).items()], 1)
+            self.falling = _merge_top(self.falling,
+                                      [[names.at[i], _num(v)] for i, v in falling.nsmallest(TOP_K).items()], 1,
+                                      ascending=True)
+            self.trend_counts['rising'] += len(rising)
+            self.trend_counts['falling'] += len(falling)
+            self.trend_counts['stable'] += len(trend) - len(rising) - len(falling)
+
+        if 'Kategori' in df.columns:
+            parts = pd.DataFrame({
+                'rows': 1,
+                'names': names.notna().astype(int),
+                'view_sum': df[VIEW_COL] if VIEW_COL in df.columns else np.nan,
+                'view_count': df[VIEW_COL].notna().astype(int) if VIEW_COL in df.columns else 0,
+                'price_sum': df['Fiyat'] if 'Fiyat' in df.columns else np.nan,
+                'price_count': df['Fiyat'].notna().astype(int) if 'Fiyat' in df.columns else 0
+            }, index=df.index).groupby(df['Kategori'].astype(object), sort=False).sum()
+
+            for category, row in parts.iterrows():
+                entry = self.categories.setdefault(str(category), dict.fromkeys(parts.columns, 0))
+                for field, value in row.items():
+                    entry[field] += _num(value) or 0
+
+        if 'Foto Durumu' in df.columns:
+            missing = names[df['Foto Durumu'] == 'Hayır']
+            self.photo_missing += len(missing)
+            room = ALERT_PRODUCTS - len(self.photo_missing_names)
+            if room > 0:
+                self.photo_missing_names += missing.head(room).tolist()
+
+        return self
+
+    def has(self, *columns):
+        """Tabloda bu sütunlar var mı"""
+        return all(col in self.columns for col in columns)
+
+    def avg_price(self):
+        """Ortalama fiyat"""
+        return self.price_sum / self.price_count if self.price_count else np.nan
+
+    def top_performers(self):
+        """En çok görüntülenen 5 ürün - kayıt listesi"""
+        return [{NAME_COL: name, VIEW_COL: views} for name, views in self.top_views]
+
+    def best_value(self):
+        """En iyi fiyat-performans 5 ürün - kayıt listesi"""
+        return [{NAME_COL: name, 'Fiyat': price, 'fiyat_performans': fp} for name, price, fp in self.top_value]
+
+    def trend_records(self, direction):
+        """Yükselen/düşen ilk 5 ürün - kayıt listesi"""
+        rows = self.rising if direction == 'rising' else self.falling
+        return [{NAME_COL: name, 'trend_değişim': trend} for name, trend in rows]
+
+    def category_performance(self):
+        """Kategori başına ortalama görüntülenme/fiyat ve ürün sayısı (kategoriye göre sıralı)"""
+        result = {}
+        for category in sorted(self.categories):
+            entry = self.categories[category]
+            result[category] = {
+                'Ort_Görüntülenme': float(np.round(entry['view_sum'] / entry['view_count'], 2)) if entry['view_count'] else np.nan,
+                'Ort_Fiyat': float(np.round(entry['price_sum'] / entry['price_count'], 2)) if entry['price_count'] else np.nan,
+                'Ürün_Sayısı': int(entry['names'])
+            }
+        return result
+
+    def branch_summary(self):
+        """sgs_branches özet formatı (şube kimliği olmadan - sgs_branches.stats_summary)"""
+        summary = {'rows': self.rows}
+        if self.price_count:
+            summary.update({'avg_price': self.avg_price(), 'min_price': self.price_min, 'max_price': self.price_max})
+        if self.has(VIEW_COL):
+            summary['views'] = self.views
+            if self.top_views:
+                name, views = self.top_views[0]
+                summary['top_product'] = (name, float(views))
+        if self.has(PREV_COL):
+            summary['views_prev'] = self.views_prev
+        if self.has('Foto Durumu'):
+            summary['photo_missing'] = self.photo_missing
+        if self.categories:
+            counts = {category: entry['rows'] for category, entry in self.categories.items()}
+            summary['categories'] = dict(sorted(counts.items(), key=lambda item: -item[1]))
+        return summary
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data):
+        aggregates = cls()
+        aggregates.__dict__.update(data)
+        return aggregates
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def table_schema(conn, table):
+    """sqlite_master'daki CREATE ifadesi"""
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+    return row[0] if row else None
+
+
+def rows_through(conn, table, rowid):
+    """rowid <= watermark olan satır sayısı"""
+    return conn.execute(f"SELECT COUNT(*) FROM {_quote(table)} WHERE rowid <= ?", (rowid,)).fetchone()[0]
+
+
+def row_hash(conn, table, rowid):
+    """Watermark satırının hash'i - satır yoksa None"""
+    row = conn.execute(f"SELECT * FROM {_quote(table)} WHERE rowid = ?", (rowid,)).fetchone()
+    if row is None:
+        return None
+    return hashlib.blake2b(repr(row).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def load_state(state_path):
+    """Durum dosyasını oku - yoksa boş"""
+    try:
+        with open(state_path, encoding='utf-8') as f:
+            state = json.load(f)
+        return state if state.get('version') == STATE_VERSION else {'version': STATE_VERSION, 'tables': {}}
+    except (OSError, ValueError):
+        return {'version': STATE_VERSION, 'tables': {}}
+
+
+def save_state(state_path, state):
+    """Durum dosyasını atomik yaz"""
+    tmp_path = f"{state_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, default=_num)
+    os.replace(tmp_path, state_path)
+
+
+def refresh(conn, table, state_path):
+    """Tablonun toplamlarını sadece yeni satırlarla güncelle
+
+    Döndürür: (TableAggregates, yeni satırlar DataFrame'i)
+    """
+    state = load_state(state_path)
+    entry = state['tables'].get(table)
+    schema = table_schema(conn, table)
+
+    valid = (
+        entry is not None
+        and entry['schema'] == schema
+        and row_hash(conn, table, entry['last_rowid']) == entry['last_row_hash']
+        and rows_through(conn, table, entry['last_rowid']) == entry.get('row_count')
+    )
+    if valid:
+        aggregates = TableAggregates.from_dict(entry['aggregates'])
+        last_rowid = entry['last_rowid']
+    else:
+        # İlk çalıştırma veya tablo yeniden yazılmış: baştan tara
+        aggregates = TableAggregates()
+        last_rowid = 0
+
+    new_rows = sgs_loader.read_sql(
+        f'SELECT rowid AS "_rowid", * FROM {_quote(table)} WHERE rowid > ? ORDER BY rowid',
+        conn, params=(last_rowid,)
+    )
+    with sgs_profile.span(f"aggregate {table}", 'compute', rows=len(new_rows)):
+        aggregates.update(new_rows)
+
+    if len(new_rows) > 0:
+        last_rowid = int(new_rows['_rowid'].iloc[-1])
+    elif not valid:
+        # Boş tablo: watermark satırı yok
+        last_rowid = 0
+
+    state['tables'][table] = {
+        'schema': schema,
+        'last_rowid': last_rowid,
+        'last_row_hash': row_hash(conn, table, last_rowid),
+        'row_count': aggregates.rows,
+        'aggregates': aggregates.to_dict()
+    }
+    save_state(state_path, state)
+
+    return aggregates, new_rows.drop(columns=['_rowid'])
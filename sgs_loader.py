@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS Loader - Ortak Excel/CSV yükleyici
+Dosyayı bir kez ayrıştırır, sonraki okumaları Parquet kopyasından yapar
+
+Önbellek anahtarı: dosya yolu + boyut + değişiklik zamanı + içerik hash'i.
+Okunan tablolar sgs_dtypes ile küçültülür (optimize=False ile kapatılır);
+Parquet kopyası küçültülmüş tipleri saklar.
+Önbellek klasörü boyut sınırını aşarsa en uzun süredir kullanılmayan
+kopyalar silinir (LRU).
+
+Kullanım:
+import sgs_loader
+df = sgs_loader.read_excel('image-table-cs.xlsx')   # ilk okuma: openpyxl
+df = sgs_loader.read_excel('image-table-cs.xlsx')   # sonraki: Parquet (ms)
+"""
+
+import os
+import json
+import hashlib
+import pandas as pd
+import sgs_profile
+import sgs_dtypes
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+CACHE_DIR = os.environ.get('SGS_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.sgs_cache'))
+CACHE_MAX_BYTES = int(os.environ.get('SGS_CACHE_MAX_MB', '512')) * 1024 * 1024
+
+_HASH_BLOCK = 1024 * 1024
+_fingerprints = {}
+
+
+def file_fingerprint(file_path):
+    """Dosya parmak izi: yol + boyut + mtime + içerik hash'i"""
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    stat_key = (path, stat.st_size, stat.st_mtime_ns)
+
+    # Aynı süreçte aynı dosyayı iki kez hash'leme
+    if stat_key in _fingerprints:
+        return _fingerprints[stat_key]
+
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b''):
+            digest.update(block)
+
+    fingerprint = {
+        'path': path,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'hash': digest.hexdigest()
+    }
+    _fingerprints[stat_key] = fingerprint
+    return fingerprint
+
+
+def _sidecar_paths(file_path, variant, suffix):
+    """(kaynak önek, tam sidecar yolu) döndür"""
+    fingerprint = file_fingerprint(file_path)
+    source_key = json.dumps([fingerprint['path'], variant], sort_keys=True, default=str)
+    prefix = hashlib.blake2b(source_key.encode('utf-8'), digest_size=8).hexdigest()
+    version = hashlib.blake2b(json.dumps(fingerprint, sort_keys=True).encode('utf-8'), digest_size=8).hexdigest()
+    return prefix, os.path.join(CACHE_DIR, f"{prefix}-{version}{suffix}")
+
+
+def _touch(path):
+    """LRU için son kullanım zamanını güncelle"""
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+
+def _drop_stale(prefix, keep_path):
+    """Aynı kaynağın eski sürümlerine ait kopyaları sil"""
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        if name.startswith(prefix + '-') and path != keep_path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _evict(max_bytes=None):
+    """Toplam boyut sınırı aşılırsa en eski kullanılan kopyaları sil"""
+    max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    if not os.path.isdir(CACHE_DIR):
+        return
+
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def _cached_read(file_path, reader, variant, use_cache):
+    """Parquet kopyası varsa onu oku, yoksa ayrıştır ve kopyayı yaz"""
+    with sgs_profile.span(f"read {os.path.basename(file_path)}", 'io', sheet=variant.get('sheet')) as s:
+        df, s.args['source'] = _read_through(file_path, reader, variant, use_cache)
+        s.rows = len(df)
+    return df
+
+
+def _read_through(file_path, reader, variant, use_cache):
+    """(DataFrame, 'parquet' | 'kaynak') döndür"""
+    if not (use_cache and PARQUET_AVAILABLE):
+        return reader(), 'kaynak'
+
+    try:
+        prefix, sidecar = _sidecar_paths(file_path, variant, '.parquet')
+    except OSError:
+        return reader(), 'kaynak'
+
+    if os.path.exists(sidecar):
+        try:
+            df = pd.read_parquet(sidecar)
+            _touch(sidecar)
+            return df, 'parquet'
+        except Exception:
+            # Bozuk kopya: kaynaktan yeniden oku
+            pass
+
+    df = reader()
+
+    tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_parquet(tmp_path, index=True)
+        os.replace(tmp_path, sidecar)
+        _drop_stale(prefix, sidecar)
+        _evict()
+    except Exception:
+        # Parquet'e yazılamayan veri (karışık tipli sütunlar vb.) önbelleksiz kalır
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    return df, 'kaynak'
+
+
+def _optimized(df, optimize):
+    return sgs_dtypes.optimize_dtypes(df) if optimize else df
+
+
+def read_excel(file_path, sheet_name=0, use_cache=True, optimize=True, **kwargs):
+    """pd.read_excel yerine - önbellekli, küçültülmüş tiplerle"""
+    if sheet_name is None or isinstance(sheet_name, list):
+        # Çoklu sheet sözlüğü önbelleklenmez
+        frames = pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
+        return {sheet: _optimized(df, optimize) for sheet, df in frames.items()}
+
+    variant = {'reader': 'excel', 'sheet': sheet_name, 'optimize': optimize, 'kwargs': kwargs}
+    return _cached_read(file_path,
+                        lambda: _optimized(pd.read_excel(file_path, sheet_name=sheet_name, **kwargs), optimize),
+                        variant, use_cache)
+
+
+def read_csv(file_path, use_cache=True, optimize=True, **kwargs):
+    """pd.read_csv yerine - önbellekli, küçültülmüş tiplerle"""
+    variant = {'reader': 'csv', 'optimize': optimize, 'kwargs': kwargs}
+    return _cached_read(file_path, lambda: _optimized(pd.read_csv(file_path, **kwargs), optimize),
+                        variant, use_cache)
+
+
+def read_sql(sql, conn, optimize=True, **kwargs):
+    """pd.read_sql yerine - küçültülmüş tiplerle, profil aktifse SQL span'i olarak ölçülür"""
+    with sgs_profile.span(f"sql {' '.join(sql.split())[:60]}", 'sql') as s:
+        df = _optimized(pd.read_sql(sql, conn, **kwargs), optimize)
+        s.rows = len(df)
+    return df
+
+
+def read_excel_sheets(file_path, sheets, use_cache=True, optimize=True, **kwargs):
+    """Birden fazla sheet'i tek workbook açılışıyla oku - {sheet: DataFrame}"""
+    with sgs_profile.span(f"read {os.path.basename(file_path)} ({len(sheets)} sheet)", 'io') as s:
+        frames = _read_sheets(file_path, sheets, use_cache, optimize, **kwargs)
+        s.rows = sum(len(df) for df in frames.values())
+    return frames
+
+
+def _read_sheets(file_path, sheets, use_cache, optimize, **kwargs):
+    frames = {}
+    missing = []
+
+    for sheet in sheets:
+        variant = {'reader': 'excel', 'sheet': sheet, 'optimize': optimize, 'kwargs': kwargs}
+        if use_cache and PARQUET_AVAILABLE:
+            try:
+                _, sidecar = _sidecar_paths(file_path, variant, '.parquet')
+                frames[sheet] = pd.read_parquet(sidecar)
+                _touch(sidecar)
+                continue
+            except Exception:
+                pass
+        missing.append(sheet)
+
+    if missing:
+        # Önbellekte olmayanlar tek ExcelFile üzerinden ayrıştırılır
+        with pd.ExcelFile(file_path) as xl_file:
+            for sheet in missing:
+                variant = {'reader': 'excel', 'sheet': sheet, 'optimize': optimize, 'kwargs': kwargs}
+                frames[sheet] = _cached_read(file_path,
+                                             lambda: _optimized(xl_file.parse(sheet_name=sheet, **kwargs), optimize),
+                                             variant, use_cache)
+
+    return {sheet: frames[sheet] for sheet in sheets}
+
+
+def _cached_json(file_path, variant, compute, use_cache):
+    """Küçük workbook meta verisini JSON kopyasıyla önbellekle"""
+    if not use_cache:
+        return compute()
+
+    try:
+        prefix, sidecar = _sidecar_paths(file_path, variant, '.json')
+    except OSError:
+        return compute()
+
+    try:
+        with open(sidecar, encoding='utf-8') as f:
+            value = json.load(f)
+        _touch(sidecar)
+        return value
+    except (OSError, ValueError):
+        pass
+
+    value = compute()
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(sidecar, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False)
+        _drop_stale(prefix, sidecar)
+        _evict()
+    except OSError:
+        pass
+
+    return value
+
+
+def sheet_names(file_path, use_cache=True):
+    """Excel sayfa isimleri - workbook'u yeniden açmadan"""
+    return _cached_json(file_path, {'reader': 'sheets'},
+                        lambda: pd.ExcelFile(file_path).sheet_names, use_cache)
+
+
+def _read_dimensions(file_path):
+    """Sheet satır sayılarını hücreleri ayrıştırmadan oku"""
+    if file_path.endswith('.xls'):
+        import xlrd
+        book = xlrd.open_workbook(file_path, on_demand=True)
+        try:
+            return {name: book.sheet_by_name(name).nrows for name in book.sheet_names()}
+        finally:
+            book.release_resources()
+
+    from openpyxl import load_workbook
+
+    # read_only modunda max_row, sheet XML'indeki <dimension> kaydından gelir
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sizes = {}
+        for ws in workbook.worksheets:
+            if ws.max_row is None:
+                # <dimension> kaydı olmayan dosyalar: satırları say
+                ws.reset_dimensions()
+                ws.calculate_dimension(force=True)
+            sizes[ws.title] = ws.max_row or 0
+        return sizes
+    finally:
+        workbook.close()
+
+
+def sheet_dimensions(file_path, use_cache=True):
+    """Sheet başına satır sayısı (başlık dahil) - {sheet: satır}"""
+    return _cached_json(file_path, {'reader': 'dimensions'},
+                        lambda: _read_dimensions(file_path), use_cache)
+
+
+def clear_cache():
+    """Tüm önbellek kopyalarını sil"""
+    if not os.path.isdir(CACHE_DIR):
+        return 0
+
+    removed = 0
+    for name in os.listdir(CACHE_DIR):
+        try:
+            os.remove(os.path.join(CACHE_DIR, name))
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) < 2:
+        print("Kullanım:")
+        print("  python sgs_loader.py dosya.xlsx   (önbelleği ısıt)")
+        print("  python sgs_loader.py --clear      (önbelleği temizle)")
+        sys.exit(1)
+
+    if sys.argv[1] == '--clear':
+        print(f"🧹 {clear_cache()} önbellek dosyası silindi")
+    else:
+        for attempt in ('İlk okuma', 'Önbellekten'):
+            start = time.perf_counter()
+            if sys.argv[1].endswith('.csv'):
+                df = read_csv(sys.argv[1])
+            else:
+                df = read_excel(sys.argv[1])
+            print(f"⚡ {attempt}: {len(df)} satır, {(time.perf_counter() - start) * 1000:.0f} ms")
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS Mirror - SQLite tablolarının bellek eşlemeli sütun kopyası
+Her tablo, veritabanının yanındaki <db>.sgs_mirror/<tablo>/ klasörüne sütun
+başına bir .npy dosyası olarak yazılır; sonraki okumalar dosyaları np.load
+(mmap_mode='c') ile eşler, satırlar Python nesnelerine çevrilmez.
+
+- Sayısal / bool / tarih sütunları: .npy (kopyasız eşlenir)
+- Kategorik ve metin sütunları: sözlük kodlaması - kodlar .npy, sözlük JSON
+  (kategorik sütunlar kodlardan kopyasız kurulur, metin sütunları sözlükten açılır)
+
+Tipler sgs_loader.read_sql (sgs_dtypes ile küçültülmüş) ile aynıdır. Kopya
+tablonun imzasıyla (CREATE ifadesi, max(rowid), count(*)) ve veritabanı
+dosyalarının sürümüyle (sgs_db.file_version: db ve -wal boyut/mtime) saklanır;
+her yazma (yerinde UPDATE dahil) ilk okumada kopyayı yeniden üretir. Desteklenmeyen
+sütun tipi (karışık tipli metin vb.) olan tablolar normal read_sql ile okunur.
+SGS_MIRROR=0 ortam değişkeni kopyayı kapatır.
+
+Kullanım:
+import sgs_mirror
+df = sgs_mirror.read_table('sales.db', 'tuzla_loglar')   # ilk okuma: SQLite + kopya
+df = sgs_mirror.read_table('sales.db', 'tuzla_loglar')   # sonraki: mmap (ms)
+
+python sgs_mirror.py sales.db [tablo ...]   (kopyaları üret)
+python sgs_mirror.py sales.db --clear       (kopyaları sil)
+"""
+
+import os
+import json
+import shutil
+import sqlite3
+import numpy as np
+import pandas as pd
+import sgs_db
+import sgs_profile
+import sgs_loader
+
+MIRROR_VERSION = 3
+MIRROR_SUFFIX = '.sgs_mirror'
+META_FILE = 'meta.json'
+ENABLED = os.environ.get('SGS_MIRROR', '1') != '0'
+
+
+def mirror_dir(db_path):
+    """Veritabanının kopya klasörü"""
+    return f"{os.path.abspath(db_path)}{MIRROR_SUFFIX}"
+
+
+def _table_dir(db_path, table):
+    # Tablo adı dosya adı olarak güvenli değilse hex'e çevrilir
+    safe = table if table.replace('_', '').isalnum() else table.encode('utf-8').hex()
+    return os.path.join(mirror_dir(db_path), safe)
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def signature(db_path, table, optimize=True, conn=None):
+    """Kopyanın geçerlilik imzası: dosya sürümü, tablonun CREATE ifadesi, max(rowid), count(*) - tablo yoksa None"""
+    if conn is None:
+        with sgs_db.connect(db_path) as conn:
+            return signature(db_path, table, optimize, conn)
+
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+    if row is None:
+        return None
+    # Dosya sürümü önce alınır: sonrasında yapılan yazma kopyayı geçersiz bırakır.
+    # Boyut/mtime, sayımı değiştirmeyen yerinde UPDATE'leri de yakalar
+    version = [list(part) if part else None for part in sgs_db.file_version(db_path)]
+    # COUNT(*) tablonun b-ağacını tarar (en küçük indeksi kullanır); MAX(rowid) tek başına O(log n)
+    rows = conn.execute(f"SELECT COUNT(*) FROM {_quote(table)}").fetchone()[0]
+    try:
+        max_rowid = conn.execute(f"SELECT MAX(rowid) FROM {_quote(table)}").fetchone()[0]
+    except sqlite3.OperationalError:
+        # WITHOUT ROWID tablo
+        max_rowid = None
+    return {'version': MIRROR_VERSION, 'optimize': optimize, 'file': version, 'schema': row[0],
+            'max_rowid': max_rowid, 'rows': rows}
+
+
+def _column_spec(series, index, out_dir):
+    """Sütunu dosyalara yaz, meta kaydını döndür"""
+    base = os.path.join(out_dir, f"c{index}")
+    dtype = series.dtype
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        np.save(base + '.npy', series.cat.codes.to_numpy())
+        categories = dtype.categories
+        _write_json(base + '.dict.json', categories.tolist())
+        return {'name': series.name, 'kind': 'category', 'ordered': bool(dtype.ordered),
+                'categories_dtype': str(categories.dtype)}
+
+    if pd.api.types.is_string_dtype(dtype) or pd.api.types.is_object_dtype(dtype):
+        valid = series.dropna()
+        if not all(isinstance(value, str) for value in valid):
+            raise ValueError(f"{series.name}: karışık tipli sütun")
+        codes, uniques = pd.factorize(series)
+        np.save(base + '.npy', codes.astype(np.int32 if len(uniques) < 2 ** 31 else np.int64))
+        _write_json(base + '.dict.json', [str(value) for value in uniques])
+        return {'name': series.name, 'kind': 'text', 'dtype': str(dtype)}
+
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biufM':
+        np.save(base + '.npy', series.to_numpy())
+        return {'name': series.name, 'kind': 'array'}
+
+    raise ValueError(f"{series.name}: desteklenmeyen tip {dtype}")
+
+
+def _write_json(path, value):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(value, f, ensure_ascii=False)
+
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_mirror(db_path, table, df, optimize=True, sig=None, complete=True):
+    """DataFrame'i tablonun kopyası olarak yaz (geçici klasör + yeniden adlandırma)
+
+    complete=False: df tablonun sadece bazı sütunlarını içerir
+    """
+    target = _table_dir(db_path, table)
+    tmp_dir = f"{target}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    try:
+        columns = [_column_spec(df[col], i, tmp_dir) for i, col in enumerate(df.columns)]
+        meta = {'table': table, 'rows': len(df), 'columns': columns, 'complete': complete,
+                'signature': sig or signature(db_path, table, optimize)}
+        _write_json(os.path.join(tmp_dir, META_FILE), meta)
+
+        # Eski kopya kenara alınır, yenisi tek rename ile yerine geçer
+        old_dir = f"{target}.{os.getpid()}.old"
+        if os.path.exists(target):
+            os.replace(target, old_dir)
+        try:
+            os.replace(tmp_dir, target)
+        except OSError:
+            # Başka bir süreç aynı anda yazdı - onun kopyası kalır
+            pass
+        shutil.rmtree(old_dir, ignore_errors=True)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return meta
+
+
+def _load_column(spec, index, table_dir):
+    base = os.path.join(table_dir, f"c{index}")
+    # ndarray görünümü: bellek eşlemesi korunur, memmap alt sınıfı pandas'a sızmaz
+    values = np.load(base + '.npy', mmap_mode='c').view(np.ndarray)
+
+    if spec['kind'] == 'array':
+        return values
+
+    dictionary = _read_json(base + '.dict.json')
+    if spec['kind'] == 'category':
+        categories = pd.Index(dictionary, dtype=spec['categories_dtype'])
+        dtype = pd.CategoricalDtype(categories, ordered=spec['ordered'])
+        return pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+
+    # Metin: sözlükten açılır (eksikler -1 kodlu)
+    uniques = pd.array(dictionary + [None], dtype=spec['dtype'])
+    return uniques.take(np.where(values < 0, len(dictionary), values))
+
+
+def _valid_meta(db_path, table, optimize, sig=None):
+    """Tabloyla uyumlu kopyanın meta kaydı, yoksa None (sig verilmezse hesaplanır)"""
+    try:
+        meta = _read_json(os.path.join(_table_dir(db_path, table), META_FILE))
+    except (OSError, ValueError):
+        return None
+    if sig is None:
+        sig = signature(db_path, table, optimize)
+    return meta if sig is not None and meta.get('signature') == sig else None
+
+
+def load_mirror(db_path, table, optimize=True, columns=None, sig=None):
+    """Geçerli kopya varsa DataFrame olarak eşle, yoksa None
+
+    columns: sadece bu sütunların dosyaları eşlenir (tabloda olmayanlar atlanır)
+    sig: önceden alınmış tablo imzası (verilmezse sorgulanır)
+    """
+    meta = _valid_meta(db_path, table, optimize, sig)
+    if meta is None:
+        return None
+
+    specs = list(enumerate(meta['columns']))
+    complete = meta.get('complete', True)
+    if columns is not None:
+        wanted = set(columns)
+        specs = [(i, spec) for i, spec in specs if spec['name'] in wanted]
+        # Eksik kopyada bulunmayan sütun tabloda olabilir: SQLite'tan okunmalı
+        if not complete and len(specs) < len(wanted):
+            return None
+    elif not complete:
+        return None
+
+    table_dir = _table_dir(db_path, table)
+    try:
+        columns = {spec['name']: _load_column(spec, i, table_dir) for i, spec in specs}
+    except (OSError, ValueError):
+        return None
+    return pd.DataFrame(columns, index=pd.RangeIndex(meta['rows']), copy=False)
+
+
+def read_table(db_path, table, conn=None, optimize=True, use_mirror=True, columns=None):
+    """sgs_loader.read_sql("SELECT * FROM tablo") yerine - kopya varsa mmap'ten
+
+    conn verilmezse gerektiğinde sgs_db havuzundan bağlantı alınır.
+    columns: sadece bu sütunlar okunur (tablo sırasıyla; tabloda olmayanlar atlanır)
+    """
+    with sgs_profile.span(f"mirror {table}", 'io') as s:
+        df, s.args['source'] = _read_through(db_path, table, conn, optimize, use_mirror and ENABLED, columns)
+        s.rows = len(df)
+    return df
+
+
+def _select(conn, table, columns, optimize):
+    if columns is None:
+        return sgs_loader.read_sql(f"SELECT * FROM {_quote(table)}", conn, optimize=optimize)
+    wanted = set(columns)
+    names = [row[1] for row in conn.execute(f"PRAGMA table_info({_quote(table)})") if row[1] in wanted]
+    fields = ', '.join(_quote(name) for name in names) or 'NULL AS _bos'
+    df = sgs_loader.read_sql(f"SELECT {fields} FROM {_quote(table)}", conn, optimize=optimize)
+    return df[names]
+
+
+def _read_through(db_path, table, conn, optimize, use_mirror, columns=None):
+    """(DataFrame, 'mmap' | 'sqlite') döndür"""
+    if conn is None:
+        with sgs_db.connect(db_path) as conn:
+            return _read_through(db_path, table, conn, optimize, use_mirror, columns)
+
+    # İmza okumadan önce alınır: okuma sırasında eklenen satırlar kopyayı geçersiz bırakır
+    sig = signature(db_path, table, optimize, conn) if use_mirror else None
+    if sig is not None:
+        df = load_mirror(db_path, table, optimize, columns, sig)
+        if df is not None:
+            return df, 'mmap'
+
+    df = _select(conn, table, columns, optimize)
+
+    # Sütun alt kümesi, geçerli (tam) bir kopyanın üzerine yazılmaz
+    if sig is not None and (columns is None or _valid_meta(db_path, table, optimize, sig) is None):
+        try:
+            write_mirror(db_path, table, df, optimize, sig, complete=columns is None)
+        except (OSError, ValueError):
+            # Yazılamayan kopya (salt okunur klasör, karışık tipler): normal okuma yeterli
+            pass
+    return df, 'sqlite'
+
+
+def export(db_path, tables=None, optimize=True):
+    """Tabloların kopyalarını üret - {tablo: satır sayısı}"""
+    with sgs_db.connect(db_path) as conn:
+        if tables is None:
+            tables = [row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name")]
+        result = {}
+        for table in tables:
+            sig = signature(db_path, table, optimize, conn)
+            df = sgs_loader.read_sql(f"SELECT * FROM {_quote(table)}", conn, optimize=optimize)
+            try:
+                write_mirror(db_path, table, df, optimize, sig)
+                result[table] = len(df)
+            except ValueError as e:
+                print(f"⚠️ {table}: kopyalanamadı ({e})")
+        return result
+
+
+def clear(db_path):
+    """Veritabanının tüm kopyalarını sil"""
+    path = mirror_dir(db_path)
+    if not os.path.isdir(path):
+        return False
+    shutil.rmtree(path, ignore_errors=True)
+    return True
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) < 2:
+        print("Kullanım:")
+        print("  python sgs_mirror.py sales.db [tablo ...]   (kopyaları üret)")
+        print("  python sgs_mirror.py sales.db --clear       (kopyaları sil)")
+        sys.exit(1)
+
+    db = sys.argv[1]
+    if '--clear' in sys.argv:
+        print(f"🧹 Kopyalar {'silindi' if clear(db) else 'bulunamadı'}")
+    else:
+        start = time.perf_counter()
+        exported = export(db, sys.argv[2:] or None)
+        print(f"💾 {len(exported)} tablo kopyalandı ({(time.perf_counter() - start) * 1000:.0f} ms)")
+        for table, rows in exported.items():
+            start = time.perf_counter()
+            read_table(db, table)
+            print(f"⚡ {table}: {rows} satır, mmap okuma {(time.perf_counter() - start) * 1000:.1f} ms")
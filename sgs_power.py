@@ -6,163 +6,392 @@ SGS Power - SQL kadar güçlü, tek komutla!
 Kullanım:
 import sgs_power as sgs
 sgs.analyze()  # Tek komut - SQL kadar detaylı!
+sgs.analyze(pushdown=True)  # Büyük tablolar: hesaplama SQLite içinde
+sgs.analyze(sketch='approx')  # Quantile'lar KLL taslağıyla (sgs_sketch)
+
+python sgs_power.py [--pushdown] [--jobs N] [--threads N] [--timings] [--approx]
 """
 
-import pandas as pd
-import sqlite3
+import sys
 import numpy as np
+import sgs_branches
+import sgs_db
+import sgs_mirror
+import sgs_rules
+import sgs_sketch
+import sgs_topk
+
+VIEW_COL = 'GÜNCEL DÖNEM GÖRÜNTÜLEME (02.09-08.09)'
+PREV_COL = 'BİR ÖNCEKİ DÖNEM GÖRÜNTÜLEME (26.08 - 01.09)'
+
+def _branch_comparison(insights, db_path, jobs, pushdown, main_summary=None, log=print):
+    """Tüm *_loglar şubelerini paralel özetle, karşılaştırma bulgularını ekle"""
+    result = sgs_branches.analyze_branches(db_path, jobs=jobs, pushdown=pushdown,
+                                           main='tuzla', main_summary=main_summary)
+    for summary in result['branches'].values():
+        log(f"   📊 {summary['label']}: {summary['rows']} ürün")
+    insights.extend(sgs_branches.comparison_insights(result['comparison']))
+
+# Pandas yolu bulguları: her kural ihtiyaç duyduğu ara sonuçları bildirir,
+# sgs_rules her birini bir kez hesaplar ve bağımsız kuralları paralel çalıştırır.
+# İlk-k / en büyük-en küçük seçimleri sgs_topk'un sınırlı yığınıyla (O(k) bellek)
+rules = sgs_rules.RuleSet('sgs_power')
+
+@rules.derive('cat_counts')
+def _cat_counts(ctx):
+    return ctx.data['Kategori'].value_counts()
+
+@rules.derive('cat_stats')
+def _cat_stats(ctx):
+    # Kategori başına tek groupby: ürün sayısı, ortalama fiyat ve görüntülenme
+    return ctx.data.groupby('Kategori', observed=True).agg(
+        adet=('Kategori', 'size'), fiyat=('Fiyat', 'mean'), views=(VIEW_COL, 'mean'))
+
+@rules.derive('trend')
+def _trend(ctx):
+    df = ctx.data
+    return ((df[VIEW_COL] - df[PREV_COL]) / (df[PREV_COL] + 1)) * 100
+
+@rules.derive('fiyat_performans')
+def _price_performance(ctx):
+    return ctx.data[VIEW_COL] / (ctx.data['Fiyat'] + 1)
+
+@rules.derive('view_q70')
+def _view_q70(ctx):
+    return sgs_sketch.column_quantile(ctx.data[VIEW_COL], 0.7, mode=ctx.params.get('sketch'))
+
+@rules.derive('main_summary')
+def _main_summary(ctx):
+    return sgs_branches.frame_summary(ctx.data, 'tuzla_loglar')
+
+# 1. KATEGORİ ANALİZİ
+@rules.rule('kategori', requires=['cat_counts'], title="\n📦 Kategori analizi...")
+def _categories(ctx):
+    cat_counts = ctx['cat_counts']
+    # Farklı kategori sayısı: --approx ile HyperLogLog (şube/parça taslakları birleştirilebilir)
+    distinct = sgs_sketch.nunique(ctx.data['Kategori'], mode=ctx.params.get('sketch'))
+    return [
+        f"📦 En büyük kategori: {cat_counts.index[0]} ({cat_counts.iloc[0]} ürün)",
+        f"📦 En küçük kategori: {cat_counts.index[-1]} ({cat_counts.iloc[-1]} ürün)",
+        f"📦 Toplam {distinct} farklı kategori"
+    ]
+
+# 2. PERFORMANS ANALİZİ
+@rules.rule('performans', requires=['cat_stats'], title="🏆 Performans analizi...")
+def _performance(ctx):
+    df, view_col = ctx.data, VIEW_COL
+    
+    # En popüler 3 ürün
+    top_products = sgs_topk.nlargest(df, 3, view_col)
+    insights = [
+        f"👑 En popüler: {top_products.iloc[0]['Ürün Adı']} ({top_products.iloc[0][view_col]:.0f} görüntülenme)",
+        f"🥈 2. sırada: {top_products.iloc[1]['Ürün Adı']} ({top_products.iloc[1][view_col]:.0f} görüntülenme)",
+        f"🥉 3. sırada: {top_products.iloc[2]['Ürün Adı']} ({top_products.iloc[2][view_col]:.0f} görüntülenme)"
+    ]
+    
+    # Kategori performansı
+    cat_performance = ctx['cat_stats']['views'].sort_values(ascending=False)
+    insights.append(f"🏆 En iyi kategori: {cat_performance.index[0]} (ort. {cat_performance.iloc[0]:.0f} görüntülenme)")
+    insights.append(f"⚠️ En zayıf kategori: {cat_performance.index[-1]} (ort. {cat_performance.iloc[-1]:.0f} görüntülenme)")
+    return insights
+
+# 3. FİYAT ANALİZİ
+@rules.rule('fiyat', title="💰 Fiyat analizi...")
+def _pricing(ctx):
+    df = ctx.data
+    price = df['Fiyat']
+    insights = [
+        f"💰 Ortalama fiyat: {price.mean():.0f}₺",
+        f"💰 En pahalı: {df.loc[sgs_topk.argmax(price), 'Ürün Adı']} ({price.max():.0f}₺)",
+        f"💰 En ucuz: {df.loc[sgs_topk.argmin(price), 'Ürün Adı']} ({price.min():.0f}₺)"
+    ]
+    
+    # Fiyat segmentleri
+    insights.append(f"💎 Pahalı ürünler (>1000₺): {(price > 1000).sum()} adet")
+    insights.append(f"⭐ Orta fiyat (200-1000₺): {((price >= 200) & (price <= 1000)).sum()} adet")
+    insights.append(f"💸 Ucuz ürünler (<200₺): {(price < 200).sum()} adet")
+    
+    # En pahalı ürünler
+    top_expensive = sgs_topk.nlargest(df, 3, 'Fiyat')
+    insights.append(f"💎 En pahalı 5: {', '.join([f'{p} ({f}₺)' for p, f in zip(top_expensive['Ürün Adı'], top_expensive['Fiyat'])])}")
+    return insights
+
+# 4. TREND ANALİZİ
+@rules.rule('trend', requires=['trend'], title="📈 Trend analizi...")
+def _trends(ctx):
+    names, trend = ctx.data['Ürün Adı'], ctx['trend']
+    insights = []
+    
+    # En yükselen ürünler
+    rising = sgs_topk.nlargest(trend[trend > 20], 3)
+    if len(rising) > 0:
+        insights.append(f"🚀 En yükselen: {names[rising.index[0]]} (%{rising.iloc[0]:.0f} artış)")
+        if len(rising) > 1:
+            insights.append(f"🚀 2. yükselen: {names[rising.index[1]]} (%{rising.iloc[1]:.0f} artış)")
+    
+    # En düşen ürünler
+    falling = sgs_topk.nsmallest(trend[trend < -20], 3)
+    if len(falling) > 0:
+        insights.append(f"📉 En düşen: {names[falling.index[0]]} (%{abs(falling.iloc[0]):.0f} düşüş)")
+    
+    # Genel trend
+    avg_trend = trend.mean()
+    insights.append(f"📊 Genel trend: %{avg_trend:.1f} {'artış' if avg_trend > 0 else 'düşüş'}")
+    return insights
+
+# 5. FOTO VE BADGE ANALİZİ
+@rules.rule('foto_badge', requires=['view_q70'], title="📷 Foto ve badge analizi...")
+def _photos(ctx):
+    df = ctx.data
+    photo_ok = (df['Foto Durumu'] == 'Evet').sum()
+    total = len(df)
+    big_photo_missing = (df['Büyük Foto Var Yok'] == 'Hayır').sum()
+    no_badge = df['Güncel Badge'].isna().sum()
+    insights = [
+        f"📷 Foto durumu: {photo_ok}/{total} ürünün fotoğrafı var (%{photo_ok/total*100:.0f})",
+        f"📸 {big_photo_missing} ürünün büyük fotoğrafı eksik",
+        f"🏷️ Badge durumu: {total - no_badge} üründe badge var, {no_badge} üründe yok"
+    ]
+    
+    # FIRSAT: Popüler ama foto eksik
+    missing_popular = ((df['Foto Durumu'] == 'Hayır') & (df[VIEW_COL] > ctx['view_q70'])).sum()
+    if missing_popular > 0:
+        insights.append(f"🔥 FIRSAT: {missing_popular} popüler ürünün fotoğrafı eksik!")
+    return insights
+
+# 6. FİYAT-PERFORMANS ANALİZİ
+@rules.rule('fiyat_performans', requires=['fiyat_performans'], title="💡 Fiyat-performans analizi...")
+def _best_value(ctx):
+    best_value = sgs_topk.nlargest(ctx['fiyat_performans'], 1)
+    return [f"💡 En iyi fiyat-performans: {ctx.data.loc[best_value.index[0], 'Ürün Adı']} ({best_value.iloc[0]:.2f} puan)"]
+
+# 7. DEĞİŞİKLİK ANALİZİ
+@rules.rule('degisiklik', title="🔄 Değişiklik analizi...")
+def _changes(ctx):
+    df = ctx.data
+    sira_degisen = (df['Sıra'] != df['Güncel Sıra']).sum()
+    fiyat_artan = (df['Güncel Fiyat'] > df['Fiyat']).sum()
+    fiyat_azalan = (df['Güncel Fiyat'] < df['Fiyat']).sum()
+    return [
+        f"🔄 {sira_degisen} ürünün sırası değiştirilmiş",
+        f"💰 Fiyat değişimi: {fiyat_artan} ürün zamlandı, {fiyat_azalan} ürün indirimde"
+    ]
+
+# 8. ŞUBE KARŞILAŞTIRMASI - tüm şubeler, her biri ayrı süreçte yüklenir
+@rules.rule('sube', requires=['main_summary'], title="🏪 Şube karşılaştırması...")
+def _branches(ctx):
+    insights = []
+    _branch_comparison(insights, ctx.params['db_path'], ctx.params['jobs'], pushdown=False,
+                       main_summary=ctx['main_summary'], log=ctx.log)
+    return insights
+
+# 9. KATEGORİ BAZLI DETAYLAR - kategori groupby sonucundan
+@rules.rule('kategori_detay', requires=['cat_counts', 'cat_stats'], title="📊 Kategori detayları...")
+def _category_details(ctx):
+    cat_stats = ctx['cat_stats']
+    insights = []
+    for category in ctx['cat_counts'].head(3).index:
+        row = cat_stats.loc[category]
+        insights.append(f"📦 {category}: {row['adet']:.0f} ürün, ort. {row['fiyat']:.0f}₺, {row['views']:.0f} görüntülenme")
+    return insights
+
+def _pandas_insights(conn, insights, db_path='sales.db', jobs=None, threads=None, sketch=None):
+    """Tabloları pandas'a çekerek bulguları üret (sgs_rules motoru)"""
+    # Tuzla şubesi analizi
+    tuzla_df = sgs_mirror.read_table(db_path, 'tuzla_loglar', conn)
+    
+    print(f"📊 Tuzla: {len(tuzla_df)} ürün")
+    
+    result = rules.run(tuzla_df, threads=threads, db_path=db_path, jobs=jobs, sketch=sketch)
+    insights.extend(result.insights)
+    return result
+
+def _q(name):
+    """SQL tanımlayıcısını tırnakla"""
+    return '"' + name.replace('"', '""') + '"'
+
+def _view_quantile(conn, table, q):
+    """Görüntülenme quantile'ı - pandas ile aynı (lineer enterpolasyon), sadece 2 satır çekilir"""
+    view = _q(VIEW_COL)
+    n = conn.execute(f"SELECT COUNT({view}) FROM {table}").fetchone()[0]
+    if n == 0:
+        return None
+    pos = q * (n - 1)
+    lo = int(pos)
+    values = [row[0] for row in conn.execute(
+        f"SELECT {view} FROM {table} WHERE {view} IS NOT NULL ORDER BY {view} LIMIT 2 OFFSET ?", (lo,))]
+    if len(values) == 1:
+        return values[0]
+    return values[0] + (values[1] - values[0]) * (pos - lo)
+
+def _sql_insights(conn, insights, db_path='sales.db', jobs=None):
+    """Bulguları SQLite toplam sorgularıyla üret - tablolar pandas'a çekilmez"""
+    table = 'tuzla_loglar'
+    name, cat, price, new_price = _q('Ürün Adı'), _q('Kategori'), _q('Fiyat'), _q('Güncel Fiyat')
+    view, prev = _q(VIEW_COL), _q(PREV_COL)
+    trend = f"(({view} - {prev}) * 1.0 / ({prev} + 1)) * 100"
+    
+    # Tek tarama: tüm skaler toplamlar
+    summary = conn.execute(f"""
+        SELECT COUNT(*),
+               AVG({price}), MAX({price}), MIN({price}),
+               AVG({trend}),
+               SUM(CASE WHEN {_q('Foto Durumu')} = 'Evet' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN {_q('Foto Durumu')} = 'Hayır' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN {_q('Büyük Foto Var Yok')} = 'Hayır' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN {_q('Güncel Badge')} IS NULL THEN 1 ELSE 0 END),
+               SUM(CASE WHEN {_q('Sıra')} = {_q('Güncel Sıra')} THEN 0 ELSE 1 END),
+               SUM(CASE WHEN {new_price} > {price} THEN 1 ELSE 0 END),
+               SUM(CASE WHEN {new_price} < {price} THEN 1 ELSE 0 END)
+        FROM {table}
+    """).fetchone()
+    (total, avg_price, max_price, min_price, avg_trend, photo_ok, photo_missing,
+     big_photo_missing, no_badge, sira_degisen, fiyat_artan, fiyat_azalan) = summary
+    
+    print(f"📊 Tuzla: {total} ürün")
+    
+    # 1. KATEGORİ ANALİZİ - tek GROUP BY: sayı, ortalama fiyat, ortalama görüntülenme
+    print("\n📦 Kategori analizi...")
+    categories = conn.execute(f"""
+        SELECT {cat}, COUNT(*) AS adet, AVG({price}), AVG({view})
+        FROM {table}
+        WHERE {cat} IS NOT NULL
+        GROUP BY {cat}
+        ORDER BY adet DESC, MIN(rowid)
+    """).fetchall()
+    insights.append(f"📦 En büyük kategori: {categories[0][0]} ({categories[0][1]} ürün)")
+    insights.append(f"📦 En küçük kategori: {categories[-1][0]} ({categories[-1][1]} ürün)")
+    insights.append(f"📦 Toplam {len(categories)} farklı kategori")
+    
+    # 2. PERFORMANS ANALİZİ
+    print("🏆 Performans analizi...")
+    top_products = conn.execute(f"""
+        SELECT {name}, {view} FROM {table}
+        WHERE {view} IS NOT NULL
+        ORDER BY {view} DESC, rowid LIMIT 5
+    """).fetchall()
+    insights.append(f"👑 En popüler: {top_products[0][0]} ({top_products[0][1]:.0f} görüntülenme)")
+    insights.append(f"🥈 2. sırada: {top_products[1][0]} ({top_products[1][1]:.0f} görüntülenme)")
+    insights.append(f"🥉 3. sırada: {top_products[2][0]} ({top_products[2][1]:.0f} görüntülenme)")
+    
+    cat_performance = sorted(categories, key=lambda row: row[3], reverse=True)
+    insights.append(f"🏆 En iyi kategori: {cat_performance[0][0]} (ort. {cat_performance[0][3]:.0f} görüntülenme)")
+    insights.append(f"⚠️ En zayıf kategori: {cat_performance[-1][0]} (ort. {cat_performance[-1][3]:.0f} görüntülenme)")
+    
+    # 3. FİYAT ANALİZİ
+    print("💰 Fiyat analizi...")
+    most_expensive = conn.execute(
+        f"SELECT {name} FROM {table} WHERE {price} IS NOT NULL ORDER BY {price} DESC, rowid LIMIT 1").fetchone()[0]
+    cheapest = conn.execute(
+        f"SELECT {name} FROM {table} WHERE {price} IS NOT NULL ORDER BY {price} ASC, rowid LIMIT 1").fetchone()[0]
+    insights.append(f"💰 Ortalama fiyat: {avg_price:.0f}₺")
+    insights.append(f"💰 En pahalı: {most_expensive} ({max_price:.0f}₺)")
+    insights.append(f"💰 En ucuz: {cheapest} ({min_price:.0f}₺)")
+    
+    # Fiyat segmentleri - CASE ile kova
+    segments = dict(conn.execute(f"""
+        SELECT CASE WHEN {price} > 1000 THEN 'pahali'
+                    WHEN {price} >= 200 THEN 'orta'
+                    WHEN {price} < 200 THEN 'ucuz' END AS segment,
+               COUNT(*)
+        FROM {table}
+        GROUP BY segment
+    """).fetchall())
+    
+    insights.append(f"💎 Pahalı ürünler (>1000₺): {segments.get('pahali', 0)} adet")
+    insights.append(f"⭐ Orta fiyat (200-1000₺): {segments.get('orta', 0)} adet")
+    insights.append(f"💸 Ucuz ürünler (<200₺): {segments.get('ucuz', 0)} adet")
+    
+    top_expensive = conn.execute(f"""
+        SELECT {name}, {price} FROM {table}
+        WHERE {price} IS NOT NULL
+        ORDER BY {price} DESC, rowid LIMIT 3
+    """).fetchall()
+    insights.append(f"💎 En pahalı 5: {', '.join([f'{p} ({f}₺)' for p, f in top_expensive])}")
+    
+    # 4. TREND ANALİZİ
+    print("📈 Trend analizi...")
+    rising = conn.execute(f"""
+        SELECT {name}, {trend} AS trend FROM {table}
+        WHERE trend > 20
+        ORDER BY trend DESC, rowid LIMIT 3
+    """).fetchall()
+    if len(rising) > 0:
+        insights.append(f"🚀 En yükselen: {rising[0][0]} (%{rising[0][1]:.0f} artış)")
+        if len(rising) > 1:
+            insights.append(f"🚀 2. yükselen: {rising[1][0]} (%{rising[1][1]:.0f} artış)")
+    
+    falling = conn.execute(f"""
+        SELECT {name}, {trend} AS trend FROM {table}
+        WHERE trend < -20
+        ORDER BY trend ASC, rowid LIMIT 3
+    """).fetchall()
+    if len(falling) > 0:
+        insights.append(f"📉 En düşen: {falling[0][0]} (%{abs(falling[0][1]):.0f} düşüş)")
+    
+    insights.append(f"📊 Genel trend: %{avg_trend:.1f} {'artış' if avg_trend > 0 else 'düşüş'}")
+    
+    # 5. FOTO VE BADGE ANALİZİ
+    print("📷 Foto ve badge analizi...")
+    insights.append(f"📷 Foto durumu: {photo_ok}/{total} ürünün fotoğrafı var (%{photo_ok/total*100:.0f})")
+    insights.append(f"📸 {big_photo_missing} ürünün büyük fotoğrafı eksik")
+    insights.append(f"🏷️ Badge durumu: {total - no_badge} üründe badge var, {no_badge} üründe yok")
+    
+    # FIRSAT: Popüler ama foto eksik
+    threshold = _view_quantile(conn, table, 0.7)
+    if threshold is not None:
+        missing_popular = conn.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE {_q('Foto Durumu')} = 'Hayır' AND {view} > ?",
+            (threshold,)).fetchone()[0]
+        if missing_popular > 0:
+            insights.append(f"🔥 FIRSAT: {missing_popular} popüler ürünün fotoğrafı eksik!")
+    
+    # 6. FİYAT-PERFORMANS ANALİZİ
+    print("💡 Fiyat-performans analizi...")
+    best_value = conn.execute(f"""
+        SELECT {name}, {view} * 1.0 / ({price} + 1) AS fp FROM {table}
+        WHERE fp IS NOT NULL
+        ORDER BY fp DESC, rowid LIMIT 1
+    """).fetchone()
+    insights.append(f"💡 En iyi fiyat-performans: {best_value[0]} ({best_value[1]:.2f} puan)")
+    
+    # 7. DEĞİŞİKLİK ANALİZİ
+    print("🔄 Değişiklik analizi...")
+    insights.append(f"🔄 {sira_degisen} ürünün sırası değiştirilmiş")
+    insights.append(f"💰 Fiyat değişimi: {fiyat_artan} ürün zamlandı, {fiyat_azalan} ürün indirimde")
+    
+    # 8. ŞUBE KARŞILAŞTIRMASI - şube özetleri de SQLite toplamlarıyla
+    print("🏪 Şube karşılaştırması...")
+    _branch_comparison(insights, db_path, jobs, pushdown=True)
+    
+    # 9. KATEGORİ BAZLI DETAYLAR - 1. adımdaki GROUP BY sonucundan
+    print("📊 Kategori detayları...")
+    for category, count, cat_avg_price, cat_avg_views in categories[:3]:
+        insights.append(f"📦 {category}: {count} ürün, ort. {cat_avg_price:.0f}₺, {cat_avg_views:.0f} görüntülenme")
+
+def analyze(pushdown=False, db_path='sales.db', jobs=None, threads=None, timings=False, sketch=None):
+    """SQL kadar güçlü analiz - 20+ bulgu
 
-def analyze():
-    """SQL kadar güçlü analiz - 20+ bulgu"""
+    pushdown=True: toplamlar SQLite içinde hesaplanır, Python'a sadece
+    sonuç satırları gelir (milyonlarca satırlık log tabloları için)
+    jobs: şube karşılaştırmasında kullanılacak süreç sayısı (varsayılan: çekirdek sayısı)
+    threads: bulgu kurallarını çalıştıran thread sayısı (pandas yolu, 1 = sıralı)
+    timings=True: kural başına ve SQL sorgusu başına (sgs_db) süreler yazdırılır
+    sketch: 'exact' | 'approx' - pandas yolunda quantile hesabı (varsayılan: SGS_SKETCH);
+    pushdown yolu quantile'ı zaten SQLite'ta 2 satır çekerek kesin hesaplar
+    """
     print("🚀 SGS POWER - SQL Seviyesi Analiz")
     print("=" * 50)
     
     insights = []
+    result = None
     
     try:
-        conn = sqlite3.connect('sales.db')
-        
-        # Tuzla şubesi analizi
-        tuzla_df = pd.read_sql("SELECT * FROM tuzla_loglar", conn)
-        
-        # Koşuyolu şubesi analizi
-        kosuyolu_df = pd.read_sql("SELECT * FROM kosuyolu_loglar", conn)
-        
-        print(f"📊 Tuzla: {len(tuzla_df)} ürün")
-        print(f"📊 Koşuyolu: {len(kosuyolu_df)} ürün")
-        
-        # 1. KATEGORİ ANALİZİ
-        print("\n📦 Kategori analizi...")
-        cat_counts = tuzla_df['Kategori'].value_counts()
-        insights.append(f"📦 En büyük kategori: {cat_counts.index[0]} ({cat_counts.iloc[0]} ürün)")
-        insights.append(f"📦 En küçük kategori: {cat_counts.index[-1]} ({cat_counts.iloc[-1]} ürün)")
-        insights.append(f"📦 Toplam {len(cat_counts)} farklı kategori")
-        
-        # 2. PERFORMANS ANALİZİ
-        print("🏆 Performans analizi...")
-        view_col = 'GÜNCEL DÖNEM GÖRÜNTÜLEME (02.09-08.09)'
-        
-        # En popüler 5 ürün
-        top_products = tuzla_df.nlargest(5, view_col)
-        insights.append(f"👑 En popüler: {top_products.iloc[0]['Ürün Adı']} ({top_products.iloc[0][view_col]:.0f} görüntülenme)")
-        insights.append(f"🥈 2. sırada: {top_products.iloc[1]['Ürün Adı']} ({top_products.iloc[1][view_col]:.0f} görüntülenme)")
-        insights.append(f"🥉 3. sırada: {top_products.iloc[2]['Ürün Adı']} ({top_products.iloc[2][view_col]:.0f} görüntülenme)")
-        
-        # Kategori performansı
-        cat_performance = tuzla_df.groupby('Kategori')[view_col].mean().sort_values(ascending=False)
-        insights.append(f"🏆 En iyi kategori: {cat_performance.index[0]} (ort. {cat_performance.iloc[0]:.0f} görüntülenme)")
-        insights.append(f"⚠️ En zayıf kategori: {cat_performance.index[-1]} (ort. {cat_performance.iloc[-1]:.0f} görüntülenme)")
-        
-        # 3. FİYAT ANALİZİ
-        print("💰 Fiyat analizi...")
-        price_stats = tuzla_df['Fiyat'].describe()
-        insights.append(f"💰 Ortalama fiyat: {price_stats['mean']:.0f}₺")
-        insights.append(f"💰 En pahalı: {tuzla_df.loc[tuzla_df['Fiyat'].idxmax(), 'Ürün Adı']} ({tuzla_df['Fiyat'].max():.0f}₺)")
-        insights.append(f"💰 En ucuz: {tuzla_df.loc[tuzla_df['Fiyat'].idxmin(), 'Ürün Adı']} ({tuzla_df['Fiyat'].min():.0f}₺)")
-        
-        # Fiyat segmentleri
-        expensive = tuzla_df[tuzla_df['Fiyat'] > 1000]
-        medium = tuzla_df[(tuzla_df['Fiyat'] >= 200) & (tuzla_df['Fiyat'] <= 1000)]
-        cheap = tuzla_df[tuzla_df['Fiyat'] < 200]
-        
-        insights.append(f"💎 Pahalı ürünler (>1000₺): {len(expensive)} adet")
-        insights.append(f"⭐ Orta fiyat (200-1000₺): {len(medium)} adet")
-        insights.append(f"💸 Ucuz ürünler (<200₺): {len(cheap)} adet")
-        
-        # En pahalı 5 ürün
-        top_expensive = tuzla_df.nlargest(5, 'Fiyat')
-        insights.append(f"💎 En pahalı 5: {', '.join([f'{p} ({f}₺)' for p, f in zip(top_expensive['Ürün Adı'].head(3), top_expensive['Fiyat'].head(3))])}")
-        
-        # 4. TREND ANALİZİ
-        print("📈 Trend analizi...")
-        prev_col = 'BİR ÖNCEKİ DÖNEM GÖRÜNTÜLEME (26.08 - 01.09)'
-        
-        # Trend hesaplama
-        tuzla_df['trend'] = ((tuzla_df[view_col] - tuzla_df[prev_col]) / (tuzla_df[prev_col] + 1)) * 100
-        
-        # En yükselen ürünler
-        rising = tuzla_df[tuzla_df['trend'] > 20].nlargest(3, 'trend')
-        if len(rising) > 0:
-            insights.append(f"🚀 En yükselen: {rising.iloc[0]['Ürün Adı']} (%{rising.iloc[0]['trend']:.0f} artış)")
-            if len(rising) > 1:
-                insights.append(f"🚀 2. yükselen: {rising.iloc[1]['Ürün Adı']} (%{rising.iloc[1]['trend']:.0f} artış)")
-        
-        # En düşen ürünler
-        falling = tuzla_df[tuzla_df['trend'] < -20].nsmallest(3, 'trend')
-        if len(falling) > 0:
-            insights.append(f"📉 En düşen: {falling.iloc[0]['Ürün Adı']} (%{abs(falling.iloc[0]['trend']):.0f} düşüş)")
-        
-        # Genel trend
-        avg_trend = tuzla_df['trend'].mean()
-        insights.append(f"📊 Genel trend: %{avg_trend:.1f} {'artış' if avg_trend > 0 else 'düşüş'}")
-        
-        # 5. FOTO VE BADGE ANALİZİ
-        print("📷 Foto ve badge analizi...")
-        
-        # Foto durumu
-        photo_ok = (tuzla_df['Foto Durumu'] == 'Evet').sum()
-        photo_missing = (tuzla_df['Foto Durumu'] == 'Hayır').sum()
-        total = len(tuzla_df)
-        insights.append(f"📷 Foto durumu: {photo_ok}/{total} ürünün fotoğrafı var (%{photo_ok/total*100:.0f})")
-        
-        # Büyük foto
-        big_photo_missing = (tuzla_df['Büyük Foto Var Yok'] == 'Hayır').sum()
-        insights.append(f"📸 {big_photo_missing} ürünün büyük fotoğrafı eksik")
-        
-        # Badge durumu
-        no_badge = tuzla_df['Güncel Badge'].isna().sum()
-        has_badge = (~tuzla_df['Güncel Badge'].isna()).sum()
-        insights.append(f"🏷️ Badge durumu: {has_badge} üründe badge var, {no_badge} üründe yok")
-        
-        # FIRSAT: Popüler ama foto eksik
-        missing_popular = tuzla_df[(tuzla_df['Foto Durumu'] == 'Hayır') & 
-                                 (tuzla_df[view_col] > tuzla_df[view_col].quantile(0.7))]
-        if len(missing_popular) > 0:
-            insights.append(f"🔥 FIRSAT: {len(missing_popular)} popüler ürünün fotoğrafı eksik!")
-        
-        # 6. FİYAT-PERFORMANS ANALİZİ
-        print("💡 Fiyat-performans analizi...")
-        tuzla_df['fiyat_performans'] = tuzla_df[view_col] / (tuzla_df['Fiyat'] + 1)
-        best_value = tuzla_df.nlargest(3, 'fiyat_performans')
-        insights.append(f"💡 En iyi fiyat-performans: {best_value.iloc[0]['Ürün Adı']} ({best_value.iloc[0]['fiyat_performans']:.2f} puan)")
-        
-        # 7. DEĞİŞİKLİK ANALİZİ
-        print("🔄 Değişiklik analizi...")
-        
-        # Sıra değişiklikleri
-        sira_degisen = tuzla_df[tuzla_df['Sıra'] != tuzla_df['Güncel Sıra']]
-        insights.append(f"🔄 {len(sira_degisen)} ürünün sırası değiştirilmiş")
-        
-        # Fiyat değişiklikleri
-        fiyat_artan = tuzla_df[tuzla_df['Güncel Fiyat'] > tuzla_df['Fiyat']]
-        fiyat_azalan = tuzla_df[tuzla_df['Güncel Fiyat'] < tuzla_df['Fiyat']]
-        insights.append(f"💰 Fiyat değişimi: {len(fiyat_artan)} ürün zamlandı, {len(fiyat_azalan)} ürün indirimde")
-        
-        # 8. ŞUBE KARŞILAŞTIRMASI
-        print("🏪 Şube karşılaştırması...")
-        tuzla_avg_price = tuzla_df['Fiyat'].mean()
-        kosuyolu_avg_price = kosuyolu_df['Fiyat'].mean()
-        price_diff = ((tuzla_avg_price - kosuyolu_avg_price) / kosuyolu_avg_price) * 100
-        
-        if price_diff > 5:
-            insights.append(f"📊 Tuzla, Koşuyolu'ndan %{price_diff:.0f} daha pahalı (ort. {tuzla_avg_price:.0f}₺ vs {kosuyolu_avg_price:.0f}₺)")
-        elif price_diff < -5:
-            insights.append(f"📊 Tuzla, Koşuyolu'ndan %{abs(price_diff):.0f} daha ucuz (ort. {tuzla_avg_price:.0f}₺ vs {kosuyolu_avg_price:.0f}₺)")
-        else:
-            insights.append(f"⚖️ Her iki şube benzer fiyatlarda (Tuzla: {tuzla_avg_price:.0f}₺, Koşuyolu: {kosuyolu_avg_price:.0f}₺)")
-        
-        # Ürün sayısı karşılaştırması
-        insights.append(f"🏪 Ürün sayısı: Tuzla {len(tuzla_df)}, Koşuyolu {len(kosuyolu_df)}")
-        
-        # 9. KATEGORİ BAZLI DETAYLAR
-        print("📊 Kategori detayları...")
-        for category in cat_counts.head(3).index:
-            cat_df = tuzla_df[tuzla_df['Kategori'] == category]
-            avg_price = cat_df['Fiyat'].mean()
-            avg_views = cat_df[view_col].mean()
-            insights.append(f"📦 {category}: {len(cat_df)} ürün, ort. {avg_price:.0f}₺, {avg_views:.0f} görüntülenme")
-        
-        conn.close()
+        with sgs_db.connect(db_path) as conn:
+            if pushdown:
+                _sql_insights(conn, insights, db_path, jobs)
+            else:
+                result = _pandas_insights(conn, insights, db_path, jobs, threads, sketch)
         
     except Exception as e:
         print(f"❌ Analiz hatası: {e}")
@@ -185,7 +414,15 @@ def analyze():
     print(f"   • Foto/badge analizi: ✅")
     print(f"   • Şube karşılaştırması: ✅")
     
+    if timings:
+        if result is not None:
+            result.print_timings()
+        sgs_db.pool(db_path).print_stats()
+    
     return insights
 
 if __name__ == "__main__":
-    analyze()
+    jobs = int(sys.argv[sys.argv.index('--jobs') + 1]) if '--jobs' in sys.argv else None
+    threads = int(sys.argv[sys.argv.index('--threads') + 1]) if '--threads' in sys.argv else None
+    analyze(pushdown='--pushdown' in sys.argv, jobs=jobs, threads=threads, timings='--timings' in sys.argv,
+            sketch='approx' if '--approx' in sys.argv else None)
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS Profile - Aşama bazlı ölçüm
+Her span için duvar süresi, CPU süresi, tepe bellek artışı (tracemalloc)
+ve işlenen satır sayısı kaydedilir. Sonuç JSON olarak ya da Chrome trace
+(chrome://tracing, Perfetto) formatında yazılabilir.
+
+Profil aktif değilken span() hiçbir şey ölçmez; modüller (sgs_loader,
+SQL okumaları) span'leri koşulsuz açabilir.
+
+tracemalloc tepe değeri süreç geneli olduğundan bellek sadece profili açan
+thread'deki span'ler için ölçülür; thread havuzundaki span'lerde (paralel
+kurallar) bellek boştur ('-'). Ana thread span'i, o sırada çalışan işçi
+thread'lerin ayırmalarını da kapsar.
+
+Kullanım:
+import sgs_profile
+with sgs_profile.Profile('gece_analizi') as profile:
+    with sgs_profile.span('yükleme') as s:
+        df = ...
+        s.rows = len(df)
+profile.print_summary()
+profile.to_chrome_trace('trace.json')
+"""
+
+import os
+import json
+import time
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+_active = None
+_local = threading.local()
+
+
+class Span:
+    """Tek bir ölçüm aralığı"""
+
+    def __init__(self, name, category='stage', parent=None):
+        self.name = name
+        self.category = category
+        self.parent = parent
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.thread = threading.get_ident()
+        self.rows = None
+        self.args = {}
+        self.start = self.end = None
+        self.cpu = None
+        self.mem_peak = None
+        self._mem_start = 0
+        self._peak_seen = 0
+        self._io_rows = None
+
+    @property
+    def wall(self):
+        return (self.end or time.perf_counter()) - self.start
+
+    def to_dict(self, origin=0.0):
+        return {
+            'name': self.name,
+            'category': self.category,
+            'depth': self.depth,
+            'parent': self.parent.name if self.parent else None,
+            'start_s': round(self.start - origin, 6),
+            'wall_s': round(self.wall, 6),
+            'cpu_s': None if self.cpu is None else round(self.cpu, 6),
+            'mem_peak_delta_kb': None if self.mem_peak is None else round(self.mem_peak / 1024, 1),
+            'rows': self.rows,
+            'args': self.args
+        }
+
+
+class Profile:
+    """Span'leri toplayan profil - with bloğu içinde aktif olur"""
+
+    def __init__(self, name='sgs', memory=True):
+        self.name = name
+        self.memory = memory
+        self.spans = []
+        self.origin = None
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+        self._thread = None
+        self.unmeasured = 0
+
+    def _measures(self, span):
+        """Bellek ölçülür mü - sadece profili açan thread'de (reset_peak süreç geneli)"""
+        return self.memory and span.thread == self._thread and tracemalloc.is_tracing()
+
+    def __enter__(self):
+        global _active
+        self.origin = time.perf_counter()
+        self._thread = threading.get_ident()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._previous = _active
+        _active = self
+        return self
+
+    def __exit__(self, *exc):
+        global _active
+        _active = self._previous
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _open(self, name, category, parent=None):
+        stack = _stack()
+        if parent is None and stack:
+            parent = stack[-1]
+        span = Span(name, category, parent)
+        if self._measures(span):
+            # Alt span reset_peak yapacağı için üst span'in gördüğü tepe önce saklanır
+            current, peak = tracemalloc.get_traced_memory()
+            if span.parent is not None:
+                span.parent._peak_seen = max(span.parent._peak_seen, peak)
+            span._mem_start = current
+            tracemalloc.reset_peak()
+        stack.append(span)
+        span.cpu = time.process_time()
+        span.start = time.perf_counter()
+        return span
+
+    def _close(self, span):
+        span.end = time.perf_counter()
+        span.cpu = time.process_time() - span.cpu
+        # Üst span başka thread'de olabilir; güncellemeler kilit altında
+        with self._lock:
+            if self._measures(span):
+                _, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, span._peak_seen)
+                span.mem_peak = max(0, peak - span._mem_start)
+                if span.parent is not None:
+                    span.parent._peak_seen = max(span.parent._peak_seen, peak)
+            elif self.memory:
+                self.unmeasured += 1
+            # Satır sayısı verilmeyen span'ler alt SQL/Excel okumalarının satırlarını alır
+            if span.rows is None:
+                span.rows = span._io_rows
+            if span.parent is not None and span.category in ('io', 'sql') and span.rows is not None:
+                span.parent._io_rows = (span.parent._io_rows or 0) + span.rows
+            self.spans.append(span)
+        _stack().pop()
+
+    def stages(self, category='stage'):
+        """Belirli türdeki span'ler, başlangıç sırasıyla"""
+        return sorted((s for s in self.spans if s.category == category), key=lambda s: s.start)
+
+    def to_dict(self):
+        spans = sorted(self.spans, key=lambda s: s.start)
+        return {
+            'name': self.name,
+            'pid': os.getpid(),
+            'total_s': round(sum(s.wall for s in spans if s.depth == 0), 6),
+            'memory_scope': 'main_thread' if self.memory else None,
+            'spans': [s.to_dict(self.origin) for s in spans]
+        }
+
+    def to_json(self, path):
+        """Profili JSON olarak yaz"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2, default=str)
+        return path
+
+    def to_chrome_trace(self, path):
+        """chrome://tracing / Perfetto için 'X' (complete) olayları"""
+        pid = os.getpid()
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': self.name}}]
+        for span in sorted(self.spans, key=lambda s: s.start):
+            args = dict(span.args)
+            if span.rows is not None:
+                args['rows'] = span.rows
+            args['cpu_ms'] = round(span.cpu * 1000, 3)
+            if span.mem_peak is not None:
+                args['mem_peak_delta_kb'] = round(span.mem_peak / 1024, 1)
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': round((span.start - self.origin) * 1e6, 3),
+                'dur': round(span.wall * 1e6, 3),
+                'pid': pid,
+                'tid': span.thread,
+                'args': args
+            })
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False, default=str)
+        return path
+
+    def print_summary(self):
+        """Span tablosunu yazdır"""
+        print(f"\n⏱️ PROFİL: {self.name}")
+        print(f"   {'span':<40} {'süre':>9} {'cpu':>9} {'bellek':>10} {'satır':>10}")
+        for span in sorted(self.spans, key=lambda s: s.start):
+            name = ('  ' * span.depth + span.name)[:40]
+            mem = '-' if span.mem_peak is None else f"{span.mem_peak / 1024 / 1024:.1f}MB"
+            rows = '-' if span.rows is None else f"{span.rows}"
+            print(f"   {name:<40} {span.wall:>8.3f}s {span.cpu:>8.3f}s {mem:>10} {rows:>10}")
+        if self.unmeasured:
+            print(f"   ℹ️ bellek sadece ana thread span'lerinde ölçülür ({self.unmeasured} thread span'i '-')")
+
+
+def _stack():
+    """Thread başına açık span yığını"""
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+def current():
+    """Aktif profil (yoksa None)"""
+    return _active
+
+
+def current_span():
+    """Bu thread'de açık olan en içteki span (yoksa None)"""
+    if _active is None or not _stack():
+        return None
+    return _stack()[-1]
+
+
+def annotate(rows=None, **args):
+    """Bu thread'de açık olan en içteki span'e satır sayısı/bilgi ekle"""
+    if _active is None or not _stack():
+        return
+    current_span = _stack()[-1]
+    if rows is not None:
+        current_span.rows = (current_span.rows or 0) + rows
+    current_span.args.update(args)
+
+
+@contextmanager
+def span(name, category='stage', rows=None, parent=None, **args):
+    """Aktif profile span ekle - profil yoksa ölçüm yapılmaz
+
+    parent: başka thread'de açılmış üst span (thread havuzundaki işler için)
+    """
+    profile = _active
+    if profile is None:
+        yield Span(name, category)
+        return
+
+    s = profile._open(name, category, parent)
+    s.rows = rows
+    s.args.update(args)
+    try:
+        yield s
+    finally:
+        profile._close(s)
@@ -13,12 +13,93 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import os
+import sgs_loader
+import sgs_dtypes
+import sgs_columns
+import sgs_report
+
+RESTAURANT_REPORT_HEAD = sgs_report.template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>SGS Restoran Analiz Raporu</title>
+    <meta charset="UTF-8">
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }
+        .header { background: #2c3e50; color: white; padding: 20px; text-align: center; }
+        .metrics { display: flex; justify-content: space-around; margin: 20px 0; }
+        .metric { background: #f8f9fa; padding: 15px; text-align: center; border-radius: 8px; }
+        .insights { background: #e8f5e8; padding: 15px; margin: 20px 0; border-radius: 8px; }
+        .recommendations { background: #fff3cd; padding: 15px; margin: 20px 0; border-radius: 8px; }
+        .footer { text-align: center; margin-top: 40px; color: #666; }
+        ul { list-style-type: none; padding: 0; }
+        li { margin: 10px 0; padding: 8px; background: white; border-radius: 4px; }
+        .products { margin: 20px 0; }
+        .data-table { width: 100%; border-collapse: collapse; }
+        .data-table th, .data-table td { padding: 6px 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        .data-table th { background: #2c3e50; color: white; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>🍽️ SGS - Restoran Analiz Raporu</h1>
+        <p>Smart Growth Solutions</p>
+    </div>
+    
+    <div class="metrics">
+        <div class="metric">
+            <h3>📊 Toplam Ürün</h3>
+            <h2>$total_products</h2>
+        </div>
+        <div class="metric">
+            <h3>💰 Ortalama Fiyat</h3>
+            <h2>$$$avg_price</h2>
+        </div>
+        <div class="metric">
+            <h3>👀 Toplam Görüntülenme</h3>
+            <h2>$total_views</h2>
+        </div>
+    </div>
+    
+    <div class="insights">
+        <h2>🔍 Ana İçgörüler</h2>
+        <ul>
+""")
+
+RESTAURANT_REPORT_MIDDLE = sgs_report.template("""
+        </ul>
+    </div>
+    
+    <div class="recommendations">
+        <h2>🚀 Aksiyon Önerileri</h2>
+        <ul>
+""")
+
+RESTAURANT_REPORT_PRODUCTS = sgs_report.template("""
+        </ul>
+    </div>
+    
+    <div class="products">
+        <h2>📋 Ürün Listesi</h2>
+""")
+
+RESTAURANT_REPORT_FOOTER = sgs_report.template("""
+    </div>
+    
+    <div class="footer">
+        <p>📅 Rapor Tarihi: $report_date</p>
+        <p>Powered by SGS - Smart Growth Solutions</p>
+    </div>
+</body>
+</html>
+""")
 
 class SGS:
     def __init__(self):
         self.insights = []
         self.recommendations = []
         self.report_data = {}
+        self.column_roles = None
         
     def analyze(self, file_path, output_name="sgs_report"):
         """
@@ -30,13 +111,12 @@ class SGS:
         # Excel dosyasını oku
         try:
             # Birden fazla sheet var mı kontrol et
-            xl_file = pd.ExcelFile(file_path)
-            sheets = xl_file.sheet_names
+            sheets = sgs_loader.sheet_names(file_path)
             
             print(f"📄 {len(sheets)} sayfa bulundu: {', '.join(sheets)}")
             
             # İlk sheet'i ana veri olarak al
-            df = pd.read_excel(file_path, sheet_name=sheets[0])
+            df = sgs_loader.read_excel(file_path, sheet_name=sheets[0])
             print(f"📊 Ana veri: {len(df)} ürün, {len(df.columns)} özellik")
             
         except Exception as e:
@@ -57,6 +137,9 @@ class SGS:
         
         print("\n🔍 RESTORAN ANALİZ MOTORU ÇALIŞIYOR...")
         
+        # Sütun rolleri bir kez tespit edilir (güncel dönem sütunları önce)
+        self.column_roles = sgs_columns.detect(df)
+        
         # 1. Ürün performans analizi
         self._analyze_product_performance(df)
         
@@ -76,9 +159,9 @@ class SGS:
         """Ürün performans analizi"""
         
         # Görüntülenme sütununu bul
-        view_cols = [col for col in df.columns if 'görüntülenme' in col.lower() or 'görüntüleme' in col.lower()]
-        price_cols = [col for col in df.columns if 'fiyat' in col.lower() or 'price' in col.lower()]
-        name_cols = [col for col in df.columns if 'ürün' in col.lower() or 'name' in col.lower() or 'ad' in col.lower()]
+        view_cols = self.column_roles.flagged('views')
+        price_cols = self.column_roles.of('price')
+        name_cols = self.column_roles.of('name')
         
         if view_cols and price_cols and name_cols:
             view_col = view_cols[0]
@@ -92,7 +175,7 @@ class SGS:
             self.insights.append(f"🏆 En popüler ürün: {top_product[name_col]} ({top_product[view_col]} görüntülenme)")
             
             # En karlı ürün potansiyeli
-            df['karlılık_skoru'] = df[price_col] * df[view_col].fillna(0)
+            df['karlılık_skoru'] = sgs_dtypes.widen(df[price_col]) * df[view_col].fillna(0)
             top_profitable_idx = df['karlılık_skoru'].idxmax()
             top_profitable = df.loc[top_profitable_idx]
             
@@ -113,7 +196,7 @@ class SGS:
     def _analyze_categories(self, df):
         """Kategori analizi"""
         
-        cat_cols = [col for col in df.columns if 'kategori' in col.lower() or 'category' in col.lower()]
+        cat_cols = self.column_roles.of('category')
         
         if cat_cols:
             cat_col = cat_cols[0]
@@ -125,14 +208,14 @@ class SGS:
             self.insights.append(f"📦 En büyük kategori: {biggest_cat} ({cat_counts.iloc[0]} ürün)")
             
             # Kategori performansı
-            view_cols = [col for col in df.columns if 'görüntülenme' in col.lower()]
-            price_cols = [col for col in df.columns if 'fiyat' in col.lower()]
+            view_cols = self.column_roles.flagged('views')
+            price_cols = self.column_roles.of('price')
             
             if view_cols and price_cols:
                 view_col = view_cols[0]
                 price_col = price_cols[0]
                 
-                cat_performance = df.groupby(cat_col).agg({
+                cat_performance = df.groupby(cat_col, observed=True).agg({
                     view_col: 'mean',
                     price_col: 'mean',
                     cat_col: 'count'
@@ -146,7 +229,7 @@ class SGS:
     def _analyze_pricing(self, df):
         """Fiyat stratejisi analizi"""
         
-        price_cols = [col for col in df.columns if 'fiyat' in col.lower()]
+        price_cols = self.column_roles.of('price')
         
         if price_cols:
             price_col = price_cols[0]
@@ -165,11 +248,11 @@ class SGS:
     def _analyze_visuals(self, df):
         """Görsel/foto analizi"""
         
-        photo_cols = [col for col in df.columns if 'foto' in col.lower() or 'görsel' in col.lower()]
+        photo_cols = self.column_roles.flagged('photo')
         
         if photo_cols:
             for photo_col in photo_cols:
-                if 'durumu' in photo_col.lower():
+                if 'state' in self.column_roles.flags[photo_col]:
                     no_photo_count = (df[photo_col] == 'Hayır').sum()
                     total = len(df)
                     
@@ -182,16 +265,16 @@ class SGS:
         print("\n💡 AKSİYON ÖNERİLERİ OLUŞTURULUYOR...")
         
         # Foto eksikliği
-        photo_cols = [col for col in df.columns if 'foto' in col.lower()]
+        photo_cols = self.column_roles.flagged('photo')
         if photo_cols:
             photo_col = photo_cols[0]
-            if 'durumu' in photo_col.lower():
+            if 'state' in self.column_roles.flags[photo_col]:
                 missing_photos = df[df[photo_col] == 'Hayır']
                 if len(missing_photos) > 0:
                     self.recommendations.append("📸 Öncelik 1: Fotoğrafı olmayan ürünlere foto ekleyin")
         
         # Badge eksikliği
-        badge_cols = [col for col in df.columns if 'badge' in col.lower()]
+        badge_cols = self.column_roles.flagged('badge')
         if badge_cols:
             badge_col = badge_cols[0]
             no_badge = df[df[badge_col].isna()]
@@ -199,8 +282,8 @@ class SGS:
                 self.recommendations.append("🏷️ Öncelik 2: Popüler ürünlere badge ekleyin")
         
         # Fiyat optimizasyonu
-        price_cols = [col for col in df.columns if 'fiyat' in col.lower()]
-        view_cols = [col for col in df.columns if 'görüntülenme' in col.lower()]
+        price_cols = self.column_roles.of('price')
+        view_cols = self.column_roles.flagged('views')
         
         if price_cols and view_cols:
             price_col = price_cols[0]
@@ -223,77 +306,21 @@ class SGS:
         # Temel istatistikler
         total_products = len(df)
         
-        price_cols = [col for col in df.columns if 'fiyat' in col.lower()]
+        price_cols = self.column_roles.of('price')
         avg_price = df[price_cols[0]].mean() if price_cols else 0
         
-        view_cols = [col for col in df.columns if 'görüntülenme' in col.lower()]
+        view_cols = self.column_roles.flagged('views')
         total_views = df[view_cols[0]].sum() if view_cols else 0
         
-        # HTML içeriği
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>SGS Restoran Analiz Raporu</title>
-            <meta charset="UTF-8">
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }}
-                .header {{ background: #2c3e50; color: white; padding: 20px; text-align: center; }}
-                .metrics {{ display: flex; justify-content: space-around; margin: 20px 0; }}
-                .metric {{ background: #f8f9fa; padding: 15px; text-align: center; border-radius: 8px; }}
-                .insights {{ background: #e8f5e8; padding: 15px; margin: 20px 0; border-radius: 8px; }}
-                .recommendations {{ background: #fff3cd; padding: 15px; margin: 20px 0; border-radius: 8px; }}
-                .footer {{ text-align: center; margin-top: 40px; color: #666; }}
-                ul {{ list-style-type: none; padding: 0; }}
-                li {{ margin: 10px 0; padding: 8px; background: white; border-radius: 4px; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>🍽️ SGS - Restoran Analiz Raporu</h1>
-                <p>Smart Growth Solutions</p>
-            </div>
-            
-            <div class="metrics">
-                <div class="metric">
-                    <h3>📊 Toplam Ürün</h3>
-                    <h2>{total_products}</h2>
-                </div>
-                <div class="metric">
-                    <h3>💰 Ortalama Fiyat</h3>
-                    <h2>${avg_price:.0f}</h2>
-                </div>
-                <div class="metric">
-                    <h3>👀 Toplam Görüntülenme</h3>
-                    <h2>{total_views:.0f}</h2>
-                </div>
-            </div>
-            
-            <div class="insights">
-                <h2>🔍 Ana İçgörüler</h2>
-                <ul>
-                    {''.join([f'<li>{insight}</li>' for insight in self.insights])}
-                </ul>
-            </div>
-            
-            <div class="recommendations">
-                <h2>🚀 Aksiyon Önerileri</h2>
-                <ul>
-                    {''.join([f'<li>{rec}</li>' for rec in self.recommendations])}
-                </ul>
-            </div>
-            
-            <div class="footer">
-                <p>📅 Rapor Tarihi: {datetime.now().strftime('%d %B %Y, %H:%M')}</p>
-                <p>Powered by SGS - Smart Growth Solutions</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        # HTML dosyasını kaydet
-        with open(f'{output_name}.html', 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        with sgs_report.ReportWriter(f'{output_name}.html') as out:
+            out.render(RESTAURANT_REPORT_HEAD, total_products=total_products,
+                       avg_price=f"{avg_price:.0f}", total_views=f"{total_views:.0f}")
+            out.list_items(self.insights)
+            out.render(RESTAURANT_REPORT_MIDDLE)
+            out.list_items(self.recommendations)
+            out.render(RESTAURANT_REPORT_PRODUCTS)
+            out.data_table(df)
+            out.render(RESTAURANT_REPORT_FOOTER, report_date=datetime.now().strftime('%d %B %Y, %H:%M'))
 
 # Ana SGS fonksiyonu - tek satır kullanım
 def analyze(file_path, output_name="sgs_report"):
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS Report - Akışlı HTML rapor yazıcı
+Şablonlar (string.Template sözdizimi: $ad, $$ = '$') süreç başına bir kez
+parçalara ayrılır; rapor bölüm bölüm doğrudan dosyaya yazılır, tüm HTML hiçbir
+zaman bellekte birleştirilmez. Değerler varsayılan olarak HTML'e kaçırılır
+(hazır HTML için safe()); DataFrame tabloları parça parça, sütun bazında
+vektörel kaçırılarak yazılır.
+
+Büyük tablolar (data_table, INLINE_TABLE_ROWS satırdan fazlası) DOM satırı
+olarak değil, sütun bazlı JSON → gzip → base64 bloğu olarak gömülür; rapora
+bir kez eklenen küçük satır içi betik bloğu tarayıcının DecompressionStream'i
+ile açar ve sadece görünen satırları çizer (sanal kaydırma, başlığa tıklayarak
+sıralama, metin filtresi). CDN ya da ağ gerekmez.
+
+Kullanım:
+import sgs_report
+HEAD = sgs_report.template("<h1>$title</h1><ul>")
+with sgs_report.ReportWriter('rapor.html') as out:
+    out.render(HEAD, title="Rapor & Özet")
+    out.list_items(insights)
+    out.write("</ul>")
+    out.table(df, limit=100_000)
+    out.data_table(products_df)      # 200 bin satır: sıkıştırılmış + sanal tablo
+"""
+
+import base64
+import html
+import json
+import zlib
+from string import Template
+
+import numpy as np
+import pandas as pd
+
+TABLE_CHUNK_ROWS = 5000
+BUFFER_SIZE = 1024 * 1024
+INLINE_TABLE_ROWS = 20
+VIRTUAL_TABLE_HEIGHT = 420
+GZIP_LEVEL = 6
+
+_ESCAPES = [('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;')]
+
+
+class safe(str):
+    """Kaçırılmadan yazılacak hazır HTML"""
+
+
+def escape(value):
+    """Tek değeri metin düğümü için kaçır (hazır HTML olduğu gibi kalır)"""
+    if isinstance(value, safe):
+        return value
+    return html.escape(str(value), quote=False)
+
+
+def escape_attr(value):
+    """Tek değeri tırnaklı HTML özniteliği için kaçır (" ve ' dahil)"""
+    return safe(html.escape(str(value), quote=True))
+
+
+def escape_series(series):
+    """Sütunu toplu kaçır: str'e çevir (eksik → boş) + vektörel değiştirme"""
+    text = series.astype(str).where(series.notna(), '')
+    for char, entity in _ESCAPES:
+        text = text.str.replace(char, entity, regex=False)
+    return text
+
+
+class ReportTemplate:
+    """Önceden ayrıştırılmış şablon: (sabit metin, yer tutucu) parçaları"""
+
+    def __init__(self, text):
+        self.text = text
+        self.parts = []
+        self.names = []
+        position = 0
+        for match in Template.pattern.finditer(text):
+            literal = text[position:match.start()]
+            if match.group('escaped') is not None:
+                self.parts.append((literal + '$', None))
+            elif match.group('invalid') is not None:
+                raise ValueError(f"Geçersiz şablon yer tutucusu: {text[match.start():match.start() + 20]!r}")
+            else:
+                name = match.group('named') or match.group('braced')
+                self.parts.append((literal, name))
+                self.names.append(name)
+            position = match.end()
+        self.parts.append((text[position:], None))
+
+    def pieces(self, values):
+        """Yazılacak metin parçaları (değerler kaçırılmış)"""
+        for literal, name in self.parts:
+            if literal:
+                yield literal
+            if name is not None:
+                yield escape(values[name])
+
+    def render(self, **values):
+        return ''.join(self.pieces(values))
+
+
+_TEMPLATES = {}
+
+
+def template(text):
+    """Derlenmiş şablon - aynı metin süreç başına bir kez ayrıştırılır"""
+    compiled = _TEMPLATES.get(text)
+    if compiled is None:
+        compiled = _TEMPLATES[text] = ReportTemplate(text)
+    return compiled
+
+
+class ReportWriter:
+    """Raporu bölüm bölüm dosyaya yaz"""
+
+    def __init__(self, path, chunk_rows=TABLE_CHUNK_ROWS):
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.file = None
+        self.virtual_tables = 0
+
+    def __enter__(self):
+        self.file = open(self.path, 'w', encoding='utf-8', buffering=BUFFER_SIZE)
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def write(self, text):
+        """Hazır HTML yaz"""
+        self.file.write(text)
+
+    def render(self, report_template, **values):
+        """Şablonu değerlerle yaz (ReportTemplate ya da şablon metni)"""
+        if not isinstance(report_template, ReportTemplate):
+            report_template = template(report_template)
+        self.file.writelines(report_template.pieces(values))
+
+    def list_items(self, values, tag='li'):
+        """Her değer için <li>...</li> - toplu kaçırılır"""
+        self.file.writelines(f'<{tag}>{escape(value)}</{tag}>' for value in values)
+
+    def table(self, data, columns=None, limit=None, header=True, css_class='data-table'):
+        """Tablo yaz: DataFrame (parça parça, vektörel) ya da sözlük listesi
+
+        columns: yazılacak sütunlar (varsayılan: hepsi / ilk kaydın anahtarları)
+        limit: en fazla satır sayısı
+        """
+        self.write(f"<table class='{css_class}'>")
+        if isinstance(data, pd.DataFrame):
+            self._frame_rows(data, columns, limit, header)
+        elif data:
+            self._record_rows(data, columns, limit, header)
+        self.write("</table>")
+
+    def data_table(self, data, columns=None, css_class='data-table', height=VIRTUAL_TABLE_HEIGHT):
+        """Tam sonuç tablosu: küçükse düz HTML, büyükse sıkıştırılmış sanal tablo"""
+        rows = len(data) if data is not None else 0
+        if rows <= INLINE_TABLE_ROWS:
+            self.table(data, columns=columns, css_class=css_class)
+            return
+        if not isinstance(data, pd.DataFrame):
+            data = pd.DataFrame.from_records(data, columns=columns)
+        self.virtual_table(data, columns=columns, css_class=css_class, height=height)
+
+    def virtual_table(self, df, columns=None, css_class='data-table', height=VIRTUAL_TABLE_HEIGHT):
+        """DataFrame'i gzip+base64 JSON bloğu + sanal kaydırmalı tablo olarak yaz"""
+        columns = list(df.columns) if columns is None else list(columns)
+        if self.virtual_tables == 0:
+            self.write(VIRTUAL_TABLE_ASSETS)
+        self.virtual_tables += 1
+        table_id = f"sgs-vt-{self.virtual_tables}"
+
+        self.render(VIRTUAL_TABLE, table_id=table_id, css_class=css_class, height=height, rows=len(df))
+        self.write(f'<script type="application/json" id="{table_id}-data" data-encoding="gzip+base64">')
+        self._write_compressed(self._json_pieces(df, columns))
+        self.write(f'</script><script>sgsVirtualTable("{table_id}")</script>')
+
+    def _json_pieces(self, df, columns):
+        """{"columns": [...], "data": [[sütun 1], [sütun 2], ...]} - parça parça"""
+        yield '{"columns":' + json.dumps([str(col) for col in columns], ensure_ascii=False) + ',"data":['
+        for i, col in enumerate(columns):
+            yield ',[' if i else '['
+            for start in range(0, len(df), self.chunk_rows):
+                values = _json_values(df[col].iloc[start:start + self.chunk_rows])
+                yield (',' if start else '') + json.dumps(values, ensure_ascii=False, default=str)[1:-1]
+            yield ']'
+        yield ']}'
+
+    def _write_compressed(self, pieces):
+        """Metin parçalarını gzip'le, base64 olarak akıt (3 baytlık sınırlarda)"""
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        pending = b''
+        for piece in pieces:
+            pending += compressor.compress(piece.encode('utf-8'))
+            cut = len(pending) - len(pending) % 3
+            if cut:
+                self.write(base64.b64encode(pending[:cut]).decode('ascii'))
+                pending = pending[cut:]
+        pending += compressor.flush()
+        self.write(base64.b64encode(pending).decode('ascii'))
+
+    def key_value_table(self, data, css_class='data-table'):
+        """Sözlük: her anahtar için <strong>anahtar</strong> | değer satırı"""
+        self.write(f"<table class='{css_class}'>")
+        self.file.writelines(f"<tr><td><strong>{escape(key)}</strong></td><td>{escape(value)}</td></tr>"
+                             for key, value in data.items())
+        self.write("</table>")
+
+    def _header(self, columns):
+        self.write("<tr>" + ''.join(f"<th>{escape(col)}</th>" for col in columns) + "</tr>")
+
+    def _frame_rows(self, df, columns, limit, header):
+        columns = list(df.columns) if columns is None else list(columns)
+        if header:
+            self._header(columns)
+        rows = len(df) if limit is None else min(limit, len(df))
+
+        for start in range(0, rows, self.chunk_rows):
+            chunk = df.iloc[start:min(start + self.chunk_rows, rows)]
+            line = pd.Series('<tr><td>', index=chunk.index)
+            for i, col in enumerate(columns):
+                line = line + ('</td><td>' if i else '') + escape_series(chunk[col])
+            line = line + '</td></tr>'
+            self.file.writelines(line.tolist())
+
+    def _record_rows(self, records, columns, limit, header):
+        columns = list(records[0].keys()) if columns is None else list(columns)
+        if header:
+            self._header(columns)
+        for item in records[:limit]:
+            self.write("<tr>" + ''.join(f"<td>{escape(item.get(col, ''))}</td>" for col in columns) + "</tr>")
+
+
+def _json_values(series):
+    """Sütun parçası → JSON uyumlu liste (NaN/sonsuz → null)"""
+    if pd.api.types.is_float_dtype(series.dtype):
+        values = series.to_numpy(dtype='float64')
+        valid = np.isfinite(values)
+        if valid.all():
+            return values.tolist()
+        return [value if ok else None for value, ok in zip(values.tolist(), valid)]
+    if series.hasnans:
+        return series.astype(object).where(series.notna(), None).tolist()
+    return series.tolist()
+
+
+VIRTUAL_TABLE = template("""<div class="sgs-vt" id="$table_id" data-rows="$rows">
+<div class="sgs-vt-bar"><input type="search" placeholder="🔎 Filtrele..."><span class="sgs-vt-info">$rows satır yükleniyor...</span></div>
+<table class="$css_class sgs-vt-head"><thead><tr></tr></thead></table>
+<div class="sgs-vt-port" style="height: ${height}px;"><div class="sgs-vt-spacer"></div>
+<table class="$css_class sgs-vt-body"><tbody></tbody></table></div>
+</div>
+""")
+
+VIRTUAL_TABLE_ASSETS = """<style>
+.sgs-vt { margin: 15px 0; }
+.sgs-vt-bar { display: flex; gap: 12px; align-items: center; margin-bottom: 8px; }
+.sgs-vt-bar input { flex: 1; padding: 6px 10px; border: 1px solid #ccc; border-radius: 6px; }
+.sgs-vt-info { color: #666; font-size: 0.9em; white-space: nowrap; }
+.sgs-vt table { table-layout: fixed; width: 100%; margin: 0; }
+.sgs-vt-head th { cursor: pointer; user-select: none; }
+.sgs-vt-port { position: relative; overflow-y: auto; }
+.sgs-vt-body { position: absolute; top: 0; left: 0; }
+.sgs-vt-body td { height: 24px; padding: 4px 12px; overflow: hidden; white-space: nowrap; text-overflow: ellipsis; }
+</style>
+<script>
+function sgsVirtualTable(id) {
+  var box = document.getElementById(id), source = document.getElementById(id + '-data');
+  var ROW = 33, EXTRA = 10;
+  function esc(v) {
+    return v === null || v === undefined ? '' : String(v).replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+  }
+  function decode() {
+    var binary = atob(source.textContent), bytes = new Uint8Array(binary.length);
+    for (var i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+    var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+    return new Response(stream).json();
+  }
+  function mount(table) {
+    var cols = table.columns, data = table.data, total = cols.length ? data[0].length : 0;
+    var head = box.querySelector('.sgs-vt-head tr'), port = box.querySelector('.sgs-vt-port');
+    var spacer = box.querySelector('.sgs-vt-spacer'), body = box.querySelector('.sgs-vt-body');
+    var tbody = body.querySelector('tbody'), info = box.querySelector('.sgs-vt-info');
+    var input = box.querySelector('input'), collator = new Intl.Collator('tr', {numeric: true});
+    var all = [], view, text = null, sortCol = -1, ascending = true, pending = false;
+    for (var r = 0; r < total; r++) all.push(r);
+    view = all;
+    head.innerHTML = cols.map(function (c, i) { return '<th data-col="' + i + '">' + esc(c) + '</th>'; }).join('');
+    function render() {
+      pending = false;
+      var first = Math.max(0, Math.floor(port.scrollTop / ROW) - EXTRA);
+      var last = Math.min(view.length, first + Math.ceil(port.clientHeight / ROW) + 2 * EXTRA), html = '';
+      for (var i = first; i < last; i++) {
+        html += '<tr>';
+        for (var c = 0; c < cols.length; c++) html += '<td>' + esc(data[c][view[i]]) + '</td>';
+        html += '</tr>';
+      }
+      body.style.top = first * ROW + 'px';
+      tbody.innerHTML = html;
+    }
+    function refresh() {
+      spacer.style.height = view.length * ROW + 'px';
+      info.textContent = view.length === total ? total + ' satır' : view.length + ' / ' + total + ' satır';
+      render();
+    }
+    function compare(a, b) {
+      var x = data[sortCol][a], y = data[sortCol][b];
+      if (x === null) return y === null ? 0 : 1;
+      if (y === null) return -1;
+      var order = typeof x === 'number' && typeof y === 'number' ? x - y : collator.compare(String(x), String(y));
+      return ascending ? order : -order;
+    }
+    function apply() {
+      var query = input.value.trim().toLocaleLowerCase('tr');
+      if (query) {
+        if (text === null) {
+          text = all.map(function (r) {
+            return data.map(function (column) { return column[r] === null ? '' : String(column[r]); }).join('\u0001').toLocaleLowerCase('tr');
+          });
+        }
+        view = all.filter(function (r) { return text[r].indexOf(query) !== -1; });
+      } else {
+        view = all.slice();
+      }
+      if (sortCol >= 0) view.sort(compare);
+      port.scrollTop = 0;
+      refresh();
+    }
+    head.addEventListener('click', function (event) {
+      var cell = event.target.closest('th');
+      if (!cell) return;
+      var col = +cell.dataset.col;
+      ascending = col === sortCol ? !ascending : true;
+      sortCol = col;
+      apply();
+    });
+    var timer = null;
+    input.addEventListener('input', function () { clearTimeout(timer); timer = setTimeout(apply, 150); });
+    port.addEventListener('scroll', function () {
+      if (!pending) { pending = true; requestAnimationFrame(render); }
+    });
+    refresh();
+    if (tbody.rows.length) {
+      ROW = tbody.rows[0].getBoundingClientRect().height || ROW;
+      refresh();
+    }
+  }
+  if (typeof DecompressionStream === 'undefined') {
+    box.querySelector('.sgs-vt-info').textContent = 'Tablo için güncel bir tarayıcı gerekli';
+    return;
+  }
+  decode().then(mount);
+}
+</script>
+"""
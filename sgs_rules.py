@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS Rules - Bildirimsel bulgu kuralları
+Her kural ihtiyaç duyduğu ara sonuçları (trend sütunu, kategori toplamları...)
+bildirir; motor her ara sonucu bir kez hesaplar, birbirinden bağımsız
+kuralları thread havuzunda çalıştırır, hatayı kural başına yalıtır ve kural
+başına süre kaydeder. Bulgular kayıt sırasıyla döner.
+
+Kullanım:
+import sgs_rules
+rules = sgs_rules.RuleSet('örnek')
+
+@rules.derive('trend')
+def _trend(ctx):
+    return ctx.data['yeni'] - ctx.data['eski']
+
+@rules.rule('yükselen', requires=['trend'], title='📈 Trend analizi...')
+def _rising(ctx):
+    return [f"🚀 {ctx['trend'].idxmax()}"]
+
+result = rules.run(df, threads=4)
+result.insights
+result.print_timings()
+"""
+
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import sgs_profile
+
+
+class Rule:
+    """Tek bulgu kuralı: fonksiyon(ctx) → bulgu listesi"""
+
+    def __init__(self, name, fn, requires=(), title=None):
+        self.name = name
+        self.fn = fn
+        self.requires = tuple(requires)
+        self.title = title
+
+
+class RuleRun:
+    """Bir kuralın çalışma sonucu"""
+
+    def __init__(self, rule):
+        self.rule = rule
+        self.insights = []
+        self.logs = []
+        self.error = None
+        self.wall = 0.0
+
+    @property
+    def name(self):
+        return self.rule.name
+
+    def to_dict(self):
+        return {
+            'rule': self.name,
+            'wall_s': round(self.wall, 6),
+            'insights': len(self.insights),
+            'error': self.error
+        }
+
+
+class Context:
+    """Kurallar arasında paylaşılan ara sonuçlar - her biri bir kez hesaplanır"""
+
+    def __init__(self, ruleset, data, params):
+        self.ruleset = ruleset
+        self.data = data
+        self.params = params
+        self.values = {}
+        self.timings = {}
+        self._locks = {name: threading.Lock() for name in ruleset.derived}
+
+    def get(self, name):
+        if name in self.values:
+            return self.values[name]
+        if name not in self.ruleset.derived:
+            raise KeyError(f"Tanımsız ara sonuç: {name}")
+
+        # Aynı ara sonucu isteyen diğer thread'ler hesaplama bitene kadar bekler
+        with self._locks[name]:
+            if name not in self.values:
+                requires, fn = self.ruleset.derived[name]
+                for dependency in requires:
+                    self.get(dependency)
+                start = time.perf_counter()
+                with sgs_profile.span(f"ara {name}", category='derive'):
+                    value = fn(self)
+                self.timings[name] = time.perf_counter() - start
+                self.values[name] = value
+        return self.values[name]
+
+    def __getitem__(self, name):
+        return self.get(name)
+
+
+class RuleScope:
+    """Kuralın gördüğü bağlam: sadece bildirdiği ara sonuçlar + log"""
+
+    def __init__(self, context, run):
+        self._context = context
+        self._run = run
+        self.data = context.data
+        self.params = context.params
+
+    def __getitem__(self, name):
+        if name not in self._run.rule.requires:
+            raise KeyError(f"'{self._run.name}' kuralı '{name}' ara sonucunu bildirmemiş")
+        return self._context.get(name)
+
+    def log(self, message):
+        """İlerleme mesajı - kural sırasıyla yazdırılır"""
+        self._run.logs.append(message)
+
+
+class RunResult:
+    """Motor çıktısı: bulgular (kural sırasıyla), kural ve ara sonuç süreleri"""
+
+    def __init__(self, runs, context, threads, wall):
+        self.runs = runs
+        self.context = context
+        self.threads = threads
+        self.wall = wall
+
+    @property
+    def insights(self):
+        return [insight for run in self.runs for insight in run.insights]
+
+    @property
+    def errors(self):
+        return {run.name: run.error for run in self.runs if run.error}
+
+    def to_dict(self):
+        return {
+            'threads': self.threads,
+            'wall_s': round(self.wall, 6),
+            'rules': [run.to_dict() for run in self.runs],
+            'derived': {name: round(wall, 6) for name, wall in self.context.timings.items()}
+        }
+
+    def print_timings(self):
+        """Kural ve ara sonuç sürelerini yazdır"""
+        print(f"\n⏱️ KURAL SÜRELERİ ({self.threads} thread, toplam {self.wall:.3f} sn)")
+        for run in sorted(self.runs, key=lambda r: r.wall, reverse=True):
+            status = f"❌ {run.error}" if run.error else f"{len(run.insights)} bulgu"
+            print(f"   {run.name:<28} {run.wall:>8.3f} sn  {status}")
+        for name, wall in sorted(self.context.timings.items(), key=lambda item: item[1], reverse=True):
+            print(f"   {'(ara) ' + name:<28} {wall:>8.3f} sn")
+
+
+class RuleSet:
+    """Kural ve ara sonuç kayıt defteri"""
+
+    def __init__(self, name):
+        self.name = name
+        self.rules = []
+        self.derived = {}
+
+    def derive(self, name, requires=()):
+        """Ara sonuç kaydet: fonksiyon(ctx) → değer"""
+        def register(fn):
+            self.derived[name] = (tuple(requires), fn)
+            return fn
+        return register
+
+    def rule(self, name, requires=(), title=None):
+        """Kural kaydet: fonksiyon(ctx) → bulgu listesi (kayıt sırası = çıktı sırası)"""
+        def register(fn):
+            missing = [r for r in requires if r not in self.derived]
+            if missing:
+                raise KeyError(f"'{name}' kuralı için tanımsız ara sonuç: {', '.join(missing)}")
+            self.rules.append(Rule(name, fn, requires, title))
+            return fn
+        return register
+
+    def _execute(self, context, run, parent):
+        """Tek kural - hata sadece bu kuralı düşürür"""
+        start = time.perf_counter()
+        try:
+            with sgs_profile.span(f"kural {run.name}", category='rule', parent=parent):
+                scope = RuleScope(context, run)
+                for name in run.rule.requires:
+                    context.get(name)
+                run.insights = list(run.rule.fn(scope) or [])
+        except Exception as e:
+            run.error = f"{type(e).__name__}: {e}"
+        run.wall = time.perf_counter() - start
+        return run
+
+    def run(self, data, threads=None, verbose=True, **params):
+        """Tüm kuralları çalıştır
+
+        threads: thread sayısı (varsayılan: min(kural sayısı, çekirdek sayısı));
+        1 verilirse kurallar sırayla bu thread'de çalışır.
+        verbose: kural başlıkları, logları ve hatalar kural sırasıyla yazdırılır
+        """
+        context = Context(self, data, params)
+        runs = [RuleRun(rule) for rule in self.rules]
+        threads = threads or min(len(runs), os.cpu_count() or 1) or 1
+        parent = sgs_profile.current_span()
+        start = time.perf_counter()
+
+        if threads <= 1:
+            for run in runs:
+                self._execute(context, run, parent)
+                if verbose:
+                    _print_run(run)
+        else:
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                futures = [pool.submit(self._execute, context, run, parent) for run in runs]
+                for future in futures:
+                    run = future.result()
+                    if verbose:
+                        _print_run(run)
+
+        return RunResult(runs, context, threads, time.perf_counter() - start)
+
+
+def _print_run(run):
+    if run.rule.title:
+        print(run.rule.title)
+    for message in run.logs:
+        print(message)
+    if run.error:
+        print(f"⚠️ '{run.name}' kuralı atlandı: {run.error}")
@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS Server - Veri setlerini bellekte sıcak tutan yerel HTTP analiz servisi
+Dosyalar bir kez yüklenir; SimpleBI soruları, sgs_power bulguları ve SQL
+sorguları aynı süreçte, bellekteki veri üzerinde yanıtlanır. İstekler asyncio
+ile karşılanır, ağır hesaplama thread havuzunda çalışır (olay döngüsü
+bloklanmaz). Dosya değişince (mtime) veri seti arka planda yeniden yüklenir.
+
+Uç noktalar (JSON; parametreler sorgu dizesi ya da JSON gövde):
+GET  /health
+GET  /datasets
+GET  /ask?q=En karlı kategoriler neler?&dataset=image_table_cs
+POST /sql  {"q": "SELECT Kategori, COUNT(*) FROM data GROUP BY 1", "limit": 1000}
+                                 (sadece JSON gövde, Content-Type: application/json)
+GET  /power                      (sales.db bulguları, veri değişene kadar önbellekte)
+POST /reload?dataset=...         (zorla yeniden yükle)
+
+Kullanım:
+python sgs_server.py image-table-cs.xlsx diger.csv [--db sales.db] [--port 8765] [--workers N] [--poll 2]
+curl 'http://127.0.0.1:8765/ask?q=Kaç ürünün fotoğrafı eksik?'
+curl -H 'Content-Type: application/json' -d '{"q": "SELECT COUNT(*) FROM data"}' http://127.0.0.1:8765/sql
+
+Güvenlik: Host başlığı yerel adlardan biri olmalı (DNS rebinding), /sql tarayıcının
+ön kontrolsüz gönderebileceği GET/form isteklerini kabul etmez ve DuckDB oturumu
+dosya/ağ erişimi kapalı çalışır (COPY TO, read_text, ATTACH reddedilir).
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qsl
+
+import numpy as np
+import pandas as pd
+
+import sgs_db
+import sgs_mirror
+import sgs_power
+from simplebi import SimpleBI
+from sgs_sql import SQLSession, _table_name
+
+HOST = '127.0.0.1'
+PORT = 8765
+POLL_INTERVAL = 2.0
+SQL_ROW_LIMIT = 1000
+MAX_BODY_BYTES = 1024 * 1024
+
+LOCAL_HOSTS = ('localhost', '127.0.0.1', '::1')
+JSON_ONLY_ROUTES = ('/sql',)
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 403: 'Forbidden', 404: 'Not Found', 405: 'Method Not Allowed',
+               413: 'Payload Too Large', 415: 'Unsupported Media Type', 500: 'Internal Server Error'}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _to_json(value):
+    """Analiz sonucu → JSON uyumlu değer (DataFrame/Series: split biçimi, NaN → null)"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return json.loads(value.to_json(orient='split', force_ascii=False, date_format='iso'))
+    if isinstance(value, dict):
+        return {str(key): _to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+def _host_name(value):
+    """Host başlığından port'suz ad: 'localhost:8765' → 'localhost', '[::1]:8765' → '::1'"""
+    value = value.strip().lower()
+    if value.startswith('['):
+        return value[1:value.find(']')] if ']' in value else value
+    return value.rsplit(':', 1)[0] if value.count(':') == 1 else value
+
+
+def _mtime(path):
+    """Değişiklik imzası - SQLite için WAL dosyası da dahil"""
+    return sgs_db.file_version(path)
+
+
+class Dataset:
+    """Bellekte tutulan tek dosya: SimpleBI örneği + SQL tablosu"""
+
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+        self.bi = None
+        self.mtime = None
+        self.version = 0
+        self.loaded_at = None
+        self.load_seconds = 0.0
+        self.error = None
+
+    def load(self):
+        """Dosyayı oku - başarısızsa önceki sürüm kullanılmaya devam eder"""
+        mtime = _mtime(self.path)
+        start = time.perf_counter()
+        bi = SimpleBI(self.path, verbose=False)
+        if bi.df is None:
+            self.error = f"{self.path} yüklenemedi"
+            self.mtime = mtime
+            return False
+        self.bi = bi
+        self.mtime = mtime
+        self.version += 1
+        self.loaded_at = time.time()
+        self.load_seconds = time.perf_counter() - start
+        self.error = None
+        return True
+
+    def stale(self):
+        return _mtime(self.path) != self.mtime
+
+    def info(self):
+        df = self.bi.df if self.bi is not None else None
+        return {
+            'name': self.name,
+            'path': self.path,
+            'rows': len(df) if df is not None else 0,
+            'columns': list(df.columns) if df is not None else [],
+            'version': self.version,
+            'loaded_at': self.loaded_at,
+            'load_seconds': round(self.load_seconds, 4),
+            'error': self.error,
+            'cache': self.bi.cache_info() if self.bi is not None else None
+        }
+
+
+class PowerSource:
+    """sgs_power pandas yolu: tuzla_loglar bellekte, bulgular veri sürümü başına önbellekte"""
+
+    def __init__(self, db_path, jobs=1, threads=None):
+        self.name = 'power'
+        self.path = db_path
+        self.jobs = jobs
+        self.threads = threads
+        self.df = None
+        self.mtime = None
+        self.version = 0
+        self.error = None
+        self.result = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        mtime = _mtime(self.path)
+        df = sgs_mirror.read_table(self.path, 'tuzla_loglar')
+        with self._lock:
+            self.df = df
+            self.mtime = mtime
+            self.version += 1
+            self.error = None
+            self.result = None
+        return True
+
+    def stale(self):
+        return _mtime(self.path) != self.mtime
+
+    def insights(self):
+        """Bulgular - aynı veri sürümü için bir kez hesaplanır"""
+        with self._lock:
+            if self.result is None or self.result[0] != self.version:
+                run = sgs_power.rules.run(self.df, threads=self.threads, verbose=False,
+                                          db_path=self.path, jobs=self.jobs)
+                self.result = (self.version, {
+                    'rows': len(self.df),
+                    'insights': run.insights,
+                    'errors': run.errors,
+                    'timings': run.to_dict()
+                })
+            return self.result[1]
+
+
+class AnalysisServer:
+    """asyncio HTTP sunucusu + thread havuzu + sıcak veri setleri"""
+
+    def __init__(self, files=(), db_path=None, host=HOST, port=PORT, workers=None,
+                 poll_interval=POLL_INTERVAL, power_jobs=1):
+        self.host = host
+        self.port = port
+        self.poll_interval = poll_interval
+        self.workers = workers or min(8, (os.cpu_count() or 1) + 2)
+        self.pool = ThreadPoolExecutor(max_workers=self.workers)
+        self.datasets = {}
+        for path in files:
+            name = _table_name(os.path.splitext(os.path.basename(path))[0])
+            self.datasets[name] = Dataset(name, path)
+        self.power = PowerSource(db_path, jobs=power_jobs) if db_path else None
+        self.sql = SQLSession()
+        self._sql_lock = threading.Lock()
+        self._reload_locks = {}
+        self.server = None
+        self.requests = 0
+
+    # --- Veri setleri ---
+
+    def _register_sql(self, dataset):
+        with self._sql_lock:
+            self.sql.register(dataset.name, dataset.bi.df, source=dataset.path)
+            # İlk veri seti geriye uyumluluk için 'data' olarak da sorgulanabilir
+            if 'data' not in self.datasets and next(iter(self.datasets)) == dataset.name:
+                self.sql.register('data', dataset.bi.df, source=dataset.path)
+
+    def _load_dataset(self, source):
+        """Thread havuzunda: dosyayı oku, SQL tablosunu güncelle"""
+        try:
+            loaded = source.load()
+        except Exception as e:
+            source.mtime = _mtime(source.path)
+            source.error = f"{type(e).__name__}: {e}"
+            loaded = False
+        if not loaded:
+            print(f"⚠️ {source.path}: {source.error}")
+            return
+        if isinstance(source, Dataset):
+            self._register_sql(source)
+            print(f"📄 {source.path} → '{source.name}' ({len(source.bi.df)} satır, sürüm {source.version}, "
+                  f"{source.load_seconds:.2f} sn)")
+        else:
+            print(f"🗄️ {source.path} → tuzla_loglar ({len(source.df)} satır, sürüm {source.version})")
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.pool, fn, *args)
+
+    async def _reload(self, source, force=False):
+        """Değiştiyse yeniden yükle - aynı kaynak için tek yükleme"""
+        lock = self._reload_locks.setdefault(source.path, asyncio.Lock())
+        async with lock:
+            if force or source.stale():
+                await self._run(self._load_dataset, source)
+
+    def _sources(self):
+        return list(self.datasets.values()) + ([self.power] if self.power else [])
+
+    async def _watch(self):
+        """Dosya değişikliklerini izle (mtime yoklaması)"""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            for source in self._sources():
+                if source.stale():
+                    print(f"🔄 {source.path} değişti, yeniden yükleniyor...")
+                    await self._reload(source)
+
+    def _dataset(self, params):
+        name = params.get('dataset') or next(iter(self.datasets), None)
+        dataset = self.datasets.get(name)
+        if dataset is None:
+            raise HTTPError(404, f"Veri seti bulunamadı: {name}")
+        if dataset.bi is None:
+            raise HTTPError(500, dataset.error or f"{name} yüklenmedi")
+        return dataset
+
+    # --- Uç noktalar ---
+
+    async def _health(self, params):
+        return {'status': 'ok', 'datasets': len(self.datasets), 'requests': self.requests}
+
+    async def _list(self, params):
+        result = {'datasets': [dataset.info() for dataset in self.datasets.values()]}
+        if self.power:
+            result['power'] = {'path': self.power.path, 'version': self.power.version,
+                               'rows': len(self.power.df) if self.power.df is not None else 0}
+        return result
+
+    async def _ask(self, params):
+        question = params.get('q') or params.get('question')
+        if not question:
+            raise HTTPError(400, "'q' parametresi gerekli")
+        dataset = self._dataset(params)
+        bi = dataset.bi
+        result = await self._run(bi.ask, question)
+        return {'dataset': dataset.name, 'version': dataset.version, 'question': question, **_to_json(result)}
+
+    def _query(self, sql, limit):
+        with self._sql_lock:
+            df = self.sql.query(sql)
+        return {'rows': len(df), 'truncated': len(df) > limit, 'result': _to_json(df.head(limit))}
+
+    async def _sql(self, params):
+        sql = params.get('q') or params.get('sql')
+        if not sql:
+            raise HTTPError(400, "'q' parametresi gerekli")
+        limit = int(params.get('limit', SQL_ROW_LIMIT))
+        try:
+            return {'sql': sql, **await self._run(self._query, sql, limit)}
+        except Exception as e:
+            raise HTTPError(400, f"SQL hatası: {e}")
+
+    async def _power(self, params):
+        if self.power is None or self.power.df is None:
+            raise HTTPError(404, "sgs_power için veritabanı yüklenmedi (--db sales.db)")
+        return {'db': self.power.path, 'version': self.power.version, **await self._run(self.power.insights)}
+
+    async def _force_reload(self, params):
+        name = params.get('dataset')
+        sources = [s for s in self._sources() if name in (None, s.name)]
+        if not sources:
+            raise HTTPError(404, f"Veri seti bulunamadı: {name}")
+        for source in sources:
+            await self._reload(source, force=True)
+        return {'reloaded': [source.name for source in sources]}
+
+    ROUTES = {
+        '/health': ('GET', '_health'),
+        '/datasets': ('GET', '_list'),
+        '/ask': ('GET', '_ask'),
+        '/sql': ('POST', '_sql'),
+        '/power': ('GET', '_power'),
+        '/reload': ('POST', '_force_reload')
+    }
+
+    # --- HTTP ---
+
+    def _check_host(self, headers):
+        """DNS rebinding: sadece yerel adlarla (ya da dinlenen adresle) gelen istekler"""
+        host = headers.get('host')
+        if host is None or _host_name(host) not in LOCAL_HOSTS + (self.host.lower(),):
+            raise HTTPError(403, f"İzin verilmeyen Host: {host}")
+
+    async def _dispatch(self, method, target, body, headers):
+        self._check_host(headers)
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        route = self.ROUTES.get(path)
+        if route is None:
+            raise HTTPError(404, f"Bilinmeyen yol: {url.path}")
+        allowed, handler = route
+        if method not in (allowed, 'POST'):
+            raise HTTPError(405, f"{url.path} için {allowed} kullanın")
+
+        if path in JSON_ONLY_ROUTES:
+            # Tarayıcı application/json gövdeyi ön kontrolsüz (CORS preflight) gönderemez
+            if method != 'POST':
+                raise HTTPError(405, f"{url.path} için POST kullanın")
+            if headers.get('content-type', '').split(';')[0].strip().lower() != 'application/json':
+                raise HTTPError(415, f"{url.path} için Content-Type: application/json gerekli")
+            params = {}
+        else:
+            params = dict(parse_qsl(url.query))
+        if body:
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                raise HTTPError(400, "Gövde geçerli JSON değil")
+            if not isinstance(payload, dict):
+                raise HTTPError(400, "Gövde JSON nesnesi olmalı")
+            params.update({key: str(value) for key, value in payload.items()})
+
+        # Dosya değiştiyse isteği yanıtlamadan önce yeniden yükle
+        if handler in ('_ask', '_sql', '_list'):
+            for dataset in self.datasets.values():
+                if dataset.stale():
+                    await self._reload(dataset)
+        elif handler == '_power' and self.power and self.power.stale():
+            await self._reload(self.power)
+
+        return await getattr(self, handler)(params)
+
+    async def _handle(self, reader, writer):
+        """Tek bağlantı - HTTP/1.1 keep-alive destekli"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {'error': 'Geçersiz istek satırı'}, keep_alive=False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    key, _, value = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = value.strip()
+
+                keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                length = int(headers.get('content-length', 0) or 0)
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {'error': 'Gövde çok büyük'}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                self.requests += 1
+                try:
+                    status, payload = 200, await self._dispatch(method.upper(), target, body.decode('utf-8'), headers)
+                except HTTPError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except Exception as e:
+                    status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    async def start(self):
+        """Veri setlerini yükle, dinlemeye başla"""
+        await asyncio.gather(*(self._reload(source, force=True) for source in self._sources()))
+        # Tablolar kaydedildi: SQL ile dosya/ağ erişimi kapatılır (geri açılamaz; yeniden
+        # yüklenen DataFrame'ler yine kaydedilebilir)
+        with self._sql_lock:
+            self.sql.conn.execute("SET enable_external_access = false")
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self._watcher = asyncio.create_task(self._watch())
+        print(f"🌐 SGS servisi: http://{self.host}:{self.port} ({len(self.datasets)} veri seti, "
+              f"{self.workers} işçi thread)")
+
+    async def serve_forever(self):
+        await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def stop(self):
+        if self.server is not None:
+            self._watcher.cancel()
+            self.server.close()
+            await self.server.wait_closed()
+        self.pool.shutdown(wait=False)
+        self.sql.close()
+
+
+def serve(files=(), db_path=None, host=HOST, port=PORT, workers=None, poll_interval=POLL_INTERVAL, power_jobs=1):
+    """Servisi başlat (Ctrl+C ile durur)"""
+    server = AnalysisServer(files, db_path, host, port, workers, poll_interval, power_jobs)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\n👋 SGS servisi durduruldu")
+
+
+if __name__ == "__main__":
+    files, db_path = [], None
+    host, port, workers, poll_interval, jobs = HOST, PORT, None, POLL_INTERVAL, 1
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        option = args[i]
+        value = args[i + 1] if i + 1 < len(args) else None
+        if option == '--db' and value:
+            db_path = value
+            i += 1
+        elif option == '--host' and value:
+            host = value
+            i += 1
+        elif option == '--port' and value:
+            port = int(value)
+            i += 1
+        elif option == '--workers' and value:
+            workers = int(value)
+            i += 1
+        elif option == '--poll' and value:
+            poll_interval = float(value)
+            i += 1
+        elif option == '--jobs' and value:
+            jobs = int(value)
+            i += 1
+        elif not option.startswith('--'):
+            files.append(option)
+        i += 1
+
+    # Argümansız: çalışma dizinindeki varsayılan dosyalar
+    if not files and os.path.exists('image-table-cs.xlsx'):
+        files = ['image-table-cs.xlsx']
+    if db_path is None and os.path.exists('sales.db'):
+        db_path = 'sales.db'
+    if not files and not db_path:
+        print("Kullanım: python sgs_server.py dosya.xlsx [diger.csv ...] [--db sales.db] [--port 8765] "
+              "[--workers N] [--poll 2] [--jobs N]")
+        sys.exit(1)
+
+    print("🚀 SGS SERVER")
+    print("=" * 50)
+    serve(files, db_path, host, port, workers, poll_interval, jobs)
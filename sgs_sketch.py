@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS Sketch - Birleştirilebilir yaklaşık özetler
+Tüm sütunu bellekte tutmadan quantile ve farklı değer sayısı:
+
+- KLL: quantile taslağı; sıra (rank) hatası ≈ epsilon, bellek O(1/epsilon)
+- HyperLogLog: farklı değer sayısı; göreli hata ≈ epsilon, bellek 2^p bayt
+
+İkisi de parça parça (update) beslenir ve merge() ile birleştirilir: CSV
+parçaları, şubeler ya da süreçler ayrı taslak tutar, sonuçta birleştirilir.
+Aynı arayüzde kesin sürümler (ExactQuantiles, ExactDistinct) de vardır;
+mode='exact' | 'approx' ile seçilir (varsayılan: SGS_SKETCH ortam değişkeni,
+yoksa 'exact'). Kesin quantile pandas ile aynı sonucu verir (lineer enterpolasyon).
+
+Kullanım:
+import sgs_sketch
+q = sgs_sketch.quantile_sketch(mode='approx', epsilon=0.01)
+for chunk in chunks:
+    q.update(chunk['Görüntülenme'])
+q.quantile(0.7)
+
+sgs_sketch.column_quantile(df['Fiyat'], 0.75, mode='approx')
+sgs_sketch.nunique(df['Ürün Adı'], mode='approx')
+
+python sgs_sketch.py --check [epsilon]   (HyperLogLog sapma/dağılım kontrolü)
+"""
+
+import os
+import math
+import base64
+import numpy as np
+import pandas as pd
+
+MODES = ('exact', 'approx')
+DEFAULT_EPSILON = 0.01
+KLL_MIN_K = 8
+KLL_C = 2 / 3
+HLL_MIN_P = 4
+HLL_MAX_P = 18
+
+
+def default_mode():
+    """Ortamdan varsayılan mod (SGS_SKETCH=approx)"""
+    mode = os.environ.get('SGS_SKETCH', 'exact').lower()
+    return mode if mode in MODES else 'exact'
+
+
+def _check_mode(mode):
+    mode = mode or default_mode()
+    if mode not in MODES:
+        raise ValueError(f"Geçersiz mod: {mode} (exact/approx)")
+    return mode
+
+
+def _numeric(values):
+    """Sayısal, eksiksiz float64 dizi"""
+    array = pd.to_numeric(pd.Series(values) if not isinstance(values, pd.Series) else values,
+                          errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    return array[~np.isnan(array)]
+
+
+class KLL:
+    """KLL quantile taslağı (Karnin-Lang-Liberty)
+
+    Seviye h'deki her öğe 2^h orijinal değeri temsil eder; dolan seviye
+    sıralanıp tek/çift konumlardan biri (rastgele) üst seviyeye taşınır.
+    k, DataSketches'ın ampirik eşlemesiyle seçilir (epsilon ≈ 2.296 / k^0.9723):
+    epsilon=0.01 → k=265, sıra hatası yaklaşık epsilon * n.
+    """
+
+    def __init__(self, epsilon=DEFAULT_EPSILON, k=None, seed=0):
+        self.epsilon = epsilon
+        self.k = k or max(KLL_MIN_K, math.ceil((2.296 / epsilon) ** (1 / 0.9723)))
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * KLL_C ** depth)))
+
+    def update(self, values):
+        """Değerleri ekle (tek değer, liste ya da Series; NaN atlanır)"""
+        array = _numeric(np.atleast_1d(values) if np.isscalar(values) else values)
+        if len(array) == 0:
+            return self
+        self.count += len(array)
+        self.min = min(self.min, float(array.min()))
+        self.max = max(self.max, float(array.max()))
+        self.levels[0] = np.concatenate([self.levels[0], array])
+        self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # Tek sayıda öğe varsa biri bu seviyede kalır
+                keep = items[:len(items) % 2]
+                pairs = items[len(keep):]
+                promoted = pairs[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                # Büyük bir toplu ekleme tek seferde birkaç kez yarılanabilir
+                if len(self.levels[level]) > self._capacity(level):
+                    continue
+            level += 1
+
+    def merge(self, other):
+        """Başka bir KLL taslağını ekle"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _weighted(self):
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2 ** level, dtype='float64')
+                                  for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        return values[order], np.cumsum(weights[order])
+
+    def quantile(self, q):
+        """Yaklaşık q quantile'ı (boşsa NaN)"""
+        if self.count == 0:
+            return np.nan
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        values, cumulative = self._weighted()
+        target = q * cumulative[-1]
+        return float(values[min(np.searchsorted(cumulative, target, side='left'), len(values) - 1)])
+
+    def rank(self, value):
+        """value'dan küçük ya da eşit değerlerin yaklaşık oranı"""
+        if self.count == 0:
+            return np.nan
+        values, cumulative = self._weighted()
+        position = np.searchsorted(values, value, side='right')
+        return float(cumulative[position - 1] / cumulative[-1]) if position else 0.0
+
+    def size(self):
+        """Tutulan öğe sayısı (bellek göstergesi)"""
+        return sum(len(items) for items in self.levels)
+
+    def to_dict(self):
+        return {'kind': 'kll', 'k': self.k, 'epsilon': self.epsilon, 'count': self.count,
+                'min': self.min if self.count else None, 'max': self.max if self.count else None,
+                'levels': [items.tolist() for items in self.levels]}
+
+    @classmethod
+    def from_dict(cls, state):
+        sketch = cls(epsilon=state['epsilon'], k=state['k'])
+        sketch.levels = [np.asarray(items, dtype='float64') for items in state['levels']] or [np.empty(0)]
+        sketch.count = state['count']
+        sketch.min = state['min'] if state['min'] is not None else np.inf
+        sketch.max = state['max'] if state['max'] is not None else -np.inf
+        return sketch
+
+
+class ExactQuantiles:
+    """Kesin quantile - tüm değerler tutulur (pandas ile aynı sonuç)"""
+
+    def __init__(self, epsilon=None):
+        self.parts = []
+        self.count = 0
+
+    def update(self, values):
+        array = _numeric(np.atleast_1d(values) if np.isscalar(values) else values)
+        if len(array):
+            self.parts.append(array)
+            self.count += len(array)
+        return self
+
+    def merge(self, other):
+        self.parts.extend(other.parts)
+        self.count += other.count
+        return self
+
+    def _values(self):
+        if len(self.parts) > 1:
+            self.parts = [np.concatenate(self.parts)]
+        return self.parts[0] if self.parts else np.empty(0)
+
+    def quantile(self, q):
+        values = self._values()
+        return float(np.quantile(values, q)) if len(values) else np.nan
+
+    def rank(self, value):
+        values = self._values()
+        return float((values <= value).mean()) if len(values) else np.nan
+
+    def size(self):
+        return self.count
+
+    def to_dict(self):
+        return {'kind': 'exact_quantiles', 'values': self._values().tolist()}
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls().update(state['values'])
+
+
+def _hash64(values):
+    """Değerleri 64 bit hash'e çevir (pandas'ın sabit anahtarlı hash'i - süreçler arası aynı)"""
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    series = series.dropna()
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(series.cat.categories.dtype)
+    return pd.util.hash_pandas_object(series, index=False).to_numpy(dtype='uint64')
+
+
+def _bit_length(values):
+    """uint64 dizide bit uzunluğu (vektörel ikili arama)"""
+    values = values.copy()
+    length = np.zeros(len(values), dtype='int64')
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = values >> np.uint64(shift)
+        mask = high != 0
+        length[mask] += shift
+        values[mask] = high[mask]
+    return length + (values != 0)
+
+
+def _hll_sigma(x):
+    """Ertl σ(x) = x + Σ x^(2^k) 2^(k-1) - boş kayıt oranı için düzeltme"""
+    if x == 1:
+        return math.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        previous = z
+        z += x * y
+        y += y
+        if z == previous:
+            return z
+
+
+def _hll_tau(x):
+    """Ertl τ(x) - dolmuş (en yüksek değerli) kayıt oranı için düzeltme"""
+    if x == 0 or x == 1:
+        return 0.0
+    y, z = 1.0, 1 - x
+    while True:
+        x = math.sqrt(x)
+        previous = z
+        y *= 0.5
+        z -= (1 - x) ** 2 * y
+        if z == previous:
+            return z / 3
+
+
+class HyperLogLog:
+    """HyperLogLog farklı değer sayacı
+
+    p = log2((1.04 / epsilon)^2): 2^p kayıt (bayt), göreli hata ≈ epsilon
+    (standart sapma; küçük sayılardan 2^64'e yakın değerlere kadar sapmasız).
+    """
+
+    def __init__(self, epsilon=DEFAULT_EPSILON, p=None):
+        self.epsilon = epsilon
+        self.p = p or min(HLL_MAX_P, max(HLL_MIN_P, math.ceil(math.log2((1.04 / epsilon) ** 2))))
+        self.m = 1 << self.p
+        self.registers = np.zeros(self.m, dtype='uint8')
+
+    def update(self, values):
+        """Değerleri ekle (liste ya da Series; NaN atlanır)"""
+        hashes = _hash64([values] if np.isscalar(values) else values)
+        if len(hashes) == 0:
+            return self
+        bits = 64 - self.p
+        index = (hashes >> np.uint64(bits)).astype('int64')
+        rest = hashes & np.uint64((1 << bits) - 1)
+        # İlk 1 bitinin konumu (kalan 'bits' bit içinde, soldan)
+        rho = (bits - _bit_length(rest) + 1).astype('uint8')
+        np.maximum.at(self.registers, index, rho)
+        return self
+
+    def merge(self, other):
+        if other.p != self.p:
+            raise ValueError(f"Farklı hassasiyette HyperLogLog birleştirilemez (p={self.p} / {other.p})")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        """Yaklaşık farklı değer sayısı (Ertl 2017 iyileştirilmiş tahminci)
+
+        Ham HLL + linear counting geçişinde (~2.5m-5m) yukarı doğru sapar; kayıt
+        histogramı üzerinden tahmin tüm aralıkta sapmasızdır, tablo gerektirmez.
+        """
+        m = self.m
+        q = 64 - self.p
+        counts = np.bincount(self.registers, minlength=q + 2)
+        z = m * _hll_tau(1 - counts[q + 1] / m)
+        for k in range(q, 0, -1):
+            z = 0.5 * (z + counts[k])
+        z += m * _hll_sigma(counts[0] / m)
+        if math.isinf(z):
+            return 0
+        return int(round(m * m / (2 * math.log(2) * z)))
+
+    def size(self):
+        return self.m
+
+    def to_dict(self):
+        return {'kind': 'hll', 'p': self.p, 'epsilon': self.epsilon,
+                'registers': base64.b64encode(self.registers.tobytes()).decode('ascii')}
+
+    @classmethod
+    def from_dict(cls, state):
+        sketch = cls(epsilon=state['epsilon'], p=state['p'])
+        sketch.registers = np.frombuffer(base64.b64decode(state['registers']), dtype='uint8').copy()
+        return sketch
+
+
+class ExactDistinct:
+    """Kesin farklı değer sayacı - değerler kümede tutulur"""
+
+    def __init__(self, epsilon=None):
+        self.values = set()
+
+    def update(self, values):
+        series = values if isinstance(values, pd.Series) else pd.Series([values] if np.isscalar(values) else values)
+        self.values.update(series.dropna().unique().tolist())
+        return self
+
+    def merge(self, other):
+        self.values |= other.values
+        return self
+
+    def count(self):
+        return len(self.values)
+
+    def size(self):
+        return len(self.values)
+
+    def to_dict(self):
+        return {'kind': 'exact_distinct', 'values': list(self.values)}
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls().update(state['values'])
+
+
+_KINDS = {'kll': KLL, 'exact_quantiles': ExactQuantiles, 'hll': HyperLogLog, 'exact_distinct': ExactDistinct}
+
+
+def quantile_sketch(mode=None, epsilon=DEFAULT_EPSILON):
+    """Quantile özeti: 'exact' → ExactQuantiles, 'approx' → KLL"""
+    return KLL(epsilon) if _check_mode(mode) == 'approx' else ExactQuantiles()
+
+
+def distinct_counter(mode=None, epsilon=DEFAULT_EPSILON):
+    """Farklı değer sayacı: 'exact' → ExactDistinct, 'approx' → HyperLogLog"""
+    return HyperLogLog(epsilon) if _check_mode(mode) == 'approx' else ExactDistinct()
+
+
+def from_dict(state):
+    """to_dict() çıktısından taslağı geri yükle"""
+    return _KINDS[state['kind']].from_dict(state)
+
+
+def column_quantile(series, q, mode=None, epsilon=DEFAULT_EPSILON):
+    """Sütun quantile'ı - exact: pandas quantile, approx: KLL"""
+    if _check_mode(mode) == 'exact':
+        return series.quantile(q)
+    return quantile_sketch('approx', epsilon).update(series).quantile(q)
+
+
+def nunique(series, mode=None, epsilon=DEFAULT_EPSILON):
+    """Farklı değer sayısı - exact: pandas nunique, approx: HyperLogLog"""
+    if _check_mode(mode) == 'exact':
+        return int(series.nunique())
+    return distinct_counter('approx', epsilon).update(series).count()
+
+
+def hll_accuracy(epsilon=DEFAULT_EPSILON, loads=(0.5, 1, 2, 2.5, 3, 4, 5, 10), seeds=20):
+    """HyperLogLog doğruluk kontrolü - [(n/m yükü, n, ortalama göreli hata, standart sapma)]
+
+    Linear counting'den ham tahmine geçiş aralığı (2.5m-5m) dahil her yükte
+    farklı tohumlarla ayrık değerler sayılır.
+    """
+    m = HyperLogLog(epsilon).m
+    rows = []
+    for load in loads:
+        n = int(load * m)
+        errors = [HyperLogLog(epsilon).update(np.arange(n, dtype='int64') + seed * (1 << 40)).count() / n - 1
+                  for seed in range(seeds)]
+        rows.append((load, n, float(np.mean(errors)), float(np.std(errors))))
+    return rows
+
+
+if __name__ == "__main__":
+    import sys
+
+    # python sgs_sketch.py --check [epsilon]
+    if '--check' not in sys.argv:
+        print("Kullanım: python sgs_sketch.py --check [epsilon]")
+        sys.exit(1)
+    i = sys.argv.index('--check')
+    eps = float(sys.argv[i + 1]) if i + 1 < len(sys.argv) else DEFAULT_EPSILON
+    ok = True
+    seeds = 20
+    sigma = 1.04 / math.sqrt(HyperLogLog(eps).m)
+    print(f"🔢 HyperLogLog doğruluğu (epsilon={eps}, m={HyperLogLog(eps).m}, beklenen std {sigma:.4f})")
+    for load, n, mean, std in hll_accuracy(eps, seeds=seeds):
+        # Sapmasızlık: ortalama hata 3 standart hata içinde; dağılım beklenen std'ye yakın
+        passed = abs(mean) <= 3 * sigma / math.sqrt(seeds) and std <= 1.5 * sigma
+        ok &= passed
+        print(f"   {'✅' if passed else '❌'} {load:>5}m  n={n:>9,}  ortalama {mean:+.4f}  std {std:.4f}")
+    sys.exit(0 if ok else 1)
@@ -13,31 +13,142 @@ Herhangi bir Excel dosyasını analiz et:
 Kullanım:
 import sgs_smart as sgs
 sgs.analyze('herhangi_veri.xlsx')
+sgs.analyze_dir('haftalik_exportlar/', jobs=8)   # klasördeki tüm dosyalar + index.html
+
+python sgs_smart.py dosya.xlsx
+python sgs_smart.py klasör/ [--jobs N] [--out rapor_klasörü] [--keep-sheets] [--verbose]
 """
 
-import pandas as pd
+import os
+import sys
+import io
+import time
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
 from datetime import datetime
 import re
+from urllib.parse import quote
 from typing import Dict, List, Any, Optional
+import sgs_loader
+import sgs_dtypes
+import sgs_columns
+import sgs_report
+
+DATA_EXTENSIONS = ('.xlsx', '.xls', '.csv')
+
+SMART_REPORT_HEAD = sgs_report.template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>SGS Akıllı Analiz Raporu - $type_name</title>
+    <meta charset="UTF-8">
+    <style>
+        body { font-family: 'Segoe UI', Arial, sans-serif; margin: 40px; line-height: 1.6; background: #f5f7fa; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; border-radius: 12px; box-shadow: 0 4px 20px rgba(0,0,0,0.1); }
+        .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; text-align: center; border-radius: 12px 12px 0 0; }
+        .data-type { background: rgba(255,255,255,0.2); padding: 10px 20px; border-radius: 20px; display: inline-block; margin-top: 10px; }
+        .metrics { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 30px; }
+        .metric { background: #f8f9fa; padding: 20px; text-align: center; border-radius: 12px; border-left: 4px solid #667eea; }
+        .insights { background: linear-gradient(135deg, #e8f5e8 0%, #f0f8f0 100%); padding: 25px; margin: 20px 30px; border-radius: 12px; }
+        .recommendations { background: linear-gradient(135deg, #fff3cd 0%, #fef8e6 100%); padding: 25px; margin: 20px 30px; border-radius: 12px; }
+        .footer { text-align: center; margin: 30px; color: #666; padding: 20px; }
+        ul { list-style-type: none; padding: 0; }
+        li { margin: 12px 0; padding: 12px; background: white; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        h1, h2 { margin: 0; }
+        .badge { background: #667eea; color: white; padding: 4px 8px; border-radius: 12px; font-size: 0.8em; }
+        .records { margin: 20px 30px; }
+        .data-table { width: 100%; border-collapse: collapse; }
+        .data-table th, .data-table td { padding: 6px 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        .data-table th { background: #667eea; color: white; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🧠 SGS - Akıllı Analiz Raporu</h1>
+            <p>Smart Growth Solutions</p>
+            <div class="data-type">
+                <span class="badge">$type_name Verisi Tespit Edildi</span>
+            </div>
+        </div>
+        
+        <div class="metrics">
+            <div class="metric">
+                <h3>📊 Toplam Kayıt</h3>
+                <h2>$rows</h2>
+            </div>
+            <div class="metric">
+                <h3>📋 Sütun Sayısı</h3>
+                <h2>$columns</h2>
+            </div>
+            <div class="metric">
+                <h3>🧠 Veri Türü</h3>
+                <h2>$type_name</h2>
+            </div>
+            <div class="metric">
+                <h3>⚡ Analiz Süresi</h3>
+                <h2>&lt; 1 saniye</h2>
+            </div>
+        </div>
+        
+        <div class="insights">
+            <h2>💡 Akıllı İçgörüler</h2>
+            <ul>
+""")
+
+SMART_REPORT_MIDDLE = sgs_report.template("""
+            </ul>
+        </div>
+        
+        <div class="recommendations">
+            <h2>🚀 Aksiyon Önerileri</h2>
+            <ul>
+""")
+
+SMART_REPORT_RECORDS = sgs_report.template("""
+                <li>📊 SGS ile daha detaylı analiz için premium özellikleri keşfedin</li>
+            </ul>
+        </div>
+        
+        <div class="records">
+            <h2>📋 Veri Tablosu</h2>
+""")
+
+SMART_REPORT_FOOTER = sgs_report.template("""
+        </div>
+        
+        <div class="footer">
+            <p>📅 Rapor Tarihi: $report_date</p>
+            <p><strong>Powered by SGS - Smart Growth Solutions</strong></p>
+            <p>🧠 Yapay zeka ile desteklenen akıllı veri analizi</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
 
 class SmartSGS:
     def __init__(self):
         self.df = None
+        self.sheets = {}
         self.data_type = "unknown"
         self.columns_map = {}
+        self.column_roles = None
         self.insights = []
         self.recommendations = []
         
-    def analyze(self, file_path: str, output_name: str = "sgs_smart_report"):
+    def analyze(self, file_path: str, output_name: str = "sgs_smart_report", keep_sheets: bool = False):
         """
         Akıllı analiz motoru - herhangi veriyi tanır ve analiz eder
+
+        keep_sheets=True: tüm sheet'ler ayrıştırılıp self.sheets içinde tutulur
         """
         print("🧠 SGS - AKILLI ANALİZ MOTORU")
         print("=" * 50)
         
         # 1. Veriyi yükle
-        if not self._load_data(file_path):
+        if not self._load_data(file_path, keep_sheets):
             return
             
         # 2. Veri türünü tanı
@@ -55,27 +166,30 @@ class SmartSGS:
         print(f"\n✅ SGS AKILLI ANALİZ TAMAMLANDI!")
         print(f"📋 Rapor: {output_name}.html")
     
-    def _load_data(self, file_path: str) -> bool:
+    def _load_data(self, file_path: str, keep_sheets: bool = False) -> bool:
         """Veri dosyasını yükle"""
         try:
             if file_path.endswith(('.xlsx', '.xls')):
                 # Birden fazla sheet kontrol et
-                xl_file = pd.ExcelFile(file_path)
-                sheets = xl_file.sheet_names
+                sheets = sgs_loader.sheet_names(file_path)
                 print(f"📄 {len(sheets)} sayfa bulundu: {', '.join(sheets)}")
                 
                 # En büyük sheet'i al (genelde ana veri)
-                sheet_sizes = {}
-                for sheet in sheets:
-                    df_temp = pd.read_excel(file_path, sheet_name=sheet)
-                    sheet_sizes[sheet] = len(df_temp)
-                
-                main_sheet = max(sheet_sizes, key=sheet_sizes.get)
-                self.df = pd.read_excel(file_path, sheet_name=main_sheet)
+                if keep_sheets:
+                    # Çoklu sheet analizi: hepsi bir kez ayrıştırılır, bellekte kalır
+                    self.sheets = sgs_loader.read_excel_sheets(file_path, sheets)
+                    sheet_sizes = {sheet: len(df) for sheet, df in self.sheets.items()}
+                    main_sheet = max(sheet_sizes, key=sheet_sizes.get)
+                    self.df = self.sheets[main_sheet]
+                else:
+                    # Boyutlar workbook meta verisinden - sadece seçilen sheet ayrıştırılır
+                    sheet_sizes = sgs_loader.sheet_dimensions(file_path)
+                    main_sheet = max(sheets, key=lambda sheet: sheet_sizes.get(sheet, 0))
+                    self.df = sgs_loader.read_excel(file_path, sheet_name=main_sheet)
                 print(f"📊 Ana veri seçildi: '{main_sheet}' ({len(self.df)} satır, {len(self.df.columns)} sütun)")
                 
             elif file_path.endswith('.csv'):
-                self.df = pd.read_csv(file_path)
+                self.df = sgs_loader.read_csv(file_path)
                 print(f"📊 CSV yüklendi: {len(self.df)} satır, {len(self.df.columns)} sütun")
             else:
                 print(f"❌ Desteklenmeyen format. Desteklenen: .xlsx, .xls, .csv")
@@ -150,39 +264,9 @@ class SmartSGS:
         """Sütunları standart isimlere haritalandır"""
         print(f"🗺️ SÜTUN HARİTALANDIRMA...")
         
+        self.column_roles = sgs_columns.detect(self.df)
         for col in self.df.columns:
-            col_lower = col.lower()
-            mapped_type = 'other'
-            
-            # Fiyat sütunları
-            if any(word in col_lower for word in ['fiyat', 'price', 'tutar', 'amount', 'cost']):
-                mapped_type = 'price'
-            
-            # Metrik sütunları (görüntülenme, satış, adet)
-            elif any(word in col_lower for word in ['görüntülenme', 'view', 'click', 'sales', 'adet', 'quantity']):
-                mapped_type = 'metric'
-            
-            # Kategori sütunları
-            elif any(word in col_lower for word in ['kategori', 'category', 'grup', 'type', 'class']):
-                mapped_type = 'category'
-                
-            # İsim sütunları
-            elif any(word in col_lower for word in ['ürün', 'product', 'name', 'ad', 'isim', 'title']):
-                mapped_type = 'name'
-                
-            # Tarih sütunları
-            elif any(word in col_lower for word in ['tarih', 'date', 'time', 'created']):
-                mapped_type = 'date'
-                
-            # Durum sütunları
-            elif any(word in col_lower for word in ['durum', 'status', 'state', 'foto', 'photo']):
-                mapped_type = 'status'
-            
-            # Ek bilgi sütunları
-            elif any(word in col_lower for word in ['badge', 'tag', 'label', 'note', 'description']):
-                mapped_type = 'meta'
-            
-            self.columns_map[col] = mapped_type
+            self.columns_map[col] = self.column_roles.role(col, default='other')
         
         # Haritalandırma sonuçlarını göster
         type_counts = {}
@@ -213,10 +297,11 @@ class SmartSGS:
     def _restaurant_analysis(self):
         """Restoran özel analizi"""
         # Performans analizi
-        price_cols = [col for col, col_type in self.columns_map.items() if col_type == 'price']
-        metric_cols = [col for col, col_type in self.columns_map.items() if col_type == 'metric']
-        category_cols = [col for col, col_type in self.columns_map.items() if col_type == 'category']
-        name_cols = [col for col, col_type in self.columns_map.items() if col_type == 'name']
+        # Güncel dönem sütunları önce gelir
+        price_cols = self.column_roles.of('price')
+        metric_cols = self.column_roles.of('metric')
+        category_cols = self.column_roles.of('category')
+        name_cols = self.column_roles.of('name')
         
         if price_cols and metric_cols and name_cols:
             price_col = price_cols[0]
@@ -230,7 +315,7 @@ class SmartSGS:
                 self.insights.append(f"🏆 En popüler ürün: {top_product[name_col]} ({top_product[metric_col]:.0f} {metric_col.lower()})")
             
             # Karlılık analizi
-            self.df['karlılık_skoru'] = self.df[price_col] * self.df[metric_col].fillna(0)
+            self.df['karlılık_skoru'] = sgs_dtypes.widen(self.df[price_col]) * self.df[metric_col].fillna(0)
             if not self.df['karlılık_skoru'].isna().all():
                 profitable_idx = self.df['karlılık_skoru'].idxmax()
                 profitable_product = self.df.loc[profitable_idx]
@@ -244,9 +329,8 @@ class SmartSGS:
                 self.insights.append(f"📦 En büyük kategori: {cat_counts.index[0]} ({cat_counts.iloc[0]} ürün)")
         
         # Foto analizi
-        status_cols = [col for col, col_type in self.columns_map.items() if col_type == 'status']
-        for status_col in status_cols:
-            if 'foto' in status_col.lower():
+        for status_col in self.column_roles.of('status'):
+            if 'photo' in self.column_roles.flags[status_col]:
                 missing_photos = (self.df[status_col] == 'Hayır').sum()
                 if missing_photos > 0:
                     total = len(self.df)
@@ -289,99 +373,222 @@ class SmartSGS:
         
         type_name = data_type_names.get(self.data_type, 'Bilinmeyen')
         
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>SGS Akıllı Analiz Raporu - {type_name}</title>
-            <meta charset="UTF-8">
-            <style>
-                body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 40px; line-height: 1.6; background: #f5f7fa; }}
-                .container {{ max-width: 1200px; margin: 0 auto; background: white; border-radius: 12px; box-shadow: 0 4px 20px rgba(0,0,0,0.1); }}
-                .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; text-align: center; border-radius: 12px 12px 0 0; }}
-                .data-type {{ background: rgba(255,255,255,0.2); padding: 10px 20px; border-radius: 20px; display: inline-block; margin-top: 10px; }}
-                .metrics {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 30px; }}
-                .metric {{ background: #f8f9fa; padding: 20px; text-align: center; border-radius: 12px; border-left: 4px solid #667eea; }}
-                .insights {{ background: linear-gradient(135deg, #e8f5e8 0%, #f0f8f0 100%); padding: 25px; margin: 20px 30px; border-radius: 12px; }}
-                .recommendations {{ background: linear-gradient(135deg, #fff3cd 0%, #fef8e6 100%); padding: 25px; margin: 20px 30px; border-radius: 12px; }}
-                .footer {{ text-align: center; margin: 30px; color: #666; padding: 20px; }}
-                ul {{ list-style-type: none; padding: 0; }}
-                li {{ margin: 12px 0; padding: 12px; background: white; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-                h1, h2 {{ margin: 0; }}
-                .badge {{ background: #667eea; color: white; padding: 4px 8px; border-radius: 12px; font-size: 0.8em; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🧠 SGS - Akıllı Analiz Raporu</h1>
-                    <p>Smart Growth Solutions</p>
-                    <div class="data-type">
-                        <span class="badge">{type_name} Verisi Tespit Edildi</span>
-                    </div>
-                </div>
-                
-                <div class="metrics">
-                    <div class="metric">
-                        <h3>📊 Toplam Kayıt</h3>
-                        <h2>{len(self.df)}</h2>
-                    </div>
-                    <div class="metric">
-                        <h3>📋 Sütun Sayısı</h3>
-                        <h2>{len(self.df.columns)}</h2>
-                    </div>
-                    <div class="metric">
-                        <h3>🧠 Veri Türü</h3>
-                        <h2>{type_name}</h2>
-                    </div>
-                    <div class="metric">
-                        <h3>⚡ Analiz Süresi</h3>
-                        <h2>< 1 saniye</h2>
-                    </div>
-                </div>
-                
-                <div class="insights">
-                    <h2>💡 Akıllı İçgörüler</h2>
-                    <ul>
-                        {''.join([f'<li>{insight}</li>' for insight in self.insights])}
-                    </ul>
-                </div>
-                
-                <div class="recommendations">
-                    <h2>🚀 Aksiyon Önerileri</h2>
-                    <ul>
-                        {''.join([f'<li>{rec}</li>' for rec in self.recommendations])}
-                        <li>📊 SGS ile daha detaylı analiz için premium özellikleri keşfedin</li>
-                    </ul>
-                </div>
-                
-                <div class="footer">
-                    <p>📅 Rapor Tarihi: {datetime.now().strftime('%d %B %Y, %H:%M')}</p>
-                    <p><strong>Powered by SGS - Smart Growth Solutions</strong></p>
-                    <p>🧠 Yapay zeka ile desteklenen akıllı veri analizi</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        with open(f'{output_name}.html', 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        with sgs_report.ReportWriter(f'{output_name}.html') as out:
+            out.render(SMART_REPORT_HEAD, type_name=type_name, rows=len(self.df), columns=len(self.df.columns))
+            out.list_items(self.insights)
+            out.render(SMART_REPORT_MIDDLE)
+            out.list_items(self.recommendations)
+            out.render(SMART_REPORT_RECORDS)
+            out.data_table(self.df)
+            out.render(SMART_REPORT_FOOTER, report_date=datetime.now().strftime('%d %B %Y, %H:%M'))
 
 # Ana SGS fonksiyonu
-def analyze(file_path: str, output_name: str = "sgs_smart_report"):
+def analyze(file_path: str, output_name: str = "sgs_smart_report", keep_sheets: bool = False):
     """
     SGS Akıllı Analiz
     
     Kullanım:
     import sgs_smart as sgs
     sgs.analyze('herhangi_veri.xlsx')
+    sgs.analyze('herhangi_veri.xlsx', keep_sheets=True)  # tüm sheet'ler bellekte
     """
     smart_sgs = SmartSGS()
-    smart_sgs.analyze(file_path, output_name)
+    smart_sgs.analyze(file_path, output_name, keep_sheets)
+    return smart_sgs
+
+INDEX_HEAD = sgs_report.template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>SGS Toplu Analiz - $count dosya</title>
+    <meta charset="UTF-8">
+    <style>
+        body { font-family: 'Segoe UI', Arial, sans-serif; margin: 40px; background: #f5f7fa; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; border-radius: 12px; padding: 30px; box-shadow: 0 4px 20px rgba(0,0,0,0.1); }
+        .summary { color: #666; margin-bottom: 20px; }
+        .data-table { width: 100%; border-collapse: collapse; }
+        .data-table th, .data-table td { padding: 8px 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        .data-table th { background: #667eea; color: white; }
+        .error { color: #dc3545; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🧠 SGS - Toplu Analiz</h1>
+        <p class="summary">$count dosya, $rows satır · $seconds sn · $files_per_s dosya/sn · $rows_per_s satır/sn</p>
+        <table class='data-table'>
+            <tr><th>Dosya</th><th>Veri Türü</th><th>Satır</th><th>Sütun</th><th>İçgörü</th><th>Süre (sn)</th></tr>
+""")
+
+INDEX_ROW = sgs_report.template(
+    "<tr><td><a href=\"$report\">$file</a></td><td>$data_type</td><td>$rows</td><td>$columns</td>"
+    "<td>$insights</td><td>$seconds</td></tr>\n")
+
+INDEX_ERROR_ROW = sgs_report.template(
+    "<tr><td>$file</td><td class=\"error\" colspan=\"5\">❌ $error</td></tr>\n")
+
+INDEX_FOOTER = sgs_report.template("""
+        </table>
+        <p class="summary">📅 Rapor Tarihi: $report_date</p>
+    </div>
+</body>
+</html>
+""")
+
+
+def find_data_files(path: str) -> List[str]:
+    """Klasördeki Excel/CSV dosyaları (Excel kilit dosyaları ~$ hariç), isim sırasıyla"""
+    return sorted(
+        os.path.join(path, name) for name in os.listdir(path)
+        if name.lower().endswith(DATA_EXTENSIONS) and not name.startswith('~$')
+        and os.path.isfile(os.path.join(path, name))
+    )
+
+
+def _report_names(files: List[str]) -> List[str]:
+    """Dosya başına rapor adı - aynı adlı .xlsx/.csv çakışırsa uzantı eklenir"""
+    stems = [os.path.splitext(os.path.basename(f))[0] for f in files]
+    return [
+        stem if stems.count(stem) == 1 else f"{stem}_{os.path.splitext(f)[1].lstrip('.').lower()}"
+        for stem, f in zip(stems, files)
+    ]
+
+
+def _warm_worker():
+    """Havuz süreci başlangıcı: Excel okuyucusu bir kez yüklenir, süreç tüm dosyalarda yeniden kullanılır"""
+    with contextlib.suppress(ImportError):
+        import openpyxl  # noqa: F401
+
+
+def _analyze_file_task(args) -> Dict[str, Any]:
+    """Tek dosya - ProcessPoolExecutor için; çıktı yakalanır, özet döner"""
+    file_path, output_name, keep_sheets, verbose = args
+    start = time.perf_counter()
+    smart_sgs = SmartSGS()
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(sys.stdout if verbose else log):
+            smart_sgs.analyze(file_path, output_name, keep_sheets)
+        error = None if smart_sgs.df is not None else (log.getvalue().strip().splitlines() or ['Dosya yüklenemedi'])[-1].lstrip('❌ ')
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    loaded = smart_sgs.df is not None and error is None
+    return {
+        'file': file_path,
+        'report': f"{output_name}.html" if loaded else None,
+        'data_type': smart_sgs.data_type,
+        'rows': len(smart_sgs.df) if loaded else 0,
+        'columns': len(smart_sgs.df.columns) if loaded else 0,
+        'insights': len(smart_sgs.insights),
+        'seconds': time.perf_counter() - start,
+        'error': error
+    }
+
+
+def _write_index(index_path: str, output_dir: str, results: List[Dict[str, Any]], summary: Dict[str, Any]):
+    """Özet sayfası: dosya başına satır + rapor bağlantısı"""
+    with sgs_report.ReportWriter(index_path) as out:
+        out.render(INDEX_HEAD, count=summary['files'], rows=summary['rows'], seconds=f"{summary['seconds']:.1f}",
+                   files_per_s=f"{summary['files_per_s']:.1f}", rows_per_s=f"{summary['rows_per_s']:,.0f}")
+        for result in results:
+            file_name = os.path.basename(result['file'])
+            if result['error']:
+                out.render(INDEX_ERROR_ROW, file=file_name, error=result['error'])
+            else:
+                # Bağlantı URL olarak kodlanır: '#', '?', '"' dosya adında kalabilir
+                href = quote(os.path.relpath(result['report'], output_dir).replace(os.sep, '/'))
+                out.render(INDEX_ROW, report=sgs_report.escape_attr(href), file=file_name,
+                           data_type=result['data_type'], rows=result['rows'], columns=result['columns'],
+                           insights=result['insights'], seconds=f"{result['seconds']:.2f}")
+        out.render(INDEX_FOOTER, report_date=datetime.now().strftime('%d %B %Y, %H:%M'))
+
+
+def analyze_dir(path: str, output_dir: Optional[str] = None, jobs: Optional[int] = None,
+                keep_sheets: bool = False, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Klasördeki tüm Excel/CSV dosyalarını paralel analiz et
+    
+    Dosyalar süreç havuzuna dağıtılır (jobs: süreç sayısı, varsayılan çekirdek
+    sayısı); süreçler dosyalar arasında yeniden kullanılır. Her dosya için
+    output_dir/<dosya>.html, ayrıca output_dir/index.html özet sayfası yazılır.
+    verbose=True: dosya başına analiz çıktısı da yazdırılır.
+    """
+    files = find_data_files(path)
+    output_dir = output_dir or os.path.join(path, 'sgs_reports')
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [(f, os.path.join(output_dir, name), keep_sheets, verbose) for f, name in zip(files, _report_names(files))]
+    jobs = min(jobs or os.cpu_count() or 1, len(tasks)) or 1
+
+    print(f"🧠 SGS TOPLU ANALİZ: {len(files)} dosya, {jobs} süreç")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    results = [None] * len(tasks)
+
+    def _done(i, result):
+        results[i] = result
+        name = os.path.basename(result['file'])
+        if result['error']:
+            print(f"❌ {name}: {result['error']}")
+        else:
+            print(f"✅ {name}: {result['data_type']}, {result['rows']} satır ({result['seconds']:.2f} sn)")
+
+    if jobs == 1:
+        _warm_worker()
+        for i, task in enumerate(tasks):
+            _done(i, _analyze_file_task(task))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_warm_worker) as pool:
+            futures = {pool.submit(_analyze_file_task, task): i for i, task in enumerate(tasks)}
+            for future in as_completed(futures):
+                _done(futures[future], future.result())
+
+    seconds = time.perf_counter() - start
+    rows = sum(result['rows'] for result in results)
+    summary = {
+        'files': len(results),
+        'failed': sum(1 for result in results if result['error']),
+        'rows': rows,
+        'seconds': seconds,
+        'files_per_s': len(results) / seconds if seconds else 0.0,
+        'rows_per_s': rows / seconds if seconds else 0.0,
+        'jobs': jobs
+    }
+    index_path = os.path.join(output_dir, 'index.html')
+    _write_index(index_path, output_dir, results, summary)
+
+    print(f"\n⚡ {summary['files']} dosya ({summary['failed']} hatalı), {rows} satır, {seconds:.1f} sn")
+    print(f"   {summary['files_per_s']:.1f} dosya/sn · {summary['rows_per_s']:,.0f} satır/sn")
+    print(f"📋 Özet: {index_path}")
+    return {'files': results, 'summary': summary, 'index': index_path}
 
 # Test
 if __name__ == "__main__":
-    print("🧪 SGS AKILLI ANALİZ TESTİ")
-    # Test verisi ile deneme
-    analyze('image-table-cs.xlsx', 'sgs_smart_test')
+    args = sys.argv[1:]
+    if not args:
+        print("🧪 SGS AKILLI ANALİZ TESTİ")
+        # Test verisi ile deneme
+        analyze('image-table-cs.xlsx', 'sgs_smart_test')
+    else:
+        target, jobs, output_dir = None, None, None
+        i = 0
+        while i < len(args):
+            if args[i] == '--jobs' and i + 1 < len(args):
+                jobs = int(args[i + 1])
+                i += 1
+            elif args[i] == '--out' and i + 1 < len(args):
+                output_dir = args[i + 1]
+                i += 1
+            elif not args[i].startswith('--'):
+                target = args[i]
+            i += 1
+
+        keep_sheets = '--keep-sheets' in args
+        if target and os.path.isdir(target):
+            analyze_dir(target, output_dir=output_dir, jobs=jobs, keep_sheets=keep_sheets, verbose='--verbose' in args)
+        elif target:
+            analyze(target, keep_sheets=keep_sheets)
+        else:
+            print("Kullanım: python sgs_smart.py dosya.xlsx | klasör/ [--jobs N] [--out rapor_klasörü] [--keep-sheets] [--verbose]")
+            sys.exit(1)
@@ -5,45 +5,195 @@ Excel dosyalarını SQL ile sorgula
 
 Kullanım:
 python sgs_sql.py dosya.xlsx "SELECT * FROM data WHERE fiyat > 200"
+python sgs_sql.py dosya.xlsx diger.csv --repl   (dosyalar bir kez yüklenir)
+sgs sql dosya.xlsx "SELECT ..."                (sgs_daemon açıksa sıcak oturumda)
+
+Python:
+from sgs_sql import SQLSession
+with SQLSession(threads=8, memory_limit='4GB') as s:
+    s.load('image-table-cs.xlsx')            # 'data' ve 'image_table_cs'
+    s.load('kosuyolu.xlsx', table='kosuyolu')
+    s.query("SELECT * FROM data LIMIT 5")
 """
 
+import os
+import re
 import sys
-import pandas as pd
-import duckdb
 
-def sql_query(file_path, query):
+# duckdb, pandas (sgs_loader/sgs_columns üzerinden) fonksiyon içinde yüklenir:
+# kullanım yazısı ve argüman kontrolü ağır importları beklemez
+
+def _table_name(text):
+    """Dosya/sheet adından geçerli tablo adı üret"""
+    name = re.sub(r'\W+', '_', text.strip().lower()).strip('_')
+    if not name or name[0].isdigit():
+        name = f"t_{name}"
+    return name
+
+class SQLSession:
+    """Uzun ömürlü DuckDB oturumu - dosyalar bir kez yüklenir, tablolar kayıtlı kalır"""
+
+    def __init__(self, threads=None, memory_limit=None):
+        import duckdb
+        self.conn = duckdb.connect()
+        self.tables = {}
+
+        # Varsayılan: tüm çekirdekler
+        self.threads = threads or os.cpu_count() or 1
+        self.conn.execute(f"SET threads TO {int(self.threads)}")
+
+        self.memory_limit = memory_limit
+        if memory_limit:
+            limit = str(memory_limit).replace("'", "")
+            self.conn.execute(f"SET memory_limit = '{limit}'")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Bağlantıyı kapat"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def register(self, table, df, source=None):
+        """Hazır DataFrame'i tablo olarak kaydet"""
+        self.conn.register(table, df)
+        self.tables[table] = {'source': source, 'rows': len(df), 'columns': len(df.columns), 'df': df}
+        return table
+
+    def load(self, file_path, table=None, sheet_name=0):
+        """Excel/CSV dosyasını yükle ve tablo olarak kaydet"""
+        import sgs_loader
+        if file_path.endswith('.csv'):
+            df = sgs_loader.read_csv(file_path)
+        else:
+            df = sgs_loader.read_excel(file_path, sheet_name=sheet_name)
+
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        table = table or _table_name(stem)
+        self.register(table, df, source=file_path)
+
+        # İlk dosya geriye uyumluluk için 'data' olarak da erişilebilir
+        if 'data' not in self.tables:
+            self.register('data', df, source=file_path)
+
+        print(f"📄 {file_path} → '{table}' ({len(df)} satır, {len(df.columns)} sütun)")
+        return table
+
+    def load_sheets(self, file_path, prefix=None):
+        """Workbook'taki tüm sheet'leri ayrı tablolar olarak yükle"""
+        import sgs_loader
+        sheets = sgs_loader.sheet_names(file_path)
+        frames = sgs_loader.read_excel_sheets(file_path, sheets)
+        prefix = prefix or _table_name(os.path.splitext(os.path.basename(file_path))[0])
+
+        names = []
+        for sheet, df in frames.items():
+            table = f"{prefix}_{_table_name(sheet)}"
+            self.register(table, df, source=f"{file_path}:{sheet}")
+            names.append(table)
+            print(f"📄 {file_path}:{sheet} → '{table}' ({len(df)} satır)")
+
+        if 'data' not in self.tables and names:
+            self.register('data', self.tables[names[0]]['df'], source=file_path)
+        return names
+
+    def query(self, sql):
+        """SQL çalıştır, sonucu DataFrame olarak döndür"""
+        return self.conn.execute(sql).fetchdf()
+
+    def schema(self, table='data'):
+        """Tablo şeması: sütun adı ve tipi"""
+        return self.conn.execute(f'DESCRIBE "{table}"').fetchdf()[['column_name', 'column_type']]
+
+    def repl(self):
+        """Etkileşimli sorgu döngüsü"""
+        print("🐥 SGS SQL REPL - .tables, .schema [tablo], .load dosya [tablo], .exit")
+        print(f"⚙️ threads={self.threads}" + (f", memory_limit={self.memory_limit}" if self.memory_limit else ""))
+
+        while True:
+            try:
+                line = input("sgs> ").strip()
+            except (EOFError, KeyboardInterrupt):
+                print()
+                break
+
+            if not line:
+                continue
+            if line in ('.exit', '.quit', 'exit', 'quit'):
+                break
+
+            try:
+                if line == '.tables':
+                    for name, info in self.tables.items():
+                        print(f"  {name:<25} {info['rows']:>8} satır  ← {info['source']}")
+                elif line.startswith('.schema'):
+                    parts = line.split(maxsplit=1)
+                    print(self.schema(parts[1] if len(parts) > 1 else 'data').to_string(index=False))
+                elif line.startswith('.load'):
+                    parts = line.split()
+                    self.load(parts[1], parts[2] if len(parts) > 2 else None)
+                else:
+                    result = self.query(line.rstrip(';'))
+                    print(result.to_string(index=False) if len(result) > 0 else "❌ Sonuç bulunamadı")
+                    print(f"({len(result)} satır)")
+            except Exception as e:
+                print(f"❌ Hata: {e}")
+
+def _same_file(source, file_path):
+    """Oturumdaki 'data' tablosu bu dosyadan mı yüklenmiş"""
+    return source is not None and os.path.abspath(source) == os.path.abspath(file_path)
+
+def sql_query(file_path, query, session=None):
     """Excel dosyasını SQL ile sorgula"""
     print("🐥 SGS SQL Motoru")
     print("=" * 30)
-    
+
     try:
-        # Excel dosyasını yükle
-        print(f"📄 Dosya yükleniyor: {file_path}")
-        df = pd.read_excel(file_path)
-        print(f"📊 {len(df)} satır, {len(df.columns)} sütun yüklendi")
-        
-        # DuckDB bağlantısı oluştur
-        conn = duckdb.connect()
-        
-        # DataFrame'i DuckDB'ye kaydet
-        conn.register('data', df)
-        
-        print(f"\n💾 Tablo 'data' olarak kaydedildi")
+        import duckdb
+        import sgs_loader
+
+        loaded = session.tables.get('data') if session is not None else None
+        if loaded is not None and _same_file(loaded['source'], file_path):
+            # Açık oturum: dosya zaten yüklü
+            conn = session.conn
+        else:
+            # Excel dosyasını yükle
+            print(f"📄 Dosya yükleniyor: {file_path}")
+            df = sgs_loader.read_excel(file_path)
+            print(f"📊 {len(df)} satır, {len(df.columns)} sütun yüklendi")
+
+            if session is not None:
+                session.register('data', df, source=file_path)
+                conn = session.conn
+            else:
+                # DuckDB bağlantısı oluştur
+                conn = duckdb.connect()
+
+                # DataFrame'i DuckDB'ye kaydet
+                conn.register('data', df)
+
+            print(f"\n💾 Tablo 'data' olarak kaydedildi")
+
         print(f"🔍 SQL Sorgusu: {query}")
         print("-" * 40)
-        
+
         # SQL sorgusunu çalıştır
         result = conn.execute(query).fetchdf()
-        
+
         # Sonucu göster
         if len(result) > 0:
             print(f"✅ {len(result)} sonuç bulundu:")
             print(result.to_string(index=False))
         else:
             print("❌ Sonuç bulunamadı")
-            
+
         return result
-        
+
     except Exception as e:
         print(f"❌ Hata: {e}")
         return None
@@ -51,37 +201,78 @@ def sql_query(file_path, query):
 def show_schema(file_path):
     """Dosya şemasını göster"""
     try:
-        df = pd.read_excel(file_path)
+        import sgs_loader
+        import sgs_columns
+
+        df = sgs_loader.read_excel(file_path)
         print("📋 Tablo Şeması:")
         print("-" * 30)
         for i, col in enumerate(df.columns, 1):
             dtype = str(df[col].dtype)
             sample = str(df[col].iloc[0]) if len(df) > 0 else "N/A"
             print(f"{i:2d}. {col:<20} ({dtype}) → {sample}")
-        
+
         print(f"\n💡 Örnek SQL sorguları:")
         print(f"SELECT * FROM data LIMIT 5")
         print(f"SELECT * FROM data WHERE \"{df.columns[0]}\" LIKE '%Pizza%'")
-        if any('fiyat' in col.lower() for col in df.columns):
-            price_col = next(col for col in df.columns if 'fiyat' in col.lower())
+        price_col = sgs_columns.detect(df).first('price')
+        if price_col:
             print(f"SELECT * FROM data WHERE \"{price_col}\" > 200")
-        
+
     except Exception as e:
         print(f"❌ Şema gösterme hatası: {e}")
 
+def _run_repl(args):
+    """--repl modu: dosyaları yükle, oturumu aç"""
+    threads = None
+    memory_limit = None
+    all_sheets = False
+    files = []
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '--threads' and i + 1 < len(args):
+            threads = int(args[i + 1])
+            i += 1
+        elif arg == '--memory-limit' and i + 1 < len(args):
+            memory_limit = args[i + 1]
+            i += 1
+        elif arg == '--sheets':
+            all_sheets = True
+        elif arg != '--repl':
+            files.append(arg)
+        i += 1
+
+    with SQLSession(threads=threads, memory_limit=memory_limit) as session:
+        for spec in files:
+            # tablo=dosya.xlsx ile isim verilebilir
+            table, _, path = spec.rpartition('=') if '=' in spec else (None, None, spec)
+            if all_sheets and not path.endswith('.csv'):
+                session.load_sheets(path, prefix=table)
+            else:
+                session.load(path, table=table)
+        session.repl()
+
+def main(args, session=None):
+    """Komut satırı: [dosya, SQL] ya da [dosya, --schema] - session verilirse dosya oturumda tutulur"""
+    file_path = args[0]
+    if '--repl' in args:
+        # Oturum modu: dosyalar bir kez yüklenir
+        _run_repl(args)
+    elif len(args) == 1 or (len(args) == 2 and args[1] == "--schema"):
+        # Şema göster
+        show_schema(file_path)
+    else:
+        # SQL sorgusu çalıştır
+        sql_query(file_path, args[1], session)
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Kullanım:")
         print("  python sgs_sql.py dosya.xlsx \"SQL_SORGUSU\"")
         print("  python sgs_sql.py dosya.xlsx --schema  (şemayı göster)")
+        print("  python sgs_sql.py dosya.xlsx [tablo=diger.xlsx ...] --repl [--sheets] [--threads N] [--memory-limit 4GB]")
         sys.exit(1)
-    
-    file_path = sys.argv[1]
-    
-    if len(sys.argv) == 2 or (len(sys.argv) == 3 and sys.argv[2] == "--schema"):
-        # Şema göster
-        show_schema(file_path)
-    else:
-        # SQL sorgusu çalıştır
-        query = sys.argv[2]
-        sql_query(file_path, query)
+
+    main(sys.argv[1:])
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS Stream - Bellekten büyük CSV dosyaları için parça parça analiz
+Dosya chunk'lar halinde okunur, sadece artımlı toplamlar bellekte tutulur
+
+Tutulan toplamlar:
+- Sayısal sütunlar: adet, toplam, kareler toplamı, min/max (satır kimliğiyle)
+- Grup sütunları: grup başına adet ve sayısal toplamlar (ortalama için)
+- Sayım sütunları: değer sayıları
+- Sayısal sütun başına en büyük k satır
+- İsteğe bağlı: quantile taslakları ve farklı değer sayaçları (sgs_sketch)
+
+Kullanım:
+from sgs_stream import ChunkedStats, scan_csv
+stats = ChunkedStats(numeric_cols=['Fiyat'], group_cols=['Kategori'], id_col='Ürün Adı')
+scan_csv('pos_export.csv', stats)
+stats.group_stats('Kategori')
+
+stats = ChunkedStats(numeric_cols=['Fiyat'], quantile_cols=['Fiyat'],
+                     distinct_cols=['Ürün Adı'], sketch_mode='approx')
+stats.quantile('Fiyat', 0.75), stats.nunique('Ürün Adı')
+"""
+
+import pandas as pd
+import numpy as np
+import sgs_sketch
+import sgs_topk
+
+DEFAULT_CHUNKSIZE = 200_000
+SAMPLE_ROWS = 1000
+
+
+class ChunkedStats:
+    """Chunk'lar üzerinden birleştirilebilir toplamlar"""
+
+    def __init__(self, numeric_cols=(), group_cols=(), count_cols=(), id_col=None, top_k=10, derived=None,
+                 quantile_cols=(), distinct_cols=(), sketch_mode=None, epsilon=sgs_sketch.DEFAULT_EPSILON):
+        self.numeric_cols = list(numeric_cols)
+        self.group_cols = list(group_cols)
+        self.count_cols = list(dict.fromkeys(list(group_cols) + list(count_cols)))
+        self.id_col = id_col
+        self.top_k = top_k
+
+        # Türetilmiş sütunlar chunk başına hesaplanır: {isim: fonksiyon(chunk)}
+        self.derived = dict(derived or {})
+        self.numeric_cols += [name for name in self.derived if name not in self.numeric_cols]
+
+        self.rows = 0
+        self.chunks = 0
+        self.count = {col: 0 for col in self.numeric_cols}
+        self.sum = {col: 0.0 for col in self.numeric_cols}
+        self.sumsq = {col: 0.0 for col in self.numeric_cols}
+        self.min = {}
+        self.max = {}
+        self.top = {}
+        self.groups = {}
+        self.counts = {col: {} for col in self.count_cols}
+
+        # Quantile/farklı değer özetleri: approx modda bellek sütun uzunluğundan bağımsız
+        self.quantiles = {col: sgs_sketch.quantile_sketch(sketch_mode, epsilon) for col in quantile_cols}
+        self.distinct = {col: sgs_sketch.distinct_counter(sketch_mode, epsilon) for col in distinct_cols}
+
+    def update(self, chunk):
+        """Bir chunk'ı toplamlara ekle"""
+        if self.derived:
+            chunk = chunk.assign(**{name: fn(chunk) for name, fn in self.derived.items()})
+
+        numeric = {col: pd.to_numeric(chunk[col], errors='coerce') for col in self.numeric_cols if col in chunk}
+        self.rows += len(chunk)
+        self.chunks += 1
+
+        for col, values in numeric.items():
+            valid = values.count()
+            if valid == 0:
+                continue
+            self.count[col] += int(valid)
+            self.sum[col] += float(values.sum())
+            self.sumsq[col] += float((values * values).sum())
+
+            # Eşitlikte ilk görülen satır kalır (idxmax/idxmin ile aynı)
+            max_idx = values.idxmax()
+            if col not in self.max or values.at[max_idx] > self.max[col][0]:
+                self.max[col] = (values.at[max_idx], self._identity(chunk, max_idx))
+            min_idx = values.idxmin()
+            if col not in self.min or values.at[min_idx] < self.min[col][0]:
+                self.min[col] = (values.at[min_idx], self._identity(chunk, min_idx))
+
+            self._update_top(col, chunk, values)
+
+        for col in self.group_cols:
+            frame = pd.DataFrame(numeric, index=chunk.index)
+            frame['_adet'] = 1
+            part = frame.groupby(chunk[col], sort=False).agg(['sum', 'count'])
+            if col in self.groups:
+                part = pd.concat([self.groups[col], part]).groupby(level=0, sort=False).sum()
+            self.groups[col] = part
+
+        for col in self.count_cols:
+            counts = self.counts[col]
+            for value, n in chunk[col].value_counts(sort=False).items():
+                counts[value] = counts.get(value, 0) + int(n)
+
+        for col, sketch in self.quantiles.items():
+            if col in chunk:
+                sketch.update(numeric[col] if col in numeric else chunk[col])
+        for col, sketch in self.distinct.items():
+            if col in chunk:
+                sketch.update(chunk[col])
+
+        return self
+
+    def _identity(self, chunk, idx):
+        """Satır kimliği: id sütunu varsa değeri, yoksa satır numarası"""
+        return chunk.at[idx, self.id_col] if self.id_col in chunk else idx
+
+    def _update_top(self, col, chunk, values):
+        """Sütun başına en büyük k satırı tut (sınırlı yığın)"""
+        if col not in self.top:
+            self.top[col] = sgs_topk.TopK(self.top_k, col, columns=[self.id_col] if self.id_col else ())
+        columns = {col: values}
+        if self.id_col in chunk:
+            columns[self.id_col] = chunk[self.id_col]
+        self.top[col].update(pd.DataFrame(columns))
+
+    def merge(self, other):
+        """Başka bir bölümün (dosya/şube) toplamlarını ekle"""
+        self.rows += other.rows
+        self.chunks += other.chunks
+
+        for col in other.numeric_cols:
+            self.count[col] = self.count.get(col, 0) + other.count[col]
+            self.sum[col] = self.sum.get(col, 0.0) + other.sum[col]
+            self.sumsq[col] = self.sumsq.get(col, 0.0) + other.sumsq[col]
+            if col in other.max and (col not in self.max or other.max[col][0] > self.max[col][0]):
+                self.max[col] = other.max[col]
+            if col in other.min and (col not in self.min or other.min[col][0] < self.min[col][0]):
+                self.min[col] = other.min[col]
+            if col in other.top:
+                if col in self.top:
+                    self.top[col].merge(other.top[col])
+                else:
+                    self.top[col] = other.top[col]
+
+        for col, part in other.groups.items():
+            if col in self.groups:
+                part = pd.concat([self.groups[col], part]).groupby(level=0, sort=False).sum()
+            self.groups[col] = part
+
+        for col, counts in other.counts.items():
+            target = self.counts.setdefault(col, {})
+            for value, n in counts.items():
+                target[value] = target.get(value, 0) + n
+
+        for col, sketch in other.quantiles.items():
+            if col in self.quantiles:
+                self.quantiles[col].merge(sketch)
+            else:
+                self.quantiles[col] = sketch
+        for col, sketch in other.distinct.items():
+            if col in self.distinct:
+                self.distinct[col].merge(sketch)
+            else:
+                self.distinct[col] = sketch
+
+        return self
+
+    def mean(self, col):
+        """Sütun ortalaması"""
+        return self.sum[col] / self.count[col] if self.count.get(col) else np.nan
+
+    def quantile(self, col, q):
+        """Sütun quantile'ı (quantile_cols içinde olmalı)"""
+        return self.quantiles[col].quantile(q)
+
+    def nunique(self, col):
+        """Farklı değer sayısı - count_cols sayımlarından kesin, yoksa distinct_cols sayacından"""
+        if col in self.counts:
+            return len(self.counts[col])
+        return self.distinct[col].count()
+
+    def value_counts(self, col):
+        """pd.Series.value_counts karşılığı (çoktan aza, eşitlikte ilk görülen önce)"""
+        counts = pd.Series(self.counts.get(col, {}), dtype='int64')
+        return counts.sort_values(ascending=False, kind='stable')
+
+    def group_stats(self, col):
+        """Grup başına adet, toplam ve ortalama - sütunlar: (metrik, sum/mean/count)"""
+        part = self.groups[col]
+        result = {('_adet', 'count'): part[('_adet', 'sum')]}
+        for metric in self.numeric_cols:
+            result[(metric, 'sum')] = part[(metric, 'sum')]
+            result[(metric, 'count')] = part[(metric, 'count')]
+            result[(metric, 'mean')] = part[(metric, 'sum')] / part[(metric, 'count')].replace(0, np.nan)
+        return pd.DataFrame(result)
+
+    def nlargest(self, col, n=None):
+        """Sütunda en büyük n satır (n <= top_k)"""
+        return self.top[col].frame().head(n or self.top_k)
+
+    def describe(self):
+        """df.describe() benzeri özet (count, mean, std, min, max)"""
+        summary = {}
+        for col in self.numeric_cols:
+            n = self.count[col]
+            if n == 0:
+                continue
+            mean = self.sum[col] / n
+            var = (self.sumsq[col] - n * mean * mean) / (n - 1) if n > 1 else np.nan
+            summary[col] = {
+                'count': n,
+                'mean': mean,
+                'std': np.sqrt(max(var, 0)) if n > 1 else np.nan,
+                'min': self.min[col][0],
+                'max': self.max[col][0]
+            }
+        return pd.DataFrame(summary)
+
+
+def read_sample(file_path, nrows=SAMPLE_ROWS, **kwargs):
+    """Sütun ve tip tespiti için dosyanın başını oku"""
+    return pd.read_csv(file_path, nrows=nrows, **kwargs)
+
+
+def iter_csv(file_path, chunksize=DEFAULT_CHUNKSIZE, **kwargs):
+    """CSV'yi chunk'lar halinde oku"""
+    return pd.read_csv(file_path, chunksize=chunksize, **kwargs)
+
+
+def scan_csv(file_path, stats, chunksize=DEFAULT_CHUNKSIZE, **kwargs):
+    """Tüm dosyayı tek geçişte toplamlara işle"""
+    for chunk in iter_csv(file_path, chunksize=chunksize, **kwargs):
+        stats.update(chunk)
+    return stats
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SGS TopK - Parça parça beslenen ilk-k / arg-uç operatörü
+Sınırlı bir yığında sadece k satır (değer + kimlik sütunları) tutulur:
+O(n log k) zaman, O(k) bellek. Chunk'lar, kayıt listeleri ya da başka
+bölümlerin (dosya/şube) TopK'ları merge() ile birleştirilir.
+
+Sıralama pandas nlargest/nsmallest(keep='first') ile aynıdır: eşitlikte
+önce görülen satır önde; merge'de kendi satırları diğerininkinden öncedir.
+Eksik (NaN) değerler atlanır (nlargest/nsmallest yardımcıları, pandas gibi,
+geçerli değer k'dan azsa eksik satırlarla tamamlar).
+
+Kullanım:
+import sgs_topk
+top = sgs_topk.TopK(5, 'Fiyat', columns=['Ürün Adı'])
+for chunk in chunks:
+    top.update(chunk)
+top.frame()
+
+sgs_topk.nlargest(df, 3, 'Fiyat')      # df.nlargest(3, 'Fiyat') karşılığı
+sgs_topk.argmax(df['Fiyat'])           # df['Fiyat'].idxmax() karşılığı
+"""
+
+import heapq
+import pandas as pd
+
+DEFAULT_CHUNKSIZE = 200_000
+
+
+class TopK:
+    """En büyük (largest=True) ya da en küçük k satır
+
+    Yığın kökü her zaman en kötü satırdır: (anahtar, -sıra) en küçük olan.
+    Satır kaydı: (değer, index etiketi, {kimlik sütunları}).
+    """
+
+    def __init__(self, k, by, columns=(), largest=True):
+        self.k = k
+        self.by = by
+        self.columns = [col for col in columns if col != by]
+        self.largest = largest
+        self.seen = 0
+        self._heap = []
+
+    def _key(self, value):
+        return value if self.largest else -value
+
+    def _push(self, value, seq, label, fields):
+        entry = (self._key(value), -seq, value, label, fields)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def update(self, data):
+        """Chunk ekle: DataFrame, Series (değerler) ya da kayıt (dict) listesi"""
+        if isinstance(data, pd.Series):
+            data = data.to_frame(self.by)
+        if isinstance(data, pd.DataFrame):
+            return self._update_frame(data)
+
+        for record in data:
+            value = record.get(self.by)
+            if value is not None and not pd.isna(value):
+                self._push(value, self.seen, self.seen, {col: record.get(col) for col in self.columns})
+            self.seen += 1
+        return self
+
+    def _update_frame(self, chunk):
+        if self.k <= 0 or len(chunk) == 0:
+            self.seen += len(chunk)
+            return self
+
+        values = pd.to_numeric(chunk[self.by], errors='coerce').reset_index(drop=True)
+        # Chunk içinde vektörel ön seçim: yığına en fazla k aday girer
+        values = values[values.notna()]
+        candidates = values.nlargest(self.k) if self.largest else values.nsmallest(self.k)
+        labels = chunk.index
+        fields = {col: chunk[col].to_numpy() for col in self.columns if col in chunk}
+        for position, value in candidates.items():
+            self._push(value, self.seen + position, labels[position],
+                       {col: column[position] for col, column in fields.items()})
+        self.seen += len(chunk)
+        return self
+
+    def merge(self, other):
+        """Başka bir bölümün TopK'sını ekle (diğerinin satırları sonra sayılır)"""
+        for key, neg_seq, value, label, fields in other._heap:
+            self._push(value, self.seen - neg_seq, label, fields)
+        self.seen += other.seen
+        return self
+
+    def __len__(self):
+        return len(self._heap)
+
+    def _sorted(self):
+        return sorted(self._heap, key=lambda entry: (-entry[0], -entry[1]))
+
+    def records(self):
+        """Sıralı kayıtlar: [{by: değer, kimlik sütunları...}]"""
+        return [{self.by: value, **fields} for _, _, value, _, fields in self._sorted()]
+
+    def frame(self):
+        """Sıralı DataFrame (index: orijinal satır etiketleri) - nlargest karşılığı"""
+        entries = self._sorted()
+        data = {self.by: [entry[2] for entry in entries]}
+        for col in self.columns:
+            data[col] = [entry[4].get(col) for entry in entries]
+        return pd.DataFrame(data, index=[entry[3] for entry in entries])
+
+    def series(self):
+        """Sıralı Series (index: orijinal satır etiketleri) - Series.nlargest karşılığı"""
+        entries = self._sorted()
+        return pd.Series([entry[2] for entry in entries], index=[entry[3] for entry in entries],
+                         name=self.by, dtype='float64')
+
+    def positions(self):
+        """Sıralı satırların görülme sırası (tek DataFrame için iloc konumları)"""
+        return [-entry[1] for entry in self._sorted()]
+
+    def best(self):
+        """En iyi satırın (değer, index etiketi, kimlik sütunları) üçlüsü; boşsa None"""
+        if not self._heap:
+            return None
+        _, _, value, label, fields = self._sorted()[0]
+        return value, label, fields
+
+
+def _chunks(data, chunksize):
+    """DataFrame/Series'i dilimle; chunk iterable'ları olduğu gibi döner"""
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return (data.iloc[start:start + chunksize] for start in range(0, max(len(data), 1), chunksize))
+    return data
+
+
+def _select(data, k, by, columns, largest, chunksize):
+    if isinstance(data, pd.Series) and by is None:
+        by = data.name if data.name is not None else 0
+        data = data.rename(by)
+    top = TopK(k, by, columns=columns or (), largest=largest)
+    for chunk in _chunks(data, chunksize):
+        top.update(chunk)
+    return top
+
+
+def nlargest(data, k, by=None, columns=None, chunksize=DEFAULT_CHUNKSIZE):
+    """En büyük k satır - DataFrame, Series ya da chunk iterable'ı
+
+    DataFrame verilirse tüm sütunlar korunur (df.nlargest ile aynı sonuç);
+    chunk iterable'ında sadece columns listesindeki sütunlar tutulur.
+    """
+    return _result(data, k, by, columns, True, chunksize)
+
+
+def nsmallest(data, k, by=None, columns=None, chunksize=DEFAULT_CHUNKSIZE):
+    """En küçük k satır - nlargest karşılığı"""
+    return _result(data, k, by, columns, False, chunksize)
+
+
+def _result(data, k, by, columns, largest, chunksize):
+    top = _select(data, k, by, columns, largest, chunksize)
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        # Sıra numarası = satırın konumu: tüm satır (ve dtype) aynen alınır
+        positions = top.positions()
+        if len(positions) < k:
+            # pandas gibi: geçerli değer yetmezse eksik satırlar sırayla eklenir
+            values = data if isinstance(data, pd.Series) else data[by]
+            positions += pd.Series(range(len(data)))[values.isna().to_numpy()].head(k - len(positions)).tolist()
+        return data.iloc[positions]
+    return top.frame()
+
+
+def argmax(data, by=None, chunksize=DEFAULT_CHUNKSIZE):
+    """En büyük değerin index etiketi (idxmax karşılığı); hepsi eksikse None"""
+    best = _select(data, 1, by, None, True, chunksize).best()
+    return best[1] if best else None
+
+
+def argmin(data, by=None, chunksize=DEFAULT_CHUNKSIZE):
+    """En küçük değerin index etiketi (idxmin karşılığı); hepsi eksikse None"""
+    best = _select(data, 1, by, None, False, chunksize).best()
+    return best[1] if best else None
@@ -8,32 +8,152 @@ Kullanım:
 from simplebi import SimpleBI
 data = SimpleBI('restaurant.xlsx')
 data.ask("En karlı kategoriler neler?")
+
+Bellekten büyük CSV (parça parça okuma, sadece toplamlar tutulur):
+data = SimpleBI('pos_export.csv', chunksize=200_000)
+
+Milyonlarca satırlık tablo (sorular DuckDB SQL'ine derlenir, sonuçta 'sql'):
+data = SimpleBI('pos_export.csv', backend='duckdb')
+
+Birden fazla soru (aynı gruplama tek geçişte hesaplanır, sonuçlar soru sırasıyla):
+results = data.ask_many(["En karlı kategoriler neler?", "Kategori başına kaç ürün var?"])
 """
 
+import sys
+import threading
 import pandas as pd
 import numpy as np
 import re
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
+import sgs_loader
+import sgs_dtypes
+import sgs_columns
+import sgs_stream
+import simplebi_sql
+
+# Parçalı modda filtre sonucunda bellekte tutulacak en fazla satır
+FILTER_ROW_LIMIT = 1000
+
+# ask() sonuç önbelleği sınırları
+CACHE_MAX_ENTRIES = 128
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+def _result_bytes(result: Dict) -> int:
+    """Sonucun yaklaşık bellek boyutu (DataFrame/Series için derin ölçüm)"""
+    data = result.get('data')
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(deep=True).sum())
+    if isinstance(data, pd.Series):
+        return int(data.memory_usage(deep=True))
+    return sys.getsizeof(result) + sys.getsizeof(data)
+
+class ResultCache:
+    """LRU sonuç önbelleği - giriş sayısı ve toplam bellek sınırlı"""
+    
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, max_bytes: int = CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key) -> Optional[Dict]:
+        with self._lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key][0]
+    
+    def put(self, key, result: Dict):
+        size = _result_bytes(result)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        with self._lock:
+            if key in self.entries:
+                self.bytes -= self.entries.pop(key)[1]
+            self.entries[key] = (result, size)
+            self.bytes += size
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+    
+    def discard_versions(self, keep_version: int):
+        """Eski veri sürümlerine ait girişleri at (key[0] = sürüm)"""
+        with self._lock:
+            for key in [k for k in self.entries if k[0] != keep_version]:
+                self.bytes -= self.entries.pop(key)[1]
+    
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.bytes = 0
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+            'evictions': self.evictions
+        }
 
 class SimpleBI:
-    def __init__(self, file_path: str = None):
+    def __init__(self, file_path: str = None, chunksize: Optional[int] = None,
+                 cache_entries: int = CACHE_MAX_ENTRIES, cache_bytes: int = CACHE_MAX_BYTES,
+                 backend: str = 'pandas', threads: Optional[int] = None, verbose: bool = True):
         """
         SimpleBI - Tek cümle veri analizi
+        
+        cache_entries/cache_bytes: ask() sonuç önbelleğinin sınırları (0 = kapalı)
+        backend='duckdb': sorular SQL'e derlenip DuckDB'de çalışır (threads: DuckDB
+        thread sayısı); derlenemeyen sorular ve parçalı mod pandas ile yanıtlanır
+        verbose=False: ask() sonuçları yazdırılmaz, sadece döndürülür (servis kullanımı)
         """
         self.df = None
+        self.stream = None
         self.file_path = file_path
+        self.chunksize = chunksize
         self.columns_info = {}
+        self.column_roles = None
+        # Her load() sürümü artırır; önbellek anahtarı (sürüm, niyet)
+        self.data_version = 0
+        self.cache = ResultCache(cache_entries, cache_bytes)
+        
+        if backend == 'duckdb' and not simplebi_sql.DUCKDB_AVAILABLE:
+            print("⚠️ DuckDB kurulu değil (pip install duckdb), pandas kullanılacak")
+            backend = 'pandas'
+        self.backend = backend
+        self.threads = threads
+        self.verbose = verbose
+        self._sql = None
         
         if file_path:
-            self.load(file_path)
+            self.load(file_path, chunksize)
     
-    def load(self, file_path: str):
+    def load(self, file_path: str, chunksize: Optional[int] = None):
         """Veri dosyasını yükle"""
+        self.data_version += 1
+        self.cache.discard_versions(self.data_version)
+        if self._sql is not None:
+            self._sql.close()
+            self._sql = None
         try:
+            if chunksize and file_path.endswith('.csv'):
+                self._load_chunked(file_path, chunksize)
+                return
+            
+            self.stream = None
             if file_path.endswith('.xlsx') or file_path.endswith('.xls'):
-                self.df = pd.read_excel(file_path)
+                self.df = sgs_loader.read_excel(file_path)
             elif file_path.endswith('.csv'):
-                self.df = pd.read_csv(file_path)
+                self.df = sgs_loader.read_csv(file_path)
             else:
                 raise ValueError("Desteklenen formatlar: .xlsx, .xls, .csv")
             
@@ -44,37 +164,63 @@ class SimpleBI:
         except Exception as e:
             print(f"❌ Dosya yükleme hatası: {e}")
     
-    def _analyze_columns(self):
+    def _load_chunked(self, file_path: str, chunksize: int):
+        """CSV'yi parça parça oku - ask() toplamlar üzerinden çalışır"""
+        sample = sgs_stream.read_sample(file_path)
+        self.df = None
+        self.columns_info = {}
+        self._analyze_columns(sample)
+        
+        price_cols = self._columns_of_type('price')
+        metric_cols = self._columns_of_type('metric')
+        category_cols = self._columns_of_type('category')
+        name_cols = self._columns_of_type('name')
+        photo_cols = self.column_roles.flagged('photo')
+        
+        derived = {}
+        if price_cols and metric_cols:
+            price_col, metric_col = price_cols[0], metric_cols[0]
+            derived['karlılık_skoru'] = lambda chunk: chunk[price_col] * chunk[metric_col].fillna(0)
+        
+        self.stream = sgs_stream.ChunkedStats(
+            numeric_cols=sample.select_dtypes(include=[np.number]).columns,
+            group_cols=category_cols,
+            count_cols=photo_cols,
+            id_col=name_cols[0] if name_cols else None,
+            derived=derived
+        )
+        sgs_stream.scan_csv(file_path, self.stream, chunksize=chunksize)
+        
+        self.file_path = file_path
+        self.chunksize = chunksize
+        print(f"✅ {self.stream.rows} satır, {len(sample.columns)} sütun işlendi ({self.stream.chunks} parça)")
+    
+    def _columns(self) -> List[str]:
+        """Yüklü verinin sütunları (parçalı modda örnekten)"""
+        return list(self.columns_info) if self.stream is not None else list(self.df.columns)
+    
+    def _columns_of_type(self, col_type: str) -> List[str]:
+        """Belirli türdeki sütunlar"""
+        # Güncel dönem sütunları önce (sgs_columns sıralaması)
+        return [col for col in self.column_roles.of(col_type) if col in self.columns_info]
+    
+    def _analyze_columns(self, df: Optional[pd.DataFrame] = None):
         """Sütunları analiz et ve türlerini belirle"""
-        for col in self.df.columns:
-            col_lower = col.lower()
-            sample_data = self.df[col].dropna().head(10)
-            
-            # Sütun türünü tahmin et
-            col_type = "unknown"
+        df = self.df if df is None else df
+        self.column_roles = sgs_columns.detect(df)
+        for col in df.columns:
+            sample_data = df[col].dropna().head(10)
             
-            if any(keyword in col_lower for keyword in ['fiyat', 'price', 'tutar', 'amount']):
-                col_type = "price"
-            elif any(keyword in col_lower for keyword in ['görüntülenme', 'view', 'click', 'tıklama']):
-                col_type = "metric"
-            elif any(keyword in col_lower for keyword in ['kategori', 'category', 'grup', 'type']):
-                col_type = "category"
-            elif any(keyword in col_lower for keyword in ['ürün', 'product', 'name', 'ad', 'isim']):
-                col_type = "name"
-            elif any(keyword in col_lower for keyword in ['tarih', 'date', 'time']):
-                col_type = "date"
-            elif self.df[col].dtype in ['int64', 'float64']:
-                col_type = "numeric"
-            else:
-                col_type = "text"
+            # Sütun türü: anahtar kelime rolü, yoksa numeric/text
+            col_type = self.column_roles.role(col)
             
             self.columns_info[col] = {
                 'type': col_type,
-                'dtype': str(self.df[col].dtype),
+                'dtype': str(df[col].dtype),
                 'sample': sample_data.tolist()
             }
     
-    def ask(self, question: str) -> Dict[str, Any]:
+    def ask(self, question: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Doğal dilde soru sor, analiz al
         
@@ -83,18 +229,173 @@ class SimpleBI:
         - "Hangi ürünler en çok görüntüleniyor?"
         - "Fiyatı 200'den yüksek ürünler?"
         - "Fotoğrafı olmayan ürünler kaç tane?"
+        
+        Aynı niyetteki sorular (farklı yazılış olsa da) veri değişmediği
+        sürece önbellekten yanıtlanır; dönen 'data' nesnesi önbellekle
+        paylaşılır, değiştirmeyin.
         """
-        if self.df is None:
+        if self.df is None and self.stream is None:
             return {"error": "Önce veri yükleyin: data.load('dosya.xlsx')"}
         
         # Soruyu analiz et
         analysis_type = self._understand_question(question)
         
-        # Analizi gerçekleştir
-        result = self._execute_analysis(analysis_type, question)
+        # Analizi gerçekleştir (önbellekte yoksa)
+        key = (self.data_version, self._intent_key(analysis_type))
+        result = self.cache.get(key) if use_cache else None
+        if result is None:
+            result = self._execute_analysis(analysis_type, question)
+            if use_cache and 'error' not in result:
+                self.cache.put(key, result)
         
         # Sonucu formatla
-        return self._format_result(result, question)
+        return self._format_result(dict(result), question)
+    
+    def cache_info(self) -> Dict[str, int]:
+        """Önbellek isabet/ıskalama sayıları ve boyutu"""
+        return self.cache.stats()
+    
+    def ask_many(self, questions: List[str], use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Birden fazla soruyu birlikte yanıtla - sonuçlar soru sırasıyla
+        
+        Sorular önce ayrıştırılır; aynı niyet bir kez hesaplanır, aynı
+        sütuna göre gruplanan sıralama/sayma soruları tek groupby geçişinden
+        (toplam, ortalama, adet) yanıtlanır. Parçalı modda ve DuckDB arka
+        ucunda sorular tek tek çalışır.
+        """
+        if self.df is None and self.stream is None:
+            return [self.ask(question) for question in questions]
+        
+        parsed = [self._understand_question(question) for question in questions]
+        keys = [(self.data_version, self._intent_key(analysis)) for analysis in parsed]
+        
+        results = {}
+        pending = {}
+        for question, analysis, key in zip(questions, parsed, keys):
+            if key in results or key in pending:
+                continue
+            cached = self.cache.get(key) if use_cache else None
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending[key] = (analysis, question)
+        
+        computed = {}
+        if self.stream is None and self.backend == 'pandas':
+            computed = self._execute_grouped(pending)
+        for key, (analysis, question) in pending.items():
+            if key not in computed:
+                computed[key] = self._execute_analysis(analysis, question)
+        
+        for key, result in computed.items():
+            if use_cache and 'error' not in result:
+                self.cache.put(key, result)
+        results.update(computed)
+        
+        return [self._format_result(dict(results[key]), question) for question, key in zip(questions, keys)]
+    
+    def _group_spec(self, analysis: Dict) -> Optional[tuple]:
+        """Niyet ortak groupby'dan yanıtlanabiliyorsa ne gerektiği (yoksa None)
+        
+        _ranking_analysis/_count_analysis karar sırasının aynısı
+        """
+        group_by = analysis['group_by']
+        if not group_by:
+            return None
+        
+        if analysis['type'] == 'ranking':
+            price_cols = self._columns_of_type('price')
+            metric_cols = self._columns_of_type('metric')
+            if analysis['aggregation'] == 'profitability' and price_cols and metric_cols:
+                return ('profitability', price_cols[0], metric_cols[0])
+            if analysis['target_columns']:
+                target_col = analysis['target_columns'][0]
+                if target_col != group_by and pd.api.types.is_numeric_dtype(self.df[target_col]):
+                    return ('sum', target_col)
+            return None
+        
+        if analysis['type'] == 'count':
+            if analysis['aggregation'] == 'missing_photo' and self.column_roles.flagged('photo'):
+                return None
+            return ('count',)
+        
+        return None
+    
+    def _execute_grouped(self, pending: Dict[tuple, tuple]) -> Dict[tuple, Dict]:
+        """Aynı group_by'ı paylaşan niyetler için tek groupby geçişi"""
+        by_group = {}
+        for key, (analysis, _) in pending.items():
+            spec = self._group_spec(analysis)
+            if spec is not None:
+                by_group.setdefault(analysis['group_by'], []).append((key, spec))
+        
+        results = {}
+        for group_by, items in by_group.items():
+            try:
+                results.update(self._grouped_results(group_by, items))
+            except Exception as e:
+                for key, _ in items:
+                    results[key] = {"error": f"Analiz hatası: {e}"}
+        return results
+    
+    def _grouped_results(self, group_by: str, items: List[tuple]) -> Dict[tuple, Dict]:
+        """Tek groupby: gereken tüm sütunların toplam/ortalaması + grup adetleri"""
+        sums, means, scores = [], [], []
+        for _, spec in items:
+            if spec[0] == 'profitability':
+                scores.append((spec[1], spec[2]))
+                means.append(spec[1])
+                sums.append(spec[2])
+            elif spec[0] == 'sum':
+                sums.append(spec[1])
+        
+        columns = list(dict.fromkeys(c for c in sums + means if c != group_by))
+        frame = self.df[[group_by] + columns]
+        if scores:
+            price_col, metric_col = scores[0]
+            frame = frame.assign(karlılık_skoru=sgs_dtypes.widen(self.df[price_col]) * self.df[metric_col].fillna(0))
+            sums.append('karlılık_skoru')
+        
+        agg = {}
+        for col in dict.fromkeys(sums + means):
+            agg[col] = [func for func, cols in (('sum', sums), ('mean', means)) if col in cols]
+        
+        # sort=False: gruplar ilk görülme sırasında (value_counts ile aynı eşitlik sırası);
+        # sıralama sonuçları tekli yoldaki gibi grup anahtarı sırasından başlar
+        grouped = frame.groupby(group_by, observed=True, sort=False)
+        stats = grouped.agg(agg) if agg else None
+        sizes = grouped.size()
+        
+        results = {}
+        for key, spec in items:
+            if spec[0] == 'profitability':
+                _, price_col, metric_col = spec
+                result_df = pd.DataFrame({
+                    'karlılık_skoru': stats[('karlılık_skoru', 'sum')],
+                    price_col: stats[(price_col, 'mean')],
+                    metric_col: stats[(metric_col, 'sum')]
+                }).sort_index().round(2).sort_values('karlılık_skoru', ascending=False)
+                results[key] = self._profitability_result(result_df)
+            elif spec[0] == 'sum':
+                result_df = stats[(spec[1], 'sum')].rename(spec[1]).sort_index().sort_values(ascending=False)
+                results[key] = self._ranking_result(result_df)
+            else:
+                counts = sizes.rename('count').sort_values(ascending=False)
+                results[key] = self._count_result(counts)
+        return results
+    
+    @staticmethod
+    def _intent_key(analysis: Dict[str, Any]) -> tuple:
+        """Ayrıştırılmış sorunun normalize anahtarı - sonucu belirleyen tüm alanlar"""
+        return (
+            analysis['type'],
+            analysis['aggregation'],
+            analysis['sort_order'],
+            analysis['group_by'],
+            tuple(analysis['target_columns']),
+            tuple((c['column'], c['op'], c['value']) for c in analysis['filter_conditions'])
+        )
     
     def _understand_question(self, question: str) -> Dict[str, Any]:
         """Soruyu anlayıp analiz türünü belirle"""
@@ -123,6 +424,10 @@ class SimpleBI:
         # Sayma soruları
         elif any(word in q_lower for word in ['kaç', 'adet', 'sayı']):
             analysis['type'] = 'count'
+            
+            # Foto eksik olanları say
+            if 'foto' in q_lower and 'eksik' in q_lower or 'olmayan' in q_lower:
+                analysis['aggregation'] = 'missing_photo'
         
         # Karşılaştırma soruları
         elif any(word in q_lower for word in ['karşılaştır', 'fark', 'vs']):
@@ -131,16 +436,26 @@ class SimpleBI:
         # Filtreleme soruları
         elif any(word in q_lower for word in ['hangi', 'which', 'liste']):
             analysis['type'] = 'filter'
+            
+            # Fiyat filtreleme
+            price_match = re.search(r'(\d+)', q_lower)
+            price_cols = self._columns_of_type('price')
+            if price_match and price_cols and any(word in q_lower for word in ['fiyat', 'price']):
+                above = 'yüksek' in q_lower or '>' in q_lower or 'üstü' in q_lower
+                analysis['filter_conditions'].append({
+                    'column': price_cols[0],
+                    'op': '>' if above else '<',
+                    'value': int(price_match.group(1))
+                })
         
         # Kategori belirleme
         if 'kategori' in q_lower:
-            cat_cols = [col for col, info in self.columns_info.items() 
-                       if info['type'] == 'category']
+            cat_cols = self._columns_of_type('category')
             if cat_cols:
                 analysis['group_by'] = cat_cols[0]
         
         # Hedef sütunları belirle
-        for col in self.df.columns:
+        for col in self._columns():
             if col.lower() in q_lower:
                 analysis['target_columns'].append(col)
         
@@ -151,6 +466,11 @@ class SimpleBI:
         result = {}
         
         try:
+            if self.backend == 'duckdb' and self.df is not None:
+                result = self._execute_sql(analysis_type)
+                if result is not None:
+                    return result
+            
             if analysis_type['type'] == 'ranking':
                 result = self._ranking_analysis(analysis_type, question)
             elif analysis_type['type'] == 'count':
@@ -167,25 +487,45 @@ class SimpleBI:
         
         return result
     
+    def _execute_sql(self, analysis: Dict) -> Optional[Dict]:
+        """Niyeti DuckDB SQL'i olarak çalıştır (derlenemezse None)"""
+        if self._sql is None:
+            self._sql = simplebi_sql.DuckDBBackend(self.df, threads=self.threads)
+        columns = {
+            'price': self._columns_of_type('price'),
+            'metric': self._columns_of_type('metric'),
+            'photo': self.column_roles.flagged('photo')
+        }
+        return self._sql.execute(analysis, columns)
+    
     def _ranking_analysis(self, analysis: Dict, question: str) -> Dict:
         """Sıralama analizi (en çok, en az, vb.)"""
-        q_lower = question.lower()
-        
-        if 'karlı' in q_lower and analysis['group_by']:
+        if analysis['aggregation'] == 'profitability' and analysis['group_by']:
             # Karlılık analizi = fiyat * görüntülenme
-            price_cols = [col for col, info in self.columns_info.items() if info['type'] == 'price']
-            metric_cols = [col for col, info in self.columns_info.items() if info['type'] == 'metric']
+            price_cols = self._columns_of_type('price')
+            metric_cols = self._columns_of_type('metric')
             
             if price_cols and metric_cols:
                 price_col = price_cols[0]
                 metric_col = metric_cols[0]
                 
-                # Karlılık skoru hesapla
-                df_copy = self.df.copy()
-                df_copy['karlılık_skoru'] = df_copy[price_col] * df_copy[metric_col].fillna(0)
+                if self.stream is not None:
+                    # Parçalı mod: grup toplamlarından
+                    stats = self.stream.group_stats(analysis['group_by'])
+                    result_df = pd.DataFrame({
+                        'karlılık_skoru': stats[('karlılık_skoru', 'sum')],
+                        price_col: stats[(price_col, 'mean')],
+                        metric_col: stats[(metric_col, 'sum')]
+                    }).round(2).sort_values('karlılık_skoru', ascending=False)
+                    
+                    return self._profitability_result(result_df)
+                
+                # Karlılık skoru hesapla - sadece gereken sütunlar (tüm tablo kopyalanmaz)
+                scored = self.df[[analysis['group_by'], price_col, metric_col]].assign(
+                    karlılık_skoru=sgs_dtypes.widen(self.df[price_col]) * self.df[metric_col].fillna(0))
                 
                 # Kategoriye göre grupla
-                result_df = df_copy.groupby(analysis['group_by']).agg({
+                result_df = scored.groupby(analysis['group_by'], observed=True).agg({
                     'karlılık_skoru': 'sum',
                     price_col: 'mean',
                     metric_col: 'sum'
@@ -193,36 +533,63 @@ class SimpleBI:
                 
                 result_df = result_df.sort_values('karlılık_skoru', ascending=False)
                 
-                return {
-                    'data': result_df,
-                    'insight': f"En karlı kategori: {result_df.index[0]} ({result_df.iloc[0]['karlılık_skoru']} puan)",
-                    'type': 'ranking_profitability'
-                }
+                return self._profitability_result(result_df)
         
         # Genel sıralama
         if analysis['group_by'] and analysis['target_columns']:
             target_col = analysis['target_columns'][0]
-            result_df = self.df.groupby(analysis['group_by'])[target_col].sum().sort_values(ascending=False)
+            if self.stream is not None:
+                if target_col not in self.stream.numeric_cols:
+                    return {"error": "Sıralama için uygun sütun bulunamadı"}
+                stats = self.stream.group_stats(analysis['group_by'])
+                result_df = stats[(target_col, 'sum')].rename(target_col).sort_values(ascending=False)
+            else:
+                # Metin/kategori sütunu toplanamaz (parçalı modla aynı davranış)
+                if not pd.api.types.is_numeric_dtype(self.df[target_col]):
+                    return {"error": "Sıralama için uygun sütun bulunamadı"}
+                result_df = self.df.groupby(analysis['group_by'], observed=True)[target_col].sum().sort_values(ascending=False)
             
-            return {
-                'data': result_df,
-                'insight': f"En yüksek: {result_df.index[0]} ({result_df.iloc[0]})",
-                'type': 'ranking_simple'
-            }
+            return self._ranking_result(result_df)
         
         return {"error": "Sıralama için uygun sütun bulunamadı"}
     
+    @staticmethod
+    def _profitability_result(result_df: pd.DataFrame) -> Dict:
+        return {
+            'data': result_df,
+            'insight': f"En karlı kategori: {result_df.index[0]} ({result_df.iloc[0]['karlılık_skoru']} puan)",
+            'type': 'ranking_profitability'
+        }
+    
+    @staticmethod
+    def _ranking_result(result_df: pd.Series) -> Dict:
+        return {
+            'data': result_df,
+            'insight': f"En yüksek: {result_df.index[0]} ({result_df.iloc[0]})",
+            'type': 'ranking_simple'
+        }
+    
+    @staticmethod
+    def _count_result(counts: pd.Series) -> Dict:
+        return {
+            'data': counts,
+            'insight': f"En çok: {counts.index[0]} ({counts.iloc[0]} adet)",
+            'type': 'count_general'
+        }
+    
     def _count_analysis(self, analysis: Dict, question: str) -> Dict:
         """Sayma analizi"""
-        q_lower = question.lower()
-        
         # Foto eksik olanları say
-        if 'foto' in q_lower and 'eksik' in q_lower or 'olmayan' in q_lower:
-            photo_cols = [col for col in self.df.columns if 'foto' in col.lower()]
+        if analysis['aggregation'] == 'missing_photo':
+            photo_cols = self.column_roles.flagged('photo')
             if photo_cols:
                 photo_col = photo_cols[0]
-                missing_count = (self.df[photo_col] == 'Hayır').sum()
-                total_count = len(self.df)
+                if self.stream is not None:
+                    missing_count = self.stream.counts[photo_col].get('Hayır', 0)
+                    total_count = self.stream.rows
+                else:
+                    missing_count = (self.df[photo_col] == 'Hayır').sum()
+                    total_count = len(self.df)
                 
                 return {
                     'data': {'eksik': missing_count, 'toplam': total_count},
@@ -232,47 +599,73 @@ class SimpleBI:
         
         # Genel sayma
         if analysis['group_by']:
-            counts = self.df[analysis['group_by']].value_counts()
-            return {
-                'data': counts,
-                'insight': f"En çok: {counts.index[0]} ({counts.iloc[0]} adet)",
-                'type': 'count_general'
-            }
+            if self.stream is not None:
+                counts = self.stream.value_counts(analysis['group_by'])
+            else:
+                counts = self.df[analysis['group_by']].value_counts()
+            return self._count_result(counts)
         
-        return {"data": {"toplam": len(self.df)}, "insight": f"Toplam {len(self.df)} kayıt", "type": "count_total"}
+        total = self.stream.rows if self.stream is not None else len(self.df)
+        return {"data": {"toplam": total}, "insight": f"Toplam {total} kayıt", "type": "count_total"}
     
     def _filter_analysis(self, analysis: Dict, question: str) -> Dict:
         """Filtreleme analizi"""
-        q_lower = question.lower()
-        
-        # Fiyat filtreleme
-        price_match = re.search(r'(\d+)', q_lower)
-        if price_match and any(word in q_lower for word in ['fiyat', 'price']):
-            price_threshold = int(price_match.group(1))
-            price_cols = [col for col, info in self.columns_info.items() if info['type'] == 'price']
+        # Fiyat filtreleme (_understand_question'da ayrıştırıldı)
+        if analysis['filter_conditions']:
+            condition = analysis['filter_conditions'][0]
+            price_col, price_threshold = condition['column'], condition['value']
+            above = condition['op'] == '>'
             
-            if price_cols:
-                price_col = price_cols[0]
-                
-                if 'yüksek' in q_lower or '>' in q_lower or 'üstü' in q_lower:
-                    filtered_df = self.df[self.df[price_col] > price_threshold]
-                else:
-                    filtered_df = self.df[self.df[price_col] < price_threshold]
-                
-                return {
-                    'data': filtered_df,
-                    'insight': f"{len(filtered_df)} ürün bulundu",
-                    'type': 'filter_price'
-                }
+            if self.stream is not None:
+                # Parçalı mod: dosya yeniden taranır, ilk FILTER_ROW_LIMIT satır tutulur
+                return self._filter_chunked(price_col, price_threshold, above)
+            
+            if above:
+                filtered_df = self.df[self.df[price_col] > price_threshold]
+            else:
+                filtered_df = self.df[self.df[price_col] < price_threshold]
+            
+            return {
+                'data': filtered_df,
+                'insight': f"{len(filtered_df)} ürün bulundu",
+                'type': 'filter_price'
+            }
         
         return {"error": "Filtre kriteri anlaşılamadı"}
     
+    def _filter_chunked(self, price_col: str, threshold: int, above: bool) -> Dict:
+        """Filtreyi dosya üzerinde parça parça uygula"""
+        total = 0
+        kept = []
+        kept_rows = 0
+        for chunk in sgs_stream.iter_csv(self.file_path, chunksize=self.chunksize):
+            prices = pd.to_numeric(chunk[price_col], errors='coerce')
+            matched = chunk[prices > threshold] if above else chunk[prices < threshold]
+            total += len(matched)
+            if kept_rows < FILTER_ROW_LIMIT and len(matched) > 0:
+                kept.append(matched.head(FILTER_ROW_LIMIT - kept_rows))
+                kept_rows += len(kept[-1])
+        
+        filtered_df = pd.concat(kept) if kept else pd.DataFrame(columns=self._columns())
+        suffix = f" (ilk {kept_rows} satır gösteriliyor)" if total > kept_rows else ""
+        return {
+            'data': filtered_df,
+            'insight': f"{total} ürün bulundu{suffix}",
+            'type': 'filter_price'
+        }
+    
     def _comparison_analysis(self, analysis: Dict, question: str) -> Dict:
         """Karşılaştırma analizi"""
         return {"message": "Karşılaştırma analizi geliştirilmekte..."}
     
     def _general_analysis(self, question: str) -> Dict:
         """Genel analiz"""
+        if self.stream is not None:
+            return {
+                'data': self.stream.describe(),
+                'insight': f"Genel istatistikler - {self.stream.rows} kayıt",
+                'type': 'general'
+            }
         return {
             'data': self.df.describe(),
             'insight': f"Genel istatistikler - {len(self.df)} kayıt",
@@ -281,6 +674,9 @@ class SimpleBI:
     
     def _format_result(self, result: Dict, question: str) -> Dict:
         """Sonucu kullanıcı dostu formatta göster"""
+        if not self.verbose:
+            return result
+        
         if 'error' in result:
             print(f"❌ {result['error']}")
             return result
@@ -307,7 +703,7 @@ class SimpleBI:
         return result
 
 # Kullanım kolaylığı için kısa fonksiyon
-def analyze(file_path: str):
+def analyze(file_path: str, chunksize: Optional[int] = None):
     """
     Hızlı başlangıç
     
@@ -316,7 +712,7 @@ def analyze(file_path: str):
     data = analyze('restaurant.xlsx')
     data.ask("En karlı kategoriler neler?")
     """
-    return SimpleBI(file_path)
+    return SimpleBI(file_path, chunksize)
 
 # Test
 if __name__ == "__main__":
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SimpleBI SQL - Soru niyetini DuckDB SQL'ine derleyen çalıştırma arka ucu
+_understand_question çıktısı tek bir SELECT'e çevrilir; yüklü DataFrame
+DuckDB'ye Arrow tablosu olarak (kopyasız) kaydedilir, sorgu çok çekirdekli
+vektörel motorda çalışır. Üretilen SQL sonuçta 'sql' anahtarıyla döner.
+
+Kullanım:
+from simplebi import SimpleBI
+data = SimpleBI('pos_export.csv', backend='duckdb')
+result = data.ask("En karlı kategoriler neler?")
+print(result['sql'])
+"""
+
+import os
+import pandas as pd
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+TABLE = 'data'
+
+
+def _q(name):
+    """SQL tanımlayıcısını tırnakla"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _literal(value):
+    """Metin sabiti"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class DuckDBBackend:
+    """Tek DataFrame üzerinde SimpleBI niyetlerini SQL ile çalıştır"""
+
+    def __init__(self, df, threads=None):
+        if not DUCKDB_AVAILABLE:
+            raise ImportError("DuckDB arka ucu için: pip install duckdb")
+        self.df = df
+        self.conn = duckdb.connect()
+        self.threads = threads or os.cpu_count() or 1
+        self.conn.execute(f"SET threads TO {int(self.threads)}")
+
+        # Arrow tablosu: sayısal sütunlar ve Arrow tabanlı metin kopyalanmadan taranır
+        if pa is not None:
+            self.conn.register(TABLE, pa.Table.from_pandas(df, preserve_index=False))
+        else:
+            self.conn.register(TABLE, df)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def _sum(self, col):
+        """SUM - tam sayı sütunlarında pandas gibi int64 döner (DuckDB HUGEINT yerine)"""
+        if pd.api.types.is_integer_dtype(self.df[col]):
+            return f"CAST(SUM({_q(col)}) AS BIGINT)"
+        return f"SUM({_q(col)})"
+
+    def compile(self, analysis, columns):
+        """Niyet → (sql, sonuç türü); derlenemeyen niyetler için (None, None)
+
+        columns: {'price': [...], 'metric': [...], 'photo': [...]} - SimpleBI'ın
+        pandas yoluyla aynı sütun seçimi
+        """
+        group_by = analysis['group_by']
+        kind = analysis['type']
+
+        if kind == 'ranking':
+            if analysis['aggregation'] == 'profitability' and group_by and columns['price'] and columns['metric']:
+                price_col, metric_col = columns['price'][0], columns['metric'][0]
+                price, metric, g = _q(price_col), _q(metric_col), _q(group_by)
+                integer = [pd.api.types.is_integer_dtype(self.df[col]) for col in (price_col, metric_col)]
+                # Çarpım int64'te (sgs_dtypes.widen karşılığı), toplam pandas gibi int64
+                score = f"SUM({'CAST(' + price + ' AS BIGINT)' if integer[0] else price} * COALESCE({metric}, 0))"
+                if all(integer):
+                    score = f"CAST({score} AS BIGINT)"
+                sql = (f"SELECT {g}, ROUND({score}, 2) AS \"karlılık_skoru\", "
+                       f"ROUND(AVG({price}), 2) AS {price}, ROUND({self._sum(metric_col)}, 2) AS {metric} "
+                       f"FROM {TABLE} WHERE {g} IS NOT NULL GROUP BY {g} "
+                       f"ORDER BY \"karlılık_skoru\" DESC, {g}")
+                return sql, 'ranking_profitability'
+
+            if group_by and analysis['target_columns']:
+                target = analysis['target_columns'][0]
+                if not pd.api.types.is_numeric_dtype(self.df[target]):
+                    return None, None
+                g = _q(group_by)
+                sql = (f"SELECT {g}, {self._sum(target)} AS {_q(target)} FROM {TABLE} "
+                       f"WHERE {g} IS NOT NULL GROUP BY {g} ORDER BY 2 DESC, {g}")
+                return sql, 'ranking_simple'
+
+        elif kind == 'count':
+            if analysis['aggregation'] == 'missing_photo' and columns['photo']:
+                photo = _q(columns['photo'][0])
+                sql = (f"SELECT COUNT(*) FILTER (WHERE {photo} = {_literal('Hayır')}) AS eksik, "
+                       f"COUNT(*) AS toplam FROM {TABLE}")
+                return sql, 'count_missing'
+            if group_by:
+                g = _q(group_by)
+                sql = (f"SELECT {g}, COUNT(*) AS count FROM {TABLE} WHERE {g} IS NOT NULL "
+                       f"GROUP BY {g} ORDER BY count DESC, {g}")
+                return sql, 'count_general'
+            return f"SELECT COUNT(*) AS toplam FROM {TABLE}", 'count_total'
+
+        elif kind == 'filter' and analysis['filter_conditions']:
+            condition = analysis['filter_conditions'][0]
+            op = '>' if condition['op'] == '>' else '<'
+            sql = f"SELECT * FROM {TABLE} WHERE {_q(condition['column'])} {op} {int(condition['value'])}"
+            return sql, 'filter_price'
+
+        return None, None
+
+    def execute(self, analysis, columns):
+        """Niyeti SQL ile çalıştır - derlenemezse None (pandas yoluna düşülür)"""
+        sql, kind = self.compile(analysis, columns)
+        if sql is None:
+            return None
+        df = self.conn.execute(sql).fetchdf()
+
+        if kind == 'ranking_profitability':
+            data = df.set_index(df.columns[0])
+            insight = f"En karlı kategori: {data.index[0]} ({data.iloc[0]['karlılık_skoru']} puan)"
+        elif kind == 'ranking_simple':
+            data = df.set_index(df.columns[0])[df.columns[1]]
+            insight = f"En yüksek: {data.index[0]} ({data.iloc[0]})"
+        elif kind == 'count_missing':
+            missing_count, total_count = int(df.iloc[0]['eksik']), int(df.iloc[0]['toplam'])
+            data = {'eksik': missing_count, 'toplam': total_count}
+            insight = f"{missing_count}/{total_count} ürünün fotoğrafı eksik (%{missing_count/total_count*100:.1f})"
+        elif kind == 'count_general':
+            data = df.set_index(df.columns[0])['count']
+            insight = f"En çok: {data.index[0]} ({data.iloc[0]} adet)"
+        elif kind == 'count_total':
+            total = int(df.iloc[0]['toplam'])
+            data = {'toplam': total}
+            insight = f"Toplam {total} kayıt"
+        else:
+            data = df
+            insight = f"{len(df)} ürün bulundu"
+
+        return {'data': data, 'insight': insight, 'type': kind, 'sql': sql}
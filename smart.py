@@ -1,15 +1,20 @@
 #!/usr/bin/env python3
-"""SGS Smart - 20+ Bulgu"""
-import pandas as pd
-import sqlite3
+"""SGS Smart - 20+ Bulgu
 
-def analyze():
+python smart.py [--approx]  # popülerlik eşiği KLL taslağıyla (sgs_sketch)
+"""
+import sys
+import sgs_branches
+import sgs_mirror
+import sgs_sketch
+
+def analyze(sketch=None):
+    """sketch: 'exact' | 'approx' quantile hesabı (varsayılan: SGS_SKETCH)"""
     print("🧠 SGS SMART")
     insights = []
     
     # Veritabanı analizi
-    conn = sqlite3.connect('sales.db')
-    df = pd.read_sql("SELECT * FROM tuzla_loglar", conn)
+    df = sgs_mirror.read_table('sales.db', 'tuzla_loglar')
     
     prev_col = 'BİR ÖNCEKİ DÖNEM GÖRÜNTÜLEME (26.08 - 01.09)'
     curr_col = 'GÜNCEL DÖNEM GÖRÜNTÜLEME (02.09-08.09)'
@@ -32,7 +37,7 @@ def analyze():
     insights.append(f"👑 En popüler: {top.iloc[0]['Ürün Adı']} ({top.iloc[0][curr_col]:.0f} görüntülenme)")
     
     # Kategori performansı
-    cat_perf = df.groupby('Kategori')[curr_col].mean().round(1)
+    cat_perf = df.groupby('Kategori', observed=True)[curr_col].mean().round(1)
     best_cat = cat_perf.idxmax()
     worst_cat = cat_perf.idxmin()
     insights.append(f"🏆 En iyi kategori: {best_cat} ({cat_perf[best_cat]:.0f})")
@@ -48,7 +53,8 @@ def analyze():
     insights.append(f"📷 {photo_missing} ürünün fotoğrafı eksik")
     
     # Popüler ama foto eksik
-    missing_popular = df[(df['Foto Durumu'] == 'Hayır') & (df[curr_col] > df[curr_col].quantile(0.7))]
+    popular = sgs_sketch.column_quantile(df[curr_col], 0.7, mode=sketch)
+    missing_popular = df[(df['Foto Durumu'] == 'Hayır') & (df[curr_col] > popular)]
     if len(missing_popular) > 0:
         insights.append(f"🔥 FIRSAT: {len(missing_popular)} popüler ürünün fotoğrafı eksik!")
     
@@ -65,14 +71,10 @@ def analyze():
     sira_degisen = df[df['Sıra'] != df['Güncel Sıra']]
     insights.append(f"🔄 {len(sira_degisen)} ürünün sırası değişti")
     
-    # Koşuyolu karşılaştırması
-    kosuyolu = pd.read_sql("SELECT * FROM kosuyolu_loglar", conn)
-    tuzla_avg = df['Fiyat'].mean()
-    kosuyolu_avg = kosuyolu['Fiyat'].mean()
-    fark = ((tuzla_avg - kosuyolu_avg) / kosuyolu_avg) * 100
-    insights.append(f"📊 Tuzla, Koşuyolu'ndan %{fark:.0f} fark (ort. {tuzla_avg:.0f}₺ vs {kosuyolu_avg:.0f}₺)")
-    
-    conn.close()
+    # Şube karşılaştırması - diğer tüm *_loglar tabloları paralel özetlenir
+    branches = sgs_branches.analyze_branches(
+        'sales.db', main='tuzla', main_summary=sgs_branches.frame_summary(df, 'tuzla_loglar'))
+    insights.extend(sgs_branches.comparison_insights(branches['comparison']))
     
     # Sonuçları göster
     print(f"\n💡 {len(insights)} BULGU:")
@@ -82,4 +84,4 @@ def analyze():
     return insights
 
 if __name__ == "__main__":
-    analyze()
+    analyze(sketch='approx' if '--approx' in sys.argv else None)
@@ -2,21 +2,32 @@
 """
 SGS SQL - Kısa ve öz
 Kullanım: python sql.py dosya.xlsx "SELECT * FROM data"
+
+Çok sorgu için oturum (dosya bir kez yüklenir):
+from sgs_sql import SQLSession
+s = SQLSession(); s.load('dosya.xlsx')
+query('dosya.xlsx', "SELECT ...", session=s)
 """
 
 import sys
-import pandas as pd
 import duckdb
+import sgs_loader
 
-def query(file_path, sql):
-    # Veriyi yükle
-    df = pd.read_excel(file_path)
-    print(f"📊 {len(df)} satır yüklendi")
-    
-    # SQL çalıştır
-    conn = duckdb.connect()
-    conn.register('data', df)
-    result = conn.execute(sql).fetchdf()
+def query(file_path, sql, session=None):
+    if session is not None:
+        # Açık oturum: dosya yüklü değilse bir kez yükle
+        if 'data' not in session.tables:
+            session.load(file_path)
+        result = session.query(sql)
+    else:
+        # Veriyi yükle
+        df = sgs_loader.read_excel(file_path)
+        print(f"📊 {len(df)} satır yüklendi")
+        
+        # SQL çalıştır
+        conn = duckdb.connect()
+        conn.register('data', df)
+        result = conn.execute(sql).fetchdf()
     
     print(f"✅ {len(result)} sonuç:")
     print(result.head(10))